@@ -0,0 +1,9 @@
+"""벤치마크 모듈."""
+
+from .synthetic import ClipProfile, SyntheticClips, DEFAULT_PROFILES, QUICK_PROFILES
+from .suite import BenchmarkSuite, BenchmarkBaseline
+
+__all__ = [
+    'ClipProfile', 'SyntheticClips', 'DEFAULT_PROFILES', 'QUICK_PROFILES',
+    'BenchmarkSuite', 'BenchmarkBaseline',
+]
@@ -0,0 +1,231 @@
+"""시크/렌더링/내보내기 성능 벤치마크 및 기준값 비교 모듈."""
+
+import json
+import os
+import platform
+import random
+import statistics
+import tempfile
+import time
+import types
+
+import cv2
+
+from ..processors.video_processor import VideoProcessor
+from ..processors.export_engine import ExportEngine, ExportSpec
+from ..processors.decoders import DecoderSelector, available_decoders
+from .synthetic import SyntheticClips
+
+
+class BenchmarkSuite:
+    """합성 클립으로 주요 경로의 소요 시간을 측정하는 클래스.
+
+    모든 지표는 '작을수록 좋은' 값(ms/프레임, 출력 1초당 소요 초)으로 기록한다.
+    """
+
+    RANDOM_SEEKS = 40
+    SEQUENTIAL_FRAMES = 120
+    TRANSFORM_FRAMES = 60
+    PREVIEW_SIZE = (800, 450)
+
+    # 내보내기 모드: 이름 -> ExportSpec 생성 함수(원본 fps, 길이)
+    EXPORT_MODES = {
+        'reencode': lambda fps, dur: ExportSpec(fps=fps),
+        'trim': lambda fps, dur: ExportSpec(fps=fps, start_time=dur * 0.25, end_time=dur * 0.75),
+        'rotate90': lambda fps, dur: ExportSpec(fps=fps, rotation_angle=90),
+        'fps_half': lambda fps, dur: ExportSpec(fps=fps / 2.0),
+    }
+
+    def __init__(self, work_dir, profiles, repeats=3, seed=1234, include_export=True, log=print):
+        """초기화.
+
+        Args:
+            work_dir: 합성 클립과 임시 출력이 저장될 디렉터리
+            profiles: ClipProfile 목록
+            repeats: 반복 측정 횟수 (중앙값 사용)
+            seed: 랜덤 시크 위치 시드
+            include_export: 내보내기 측정 포함 여부
+            log: 진행 메시지 출력 함수
+        """
+        self.work_dir = work_dir
+        self.profiles = profiles
+        self.repeats = max(1, int(repeats))
+        self.seed = seed
+        self.include_export = include_export
+        self.log = log
+
+    @staticmethod
+    def _open_source(path, backend='opencv'):
+        """VideoProcessor.read_frame에 넘길 수 있는 headless 소스 객체 (디코더 백엔드 고정)."""
+        cap = cv2.VideoCapture(path)
+        source = types.SimpleNamespace(
+            video_path=path,
+            total_frames=int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+            video_fps=cap.get(cv2.CAP_PROP_FPS) or 30.0,
+            decoder_choice={role: backend for role in DecoderSelector.ROLES},
+        )
+        cap.release()
+        return source
+
+    def _median_of(self, func):
+        """func를 repeats번 실행한 결과의 중앙값."""
+        return statistics.median(func() for _ in range(self.repeats))
+
+    def _bench_random_seek(self, path, backend='opencv'):
+        """무작위 위치 시크 1회당 평균 ms."""
+        source = self._open_source(path, backend)
+        rng = random.Random(self.seed)
+        frames = [rng.randrange(source.total_frames) for _ in range(self.RANDOM_SEEKS)]
+
+        def run():
+            VideoProcessor.release_capture(source)
+            start = time.perf_counter()
+            for n in frames:
+                VideoProcessor.read_frame(source, n)
+            return (time.perf_counter() - start) * 1000.0 / len(frames)
+
+        try:
+            return self._median_of(run)
+        finally:
+            VideoProcessor.release_capture(source)
+
+    def _bench_sequential_seek(self, path, backend='opencv'):
+        """연속 프레임(재생/휠 이동) 읽기 1회당 평균 ms."""
+        source = self._open_source(path, backend)
+        count = min(self.SEQUENTIAL_FRAMES, source.total_frames)
+
+        def run():
+            VideoProcessor.release_capture(source)
+            start = time.perf_counter()
+            for n in range(count):
+                VideoProcessor.read_frame(source, n)
+            return (time.perf_counter() - start) * 1000.0 / count
+
+        try:
+            return self._median_of(run)
+        finally:
+            VideoProcessor.release_capture(source)
+
+    def _sample_frames(self, path):
+        """변환 벤치마크용 디코딩된 프레임 목록."""
+        cap = cv2.VideoCapture(path)
+        frames = []
+        while len(frames) < self.TRANSFORM_FRAMES:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(frame)
+        cap.release()
+        return frames
+
+    def _bench_transform(self, frames, func):
+        """프레임당 변환 평균 ms."""
+        def run():
+            start = time.perf_counter()
+            for frame in frames:
+                func(frame)
+            return (time.perf_counter() - start) * 1000.0 / len(frames)
+        return self._median_of(run)
+
+    def _bench_export(self, path, mode):
+        """출력 1초당 내보내기 소요 시간(초)."""
+        source = self._open_source(path)
+        duration = source.total_frames / source.video_fps
+        spec = self.EXPORT_MODES[mode](source.video_fps, duration)
+        out_duration = (spec.end_time if spec.end_time is not None else duration) - spec.start_time
+
+        def run():
+            with tempfile.TemporaryDirectory(dir=self.work_dir) as tmp:
+                start = time.perf_counter()
+                ExportEngine.export(path, os.path.join(tmp, 'out.mp4'), spec, logger=None)
+                return (time.perf_counter() - start) / max(out_duration, 1e-6)
+
+        return self._median_of(run)
+
+    def run(self):
+        """전체 벤치마크 실행.
+
+        Returns:
+            {'meta': {...}, 'results': {'<clip>/<case>': value}}
+        """
+        clips_dir = os.path.join(self.work_dir, 'clips')
+        results = {}
+        pw, ph = self.PREVIEW_SIZE
+        for profile in self.profiles:
+            self.log(f"[clip] {profile.name}")
+            path = SyntheticClips.generate(profile, clips_dir)
+            prefix = profile.name
+
+            results[f"{prefix}/seek_random_ms"] = self._bench_random_seek(path)
+            results[f"{prefix}/seek_sequential_ms"] = self._bench_sequential_seek(path)
+            # OpenCV 외 디코더 백엔드
+            for backend in available_decoders():
+                if backend == 'opencv':
+                    continue
+                results[f"{prefix}/seek_random_{backend}_ms"] = self._bench_random_seek(path, backend)
+                results[f"{prefix}/seek_sequential_{backend}_ms"] = self._bench_sequential_seek(path, backend)
+
+            frames = self._sample_frames(path)
+            if frames:
+                for angle in (90, 180):
+                    results[f"{prefix}/rotate{angle}_ms"] = self._bench_transform(
+                        frames, lambda f, a=angle: VideoProcessor.rotate_frame_keep_full(f, a))
+                results[f"{prefix}/letterbox_ms"] = self._bench_transform(
+                    frames, lambda f: VideoProcessor.letterbox_bgr(f, pw, ph))
+
+            if self.include_export:
+                for mode in self.EXPORT_MODES:
+                    results[f"{prefix}/export_{mode}_s_per_s"] = self._bench_export(path, mode)
+
+            for key in sorted(k for k in results if k.startswith(prefix + '/')):
+                self.log(f"  {key.split('/', 1)[1]:<28} {results[key]:10.3f}")
+
+        return {
+            'meta': {
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'platform': platform.platform(),
+                'python': platform.python_version(),
+                'opencv': cv2.__version__,
+                'cpu_count': os.cpu_count(),
+                'repeats': self.repeats,
+                'seed': self.seed,
+            },
+            'results': results,
+        }
+
+
+class BenchmarkBaseline:
+    """벤치마크 기준값 저장/비교 클래스."""
+
+    @staticmethod
+    def load(path):
+        """기준값 파일 읽기 (없으면 None)."""
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def save(path, report):
+        """벤치마크 결과를 기준값으로 저장."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def compare(baseline, report, threshold):
+        """기준값 대비 threshold(비율) 이상 느려진 항목 목록.
+
+        Returns:
+            [(key, baseline_value, current_value, ratio), ...]
+        """
+        regressions = []
+        base_results = baseline.get('results', {})
+        for key, value in report['results'].items():
+            base = base_results.get(key)
+            if base is None or base <= 0:
+                continue
+            ratio = value / base
+            if ratio > 1.0 + threshold:
+                regressions.append((key, base, value, ratio))
+        return regressions
@@ -0,0 +1,101 @@
+"""벤치마크용 합성 테스트 비디오 생성 모듈."""
+
+import os
+from dataclasses import dataclass
+
+from ..processors.ffmpeg_utils import FFmpegUtils
+
+
+@dataclass(frozen=True)
+class ClipProfile:
+    """합성 클립 생성 조건.
+
+    Attributes:
+        width, height: 해상도
+        fps: 프레임 레이트 (VFR이면 평균 기준 원본 레이트)
+        duration: 길이(초)
+        gop: 키프레임 간격(프레임)
+        codec: ffmpeg 비디오 인코더 이름
+        vfr: 가변 프레임 레이트 여부
+        audio: 오디오 트랙 포함 여부
+    """
+
+    width: int
+    height: int
+    fps: int = 30
+    duration: float = 6.0
+    gop: int = 30
+    codec: str = 'libx264'
+    vfr: bool = False
+    audio: bool = False
+
+    @property
+    def name(self):
+        """결과/파일 이름에 쓰이는 식별자."""
+        parts = [f"{self.width}x{self.height}", f"{self.fps}fps", f"gop{self.gop}", self.codec]
+        if self.vfr:
+            parts.append("vfr")
+        if self.audio:
+            parts.append("audio")
+        return "_".join(parts)
+
+
+# 기본 프로파일: 해상도, GOP 길이, 코덱, VFR, 오디오 유무를 각각 바꿔가며 측정
+DEFAULT_PROFILES = (
+    ClipProfile(640, 360),
+    ClipProfile(1280, 720, gop=120),
+    ClipProfile(1920, 1080, gop=60, audio=True),
+    ClipProfile(1280, 720, fps=60, gop=250),
+    ClipProfile(1280, 720, codec='mpeg4'),
+    ClipProfile(1280, 720, vfr=True, audio=True),
+)
+
+# 빠른 회귀 확인용
+QUICK_PROFILES = (
+    ClipProfile(640, 360, duration=3.0),
+    ClipProfile(1280, 720, duration=3.0, gop=120, audio=True),
+)
+
+
+class SyntheticClips:
+    """ffmpeg lavfi 소스(testsrc2/sine)로 결정적인 테스트 클립을 만드는 클래스."""
+
+    @staticmethod
+    def path_for(profile, out_dir):
+        """프로파일에 해당하는 클립 파일 경로."""
+        return os.path.join(out_dir, f"{profile.name}_{profile.duration:g}s.mp4")
+
+    @staticmethod
+    def generate(profile, out_dir, overwrite=False):
+        """합성 클립 생성 (이미 있으면 재사용).
+
+        Returns:
+            생성된 클립 경로
+        """
+        os.makedirs(out_dir, exist_ok=True)
+        path = SyntheticClips.path_for(profile, out_dir)
+        if os.path.exists(path) and not overwrite:
+            return path
+
+        args = [
+            '-y', '-loglevel', 'error',
+            '-f', 'lavfi',
+            '-i', f"testsrc2=size={profile.width}x{profile.height}:rate={profile.fps}:duration={profile.duration}",
+        ]
+        if profile.audio:
+            args += ['-f', 'lavfi', '-i', f"sine=frequency=440:sample_rate=48000:duration={profile.duration}"]
+
+        if profile.vfr:
+            # 5프레임 중 1프레임을 버려 프레임 간격을 불규칙하게 만듦
+            args += ['-vf', "select='not(eq(mod(n\\,5)\\,3))'", '-fps_mode', 'vfr']
+
+        args += ['-c:v', profile.codec, '-g', str(profile.gop), '-pix_fmt', 'yuv420p']
+        if profile.codec == 'mpeg4':
+            args += ['-q:v', '4']
+        if profile.audio:
+            args += ['-c:a', 'aac', '-shortest']
+
+        tmp_path = path + '.part.mp4'
+        FFmpegUtils.run(args + [tmp_path])
+        os.replace(tmp_path, path)
+        return path
@@ -0,0 +1,420 @@
+"""GUI 없이 실행하는 명령줄 도구 진입점."""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+VIDEO_EXTS = ('.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv')
+
+
+def _collect_videos(paths):
+    """파일/디렉터리 인자에서 비디오 파일 목록 수집 (디렉터리는 하위까지)."""
+    videos = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _dirs, files in os.walk(path):
+                for name in sorted(files):
+                    if name.lower().endswith(VIDEO_EXTS):
+                        videos.append(os.path.join(root, name))
+        elif os.path.isfile(path):
+            videos.append(path)
+        else:
+            print(f"[경고] 파일을 찾을 수 없습니다: {path}")
+    return videos
+
+
+def _cmd_bench(args):
+    """벤치마크 실행 및 기준값 비교."""
+    from .benchmarks import BenchmarkSuite, BenchmarkBaseline, DEFAULT_PROFILES, QUICK_PROFILES
+    from .processors.media_cache import MediaCache
+
+    work_dir = args.work_dir or MediaCache.cache_dir('benchmarks')
+    os.makedirs(work_dir, exist_ok=True)
+    baseline_path = args.baseline or os.path.join(work_dir, 'baseline.json')
+
+    suite = BenchmarkSuite(
+        work_dir,
+        QUICK_PROFILES if args.quick else DEFAULT_PROFILES,
+        repeats=args.repeats,
+        include_export=not args.skip_export,
+    )
+    report = suite.run()
+
+    if args.output:
+        BenchmarkBaseline.save(args.output, report)
+
+    if args.save_baseline:
+        BenchmarkBaseline.save(baseline_path, report)
+        print(f"기준값 저장: {baseline_path}")
+        return 0
+
+    baseline = BenchmarkBaseline.load(baseline_path)
+    if baseline is None:
+        print(f"기준값이 없습니다 ({baseline_path}). --save-baseline으로 먼저 저장하세요.")
+        return 0
+
+    regressions = BenchmarkBaseline.compare(baseline, report, args.threshold)
+    if not regressions:
+        print(f"회귀 없음 (허용 {args.threshold:.0%})")
+        return 0
+    print(f"회귀 {len(regressions)}건 (허용 {args.threshold:.0%}):")
+    for key, base, value, ratio in regressions:
+        print(f"  {key:<48} {base:10.3f} -> {value:10.3f}  (x{ratio:.2f})")
+    return 1
+
+
+def _export_trimmed(job):
+    """자동 트림 결과로 잘라낸 파일 내보내기 (프로세스 풀 작업)."""
+    from .processors.export_engine import ExportEngine, ExportSpec
+    from .processors.export_telemetry import ExportTelemetry
+    proposal, output_path = job
+    spec = ExportSpec(fps=proposal['fps'], start_time=proposal['start_time'], end_time=proposal['end_time'])
+    try:
+        with ExportTelemetry(proposal['video_path'], [(output_path, spec)], origin='autotrim'):
+            ExportEngine.export(proposal['video_path'], output_path, spec, logger=None)
+        return output_path, None
+    except Exception as e:
+        return output_path, str(e)
+
+
+def _cmd_autotrim(args):
+    """앞/뒤 검은·정지 화면 자동 트림 (일괄 처리)."""
+    from .processors.auto_trim import AutoTrimmer
+
+    videos = _collect_videos(args.paths)
+    if not videos:
+        print("처리할 비디오 파일이 없습니다.")
+        return 1
+
+    results = []
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        for result in pool.map(AutoTrimmer.analyze, videos, chunksize=4):
+            results.append(result)
+            if 'error' in result:
+                print(f"[오류] {result['video_path']}: {result['error']}")
+            else:
+                print(f"{result['video_path']}: {result['start_frame']} ~ {result['end_frame']} "
+                      f"/ {result['total_frames']} ({result['start_time']:.2f}s ~ {result['end_time']:.2f}s)")
+
+    if args.output:
+        if args.output.lower().endswith('.csv'):
+            fields = ['video_path', 'start_frame', 'end_frame', 'total_frames', 'fps',
+                      'start_time', 'end_time', 'error']
+            with open(args.output, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fields)
+                writer.writeheader()
+                writer.writerows(results)
+        else:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+
+    failed = sum(1 for r in results if 'error' in r)
+    if args.export_dir:
+        os.makedirs(args.export_dir, exist_ok=True)
+        jobs = []
+        for r in results:
+            if 'error' in r or (r['start_frame'] == 0 and r['end_frame'] >= r['total_frames']):
+                continue
+            stem = os.path.splitext(os.path.basename(r['video_path']))[0]
+            jobs.append((r, os.path.join(args.export_dir, f"{stem}_trimmed.mp4")))
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            for output_path, error in pool.map(_export_trimmed, jobs):
+                if error:
+                    failed += 1
+                    print(f"[오류] {output_path}: {error}")
+                else:
+                    print(f"내보냄: {output_path}")
+    return 1 if failed else 0
+
+
+def _parse_rendition(values, default_fps, base_spec):
+    """`경로 [키=값 ...]` 형식의 --rendition 인자를 (경로, ExportSpec)으로 변환."""
+    from dataclasses import replace
+    output_path, options = values[0], values[1:]
+    fields = {'fps': float, 'width': int, 'height': int, 'codec': str, 'preset': str, 'threads': int}
+    limits = {'width': 'max_width', 'height': 'max_height'}
+    spec = replace(base_spec, fps=default_fps)
+    for option in options:
+        key, sep, value = option.partition('=')
+        if not sep or key not in fields:
+            raise ValueError(f"알 수 없는 옵션: {option} (사용 가능: {', '.join(fields)})")
+        setattr(spec, limits.get(key, key), fields[key](value))
+    return output_path, spec
+
+
+def _parse_keep_range(value):
+    """`시작-종료`(초) 형식의 --keep 인자를 (시작, 종료)로 변환."""
+    start, sep, end = value.partition('-')
+    try:
+        start, end = float(start), float(end)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"구간 형식이 잘못되었습니다: {value} (예: 12.5-30)")
+    if not sep or end <= start:
+        raise argparse.ArgumentTypeError(f"구간 형식이 잘못되었습니다: {value} (예: 12.5-30)")
+    return start, end
+
+
+def _parse_crop(value):
+    """`X,Y,W,H` 형식의 --crop 인자를 정수 4개 튜플로 변환."""
+    try:
+        crop = tuple(int(v) for v in value.split(','))
+    except ValueError:
+        crop = ()
+    if len(crop) != 4 or crop[2] <= 0 or crop[3] <= 0:
+        raise argparse.ArgumentTypeError(f"크롭 형식이 잘못되었습니다: {value} (예: 0,140,1920,800)")
+    return crop
+
+
+def _cmd_export(args):
+    """한 번의 디코딩으로 여러 출력(FPS/해상도/코덱) 내보내기."""
+    import cv2
+    from dataclasses import replace
+    from .processors.export_cache import ExportCache
+    from .processors.export_engine import ExportEngine, ExportSpec
+    from .processors.export_telemetry import ExportTelemetry
+
+    cap = cv2.VideoCapture(args.input)
+    if not cap.isOpened():
+        print(f"비디오 파일을 열 수 없습니다: {args.input}")
+        return 1
+    source_fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    cap.release()
+
+    base_spec = ExportSpec(fps=source_fps, start_time=args.start, end_time=args.end, rotation_angle=args.rotate,
+                           crop=args.crop)
+    if args.keep:
+        base_spec.ranges = list(args.keep)
+    try:
+        outputs = [_parse_rendition(values, source_fps, base_spec) for values in args.rendition]
+    except ValueError as e:
+        print(f"[오류] {e}")
+        return 1
+    if any(spec.preset == 'auto' for _path, spec in outputs):
+        # preset=auto인 출력은 표본 구간 측정(머신/해상도별로 한 번)으로 preset/스레드 수 선택
+        from .processors.encoder_tuner import EncoderTuner
+        tuned = []
+        for output_path, spec in outputs:
+            if spec.preset == 'auto':
+                spec = EncoderTuner.apply(args.input, replace(spec, preset=ExportSpec.preset),
+                                          deadline_minutes=args.deadline)
+                print(f"인코더 튜닝: {output_path} -> preset {spec.preset}, 스레드 {spec.threads}")
+            tuned.append((output_path, spec))
+        outputs = tuned
+    if args.resumable and len(outputs) != 1:
+        print("[오류] --resumable은 출력이 하나일 때만 사용할 수 있습니다.")
+        return 1
+    logger = None if args.quiet else 'bar'
+    cache = None
+    if not args.no_cache:
+        try:
+            cache = ExportCache(allow_copy=args.cache_copy)
+        except OSError as e:
+            print(f"[경고] 캐시를 사용할 수 없어 캐시 없이 내보냅니다: {e}")
+    if cache is not None:
+        # 같은 원본/설정으로 이미 내보낸 출력은 캐시에서 바로 복사
+        remaining = []
+        for output_path, spec in outputs:
+            try:
+                cached = cache.fetch(args.input, spec, output_path)
+            except OSError as e:
+                print(f"[경고] 캐시를 읽지 못해 다시 내보냅니다: {e}")
+                cached = False
+            if cached:
+                ExportTelemetry.log_cached(args.input, [(output_path, spec)], origin='cli')
+                print(f"캐시 사용: {output_path}")
+            else:
+                remaining.append((output_path, spec))
+        if not remaining:
+            return 0
+        outputs = remaining
+    try:
+        # 소요 시간/자원 사용량을 텔레메트리 로그에 기록 (report 명령으로 요약)
+        with ExportTelemetry(args.input, outputs, origin='cli') as telemetry:
+            if args.resumable:
+                from .processors.segmented_export import SegmentedExport
+                output_path, spec = outputs[0]
+                job = SegmentedExport(args.input, output_path, spec, work_dir=args.work_dir,
+                                      segment_seconds=args.segment_seconds)
+                job.run(logger=logger)
+                if job.resumed_segments:
+                    telemetry.notes['resumed_segments'] = job.resumed_segments
+                    print(f"이전 작업의 완료된 조각 {job.resumed_segments}개를 이어서 사용했습니다.")
+            else:
+                ExportEngine.export_many(args.input, outputs, logger=logger)
+    except (OSError, RuntimeError) as e:
+        print(f"[오류] {e}")
+        return 1
+    for output_path, spec in outputs:
+        if cache is not None:
+            try:
+                cache.store(args.input, spec, output_path)
+            except OSError as e:
+                # 캐시에 등록하지 못해도 내보내기는 성공
+                print(f"[경고] 캐시에 저장하지 못했습니다: {e}")
+        print(f"내보냄: {output_path}")
+    return 0
+
+
+def _cmd_extract(args):
+    """구간의 프레임을 이미지 시퀀스로 추출."""
+    from .processors.frame_extractor import FrameExtractor
+
+    try:
+        extractor = FrameExtractor(args.input, args.output_dir, every=args.every, start_time=args.start,
+                                   end_time=args.end, rotation_angle=args.rotate, crop=args.crop,
+                                   image_format=args.format, quality=args.quality, jobs=args.jobs)
+        stats = extractor.run(logger=None if args.quiet else 'bar')
+    except (ValueError, OSError) as e:
+        print(f"[오류] {e}")
+        return 1
+    print(f"저장: {stats['frames']}장 → {args.output_dir} ({stats['seconds']:.1f}초, {stats['fps']:.1f} frames/s)")
+    return 0
+
+
+def _format_summary_row(label, row):
+    """처리량 요약 한 줄."""
+    def value(key, fmt):
+        return format(row[key], fmt) if row.get(key) is not None else '-'
+    return (f"  {label:<40} {row['count']:>5} {row['frames']:>9} {value('median_fps', '.1f'):>9} "
+            f"{value('realtime', '.2f'):>7} {value('cpu_per_minute', '.1f'):>9} {value('peak_rss_mb', '.0f'):>8} "
+            f"{value('child_peak_rss_mb', '.0f'):>10} {value('mb_per_minute', '.1f'):>7}")
+
+
+def _cmd_report(args):
+    """내보내기 텔레메트리 로그를 해상도·설정별, 기간별 처리량으로 요약."""
+    import time
+    from .processors.export_telemetry import ExportTelemetry
+
+    log_path = args.log or ExportTelemetry.default_log_path()
+    since = time.time() - args.since * 86400 if args.since else None
+    records = ExportTelemetry.load(log_path, since=since)
+    summary = ExportTelemetry.summarize(records, period=args.period)
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+        return 0
+    print(f"기록 {summary['total']}건 (실패 {summary['errors']}, 캐시 재사용 {summary['cached']}) - {log_path}")
+    if not summary['groups']:
+        print("요약할 내보내기 기록이 없습니다.")
+        return 0
+    # 열 이름은 정렬을 위해 ASCII (fps=인코딩 fps 중앙값, xRT=실시간 배수, cpu/min=출력 1분당 CPU 초)
+    header = (f"  {'':<40} {'count':>5} {'frames':>9} {'fps':>9} {'xRT':>7} {'cpu/min':>9} "
+              f"{'rss_mb':>8} {'enc_rss_mb':>10} {'MB/min':>7}")
+    print("\n해상도·설정별 (설정: 코덱/preset/스레드)")
+    print(header)
+    for row in summary['groups']:
+        print(_format_summary_row(f"{row['resolution']} {row['settings']}", row))
+    print(f"\n기간별 ({args.period})")
+    print(header)
+    for row in summary['timeline']:
+        print(_format_summary_row(f"{row['period']} {row['resolution']} {row['settings']}", row))
+    return 0
+
+
+def _cmd_watch(args):
+    """감시 폴더에 들어오는 비디오를 폴더별 설정으로 무인 처리."""
+    from .processors.watch_folder import WatchFolderDaemon
+
+    if not os.path.isdir(args.directory):
+        print(f"디렉터리를 찾을 수 없습니다: {args.directory}")
+        return 1
+    daemon = WatchFolderDaemon(args.directory, jobs=args.jobs, poll_seconds=args.poll,
+                               settle_seconds=args.settle, journal_path=args.journal)
+    try:
+        daemon.run(once=args.once)
+    except KeyboardInterrupt:
+        print("감시를 중단합니다.")
+    return 0
+
+
+def build_parser():
+    """명령줄 인자 파서 생성."""
+    parser = argparse.ArgumentParser(prog="videoEdit-cli", description="Video Edit Tool 명령줄 도구")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    bench = subparsers.add_parser("bench", help="시크/렌더링/내보내기 벤치마크")
+    bench.add_argument("--work-dir", help="합성 클립/기준값 저장 디렉터리 (기본: 캐시 디렉터리)")
+    bench.add_argument("--baseline", help="기준값 JSON 경로 (기본: <work-dir>/baseline.json)")
+    bench.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    bench.add_argument("--threshold", type=float, default=0.2, help="회귀로 판단할 느려짐 비율 (기본 0.2 = 20%%)")
+    bench.add_argument("--repeats", type=int, default=3, help="반복 측정 횟수")
+    bench.add_argument("--quick", action="store_true", help="작은 클립 2개만 측정")
+    bench.add_argument("--skip-export", action="store_true", help="내보내기 측정 생략")
+    bench.add_argument("--output", help="결과 JSON 저장 경로")
+    bench.set_defaults(func=_cmd_bench)
+
+    autotrim = subparsers.add_parser("autotrim", help="앞/뒤 검은·정지 화면 자동 트림 (일괄)")
+    autotrim.add_argument("paths", nargs="+", help="비디오 파일 또는 디렉터리")
+    autotrim.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="동시 처리 프로세스 수")
+    autotrim.add_argument("--output", help="제안 결과 저장 경로 (.json 또는 .csv)")
+    autotrim.add_argument("--export-dir", help="지정 시 트림한 파일을 이 디렉터리에 <이름>_trimmed.mp4로 내보냄")
+    autotrim.set_defaults(func=_cmd_autotrim)
+
+    export = subparsers.add_parser("export", help="한 번의 디코딩으로 여러 출력 내보내기")
+    export.add_argument("input", help="원본 비디오 파일")
+    export.add_argument("--rendition", nargs="+", action="append", required=True, metavar="ARG",
+                        help="출력 경로와 선택 옵션 (fps=, width=, height=, codec=, preset=, threads=), 여러 번 지정 가능"
+                             " - preset=auto면 표본 측정으로 preset/스레드 수 자동 선택")
+    export.add_argument("--start", type=float, default=0.0, help="구간 시작(초)")
+    export.add_argument("--end", type=float, help="구간 종료(초, 기본: 끝까지)")
+    export.add_argument("--keep", type=_parse_keep_range, action="append", metavar="START-END",
+                        help="남길 구간(초), 여러 번 지정하면 이어 붙여 한 번에 내보냄 (--start/--end 대신 사용)")
+    export.add_argument("--rotate", type=int, default=0, help="시계방향 회전 각도")
+    export.add_argument("--crop", type=_parse_crop, metavar="X,Y,W,H",
+                        help="회전된 프레임 기준 크롭 영역 (모든 출력에 적용)")
+    export.add_argument("--deadline", type=float, metavar="MINUTES",
+                        help="preset=auto 출력을 이 시간(분) 안에 끝나는 설정 중 가장 작은 파일로 튜닝 (기본: 실시간 이내)")
+    export.add_argument("--resumable", action="store_true",
+                        help="조각 단위로 저장해 중단 후 같은 명령으로 이어서 진행 (출력 하나만)")
+    export.add_argument("--segment-seconds", type=float, help="--resumable 조각 길이(초, 기본 30)")
+    export.add_argument("--work-dir", help="--resumable 조각 저장 디렉터리 (기본: 캐시 디렉터리)")
+    export.add_argument("--no-cache", action="store_true", help="내보내기 결과 캐시를 사용/저장하지 않음")
+    export.add_argument("--cache-copy", action="store_true",
+                        help="출력을 캐시에 하드링크할 수 없으면(다른 파일시스템 등) 복사해서 저장")
+    export.add_argument("--quiet", action="store_true", help="진행 표시 생략")
+    export.set_defaults(func=_cmd_export)
+
+    extract = subparsers.add_parser("extract", help="프레임을 JPEG/PNG 이미지 시퀀스로 추출")
+    extract.add_argument("input", help="원본 비디오 파일")
+    extract.add_argument("output_dir", help="이미지 저장 디렉터리 (frame_<원본 프레임 번호>.jpg)")
+    extract.add_argument("--every", type=int, default=1, help="N프레임마다 한 장 (기본: 모든 프레임)")
+    extract.add_argument("--start", type=float, default=0.0, help="구간 시작(초)")
+    extract.add_argument("--end", type=float, help="구간 종료(초, 기본: 끝까지)")
+    extract.add_argument("--rotate", type=int, default=0, help="시계방향 회전 각도")
+    extract.add_argument("--crop", type=_parse_crop, metavar="X,Y,W,H", help="회전된 프레임 기준 크롭 영역")
+    extract.add_argument("--format", choices=("jpg", "png"), default="jpg", help="이미지 형식")
+    extract.add_argument("--quality", type=int, default=95, help="JPEG 품질 (0~100)")
+    extract.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="이미지 인코딩 프로세스 수")
+    extract.add_argument("--quiet", action="store_true", help="진행 표시 생략")
+    extract.set_defaults(func=_cmd_extract)
+
+    report = subparsers.add_parser("report", help="내보내기 기록(텔레메트리)의 처리량 요약")
+    report.add_argument("--log", help="텔레메트리 로그 경로 (기본: 캐시 디렉터리의 telemetry/exports.jsonl)")
+    report.add_argument("--since", type=float, metavar="DAYS", help="최근 N일 기록만 요약")
+    report.add_argument("--period", choices=("day", "week", "month"), default="week", help="기간별 요약 단위")
+    report.add_argument("--json", action="store_true", help="요약을 JSON으로 출력")
+    report.set_defaults(func=_cmd_report)
+
+    watch = subparsers.add_parser("watch", help="감시 폴더에 들어오는 비디오를 자동 처리 (데몬)")
+    watch.add_argument("directory", help="감시할 디렉터리 (하위 폴더의 .videoedit.json으로 폴더별 설정)")
+    watch.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="동시 처리 프로세스 수")
+    watch.add_argument("--poll", type=float, default=2.0, help="스캔/쓰기 완료 확인 주기(초)")
+    watch.add_argument("--settle", type=float, default=5.0, help="크기가 이 시간(초) 동안 그대로면 쓰기 완료로 판단")
+    watch.add_argument("--journal", help="작업 저널 경로 (기본: <directory>/.videoedit_journal.jsonl)")
+    watch.add_argument("--once", action="store_true", help="현재 파일만 처리하고 종료")
+    watch.set_defaults(func=_cmd_watch)
+
+    return parser
+
+
+def main(argv=None):
+    """명령줄 진입점."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,5 +3,10 @@
 from .playback import PlaybackController
 from .export import ExportController
 from .range_controller import RangeController
+from .filmstrip import FilmstripController
+from .waveform import WaveformController
+from .loader import LoadController
+from .preview_zoom import PreviewZoomController
 
-__all__ = ['PlaybackController', 'ExportController', 'RangeController']
+__all__ = ['PlaybackController', 'ExportController', 'RangeController', 'FilmstripController',
+           'WaveformController', 'LoadController', 'PreviewZoomController']
@@ -4,6 +4,13 @@ import threading
 import tkinter as tk
 from tkinter import messagebox
 
+from ..processors.export_engine import ExportEngine, ExportSpec
+from ..processors.export_cache import ExportCache
+from ..processors.encoder_tuner import EncoderTuner
+from ..processors.export_telemetry import ExportTelemetry
+from ..processors.segmented_export import SegmentedExport
+from ..processors.video_processor import VideoProcessor
+
 
 class ExportController:
     """비디오 내보내기 제어 클래스."""
@@ -18,6 +25,9 @@ class ExportController:
     
     def export_video(self):
         """비디오 내보내기."""
+        if self.app.video_path and self.app.load_controller.loading:
+            messagebox.showwarning("경고", "비디오를 아직 불러오는 중입니다.")
+            return
         if not self.app.video_path or not self.app.video_clip:
             messagebox.showerror("오류", "비디오 파일을 먼저 선택해주세요.")
             return
@@ -34,51 +44,183 @@ class ExportController:
         except ValueError as e:
             messagebox.showerror("오류", f"올바른 FPS 값을 입력해주세요.\n{str(e)}")
             return
+        try:
+            # Tk 변수는 UI 스레드에서만 읽으므로 내보내기 설정은 여기서 만들어 스레드에 넘김
+            spec = self.build_export_spec(fps)
+        except ValueError as e:
+            messagebox.showerror("오류", f"올바른 최대 크기를 입력해주세요.\n{str(e)}")
+            return
+        try:
+            deadline_minutes = self.parse_deadline()
+        except ValueError as e:
+            messagebox.showerror("오류", f"올바른 제한 시간을 입력해주세요.\n{str(e)}")
+            return
+        autotune = getattr(self.app, 'autotune_var', None) is not None and bool(self.app.autotune_var.get())
             
         # Export 버튼 비활성화 및 진행바 시작
         self.app.export_button.config(state=tk.DISABLED)
         self.app.progress.start()
         
+        # 내보내기 중에는 미리보기 프리페치 중단
+        if getattr(self.app, 'prefetcher', None) is not None:
+            self.app.prefetcher.pause()
+        
         # 별도 스레드에서 export 실행
-        thread = threading.Thread(target=self._export_video_thread, args=(output_path, fps))
+        thread = threading.Thread(target=self._export_video_thread, args=(output_path, spec, autotune, deadline_minutes))
         thread.daemon = True
         thread.start()
     
-    def _export_video_thread(self, output_path, fps):
+    def parse_max_size(self):
+        """최대 출력 크기 입력값 (`가로x세로`, 한쪽만 `1920x` / `x1080`도 가능)을 (폭, 높이)로 변환.
+
+        Raises:
+            ValueError: 형식이 잘못된 경우
+        """
+        value = self.app.max_size_var.get().strip().lower() if hasattr(self.app, 'max_size_var') else ''
+        if not value:
+            return None, None
+        width, sep, height = value.partition('x')
+        if not sep:
+            raise ValueError("형식: 가로x세로 (예: 1920x1080)")
+        size = tuple(int(v) if v.strip() else None for v in (width, height))
+        if any(v is not None and v < 2 for v in size):
+            raise ValueError("크기는 2 이상이어야 합니다.")
+        return size
+    
+    def parse_deadline(self):
+        """인코더 자동 튜닝 제한 시간(분) 입력값 (빈 값이면 None = 실시간 이내).
+
+        Raises:
+            ValueError: 숫자가 아니거나 0 이하인 경우
+        """
+        value = self.app.deadline_var.get().strip() if hasattr(self.app, 'deadline_var') else ''
+        if not value:
+            return None
+        minutes = float(value)
+        if minutes <= 0:
+            raise ValueError("제한 시간은 0보다 커야 합니다.")
+        return minutes
+    
+    def set_crop(self, value_str):
+        """크롭 영역 입력값 (`x,y,w,h`, 회전된 프레임 기준)을 적용하고 미리보기 갱신 (빈 값이면 해제)."""
+        value_str = value_str.strip()
+        crop = None
+        if value_str:
+            try:
+                values = [int(v) for v in value_str.split(',')]
+                if len(values) != 4 or values[2] <= 0 or values[3] <= 0:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("오류", "크롭 영역은 x,y,w,h 형식으로 입력해주세요. (예: 0,140,1920,800)")
+                return
+            width, height = VideoProcessor.rotated_size(self.app.video_width, self.app.video_height,
+                                                        self.app.rotation_angle)
+            crop = VideoProcessor.clamp_crop(width, height, values)
+        self.app.crop_rect = crop
+        if hasattr(self.app, 'crop_var'):
+            self.app.crop_var.set(",".join(str(v) for v in crop) if crop else "")
+        # 확대 좌표는 크롭된 프레임 기준이므로 맞춤 보기로 되돌림
+        if getattr(self.app, 'preview_zoom_controller', None) is not None:
+            self.app.preview_zoom_controller.reset()
+        self.update_output_size()
+        if self.app.video_path:
+            self.app.update_preview()
+    
+    def clear_crop(self):
+        """크롭 해제 (회전이 바뀌거나 새 파일을 열면 좌표가 맞지 않으므로 호출)."""
+        self.app.crop_rect = None
+        if hasattr(self.app, 'crop_var'):
+            self.app.crop_var.set("")
+        if getattr(self.app, 'preview_zoom_controller', None) is not None:
+            self.app.preview_zoom_controller.reset()
+        self.update_output_size()
+    
+    def update_output_size(self):
+        """회전/크롭/최대 크기를 반영한 출력 해상도 표시."""
+        if not hasattr(self.app, 'output_size_label'):
+            return
+        if not self.app.video_width or not self.app.video_height:
+            self.app.output_size_label.config(text="")
+            return
+        try:
+            max_width, max_height = self.parse_max_size()
+        except ValueError:
+            self.app.output_size_label.config(text="출력: 크기 형식 오류")
+            return
+        spec = ExportSpec(fps=self.app.video_fps, rotation_angle=self.app.rotation_angle, crop=self.app.crop_rect,
+                          max_width=max_width, max_height=max_height)
+        width, height = spec.frame_size(self.app.video_width, self.app.video_height)
+        self.app.output_size_label.config(text=f"출력: {width}x{height}")
+    
+    def build_export_spec(self, fps):
+        """현재 앱 상태(구간/컷 리스트/회전/크롭/최대 크기)로 ExportSpec 생성."""
+        max_width, max_height = self.parse_max_size()
+        spec = ExportSpec(fps=fps, rotation_angle=self.app.rotation_angle, crop=self.app.crop_rect,
+                          max_width=max_width, max_height=max_height)
+        
+        # 컷 리스트가 있으면 그 구간들을 이어서 내보냄
+        cut_list = self.app.range_controller.cut_list_times()
+        if cut_list:
+            spec.ranges = cut_list
+            return spec
+        
+        # 구간 설정 적용
+        if self.app.range_unit_mode == "frame":
+            if self.app.start_frame > 0 or self.app.end_frame < self.app.total_frames:
+                spec.start_time = self.app.start_frame / self.app.video_fps if self.app.video_fps > 0 else 0
+                spec.end_time = self.app.end_frame / self.app.video_fps if self.app.video_fps > 0 else self.app.video_duration
+        else:
+            if self.app.start_time > 0 or self.app.end_time < self.app.video_duration:
+                spec.start_time = self.app.start_time
+                spec.end_time = self.app.end_time
+        return spec
+    
+    def _export_video_thread(self, output_path, spec, autotune=False, deadline_minutes=None):
         """비디오 내보내기 스레드."""
         try:
-            # 비디오 클립 복사
-            clip = self.app.video_clip.copy()
-            
-            # 구간 설정 적용
-            if self.app.range_unit_mode == "frame":
-                if self.app.start_frame > 0 or self.app.end_frame < self.app.total_frames:
-                    start_t = self.app.start_frame / self.app.video_fps if self.app.video_fps > 0 else 0
-                    end_t = self.app.end_frame / self.app.video_fps if self.app.video_fps > 0 else self.app.video_duration
-                    clip = clip.subclip(start_t, end_t)
-            else:
-                if self.app.start_time > 0 or self.app.end_time < self.app.video_duration:
-                    clip = clip.subclip(self.app.start_time, self.app.end_time)
-            
-            if self.app.rotation_angle != 0:
-                clip = clip.rotate(-self.app.rotation_angle)
-            
-            # FPS 설정
-            if fps != self.app.video_clip.fps:
-                clip = clip.set_fps(fps)
-            
-            # Export
-            clip.write_videofile(
-                output_path,
-                fps=fps,
-                codec='libx264',
-                audio_codec='aac' if clip.audio else None,
-                preset='medium',
-                threads=4
-            )
-            clip.close()
+            tuned = ""
+            if autotune:
+                # 표본 구간 측정(머신/해상도별로 한 번)으로 preset/스레드 수 선택
+                spec = EncoderTuner.apply(self.app.video_path, spec, deadline_minutes=deadline_minutes)
+                tuned = f"\n(인코더: {spec.preset}, 스레드 {spec.threads})"
+            output_duration = sum((end if end is not None else self.app.video_duration) - start
+                                  for start, end in spec.time_ranges())
+            message = "비디오가 성공적으로 export되었습니다!"
+            # 내보내기마다 소요 시간/자원 사용량을 텔레메트리 로그에 기록 (videoEdit-cli report로 요약)
+            with ExportTelemetry(self.app.video_path, [(output_path, spec)], origin='gui') as telemetry:
+                if tuned:
+                    telemetry.notes['autotuned'] = True
+                try:
+                    cache = ExportCache()
+                    cached = cache.fetch(self.app.video_path, spec, output_path)
+                except OSError:
+                    # 캐시 디렉터리를 쓸 수 없으면 캐시 없이 그대로 내보냄
+                    cache, cached = None, False
+                if cached:
+                    # 같은 원본/설정으로 이미 내보낸 결과가 있으면 인코딩 없이 사용
+                    telemetry.status = 'cached'
+                    self.app.root.after(0, self._export_complete, True, message + tuned + "\n(이전 결과를 재사용)")
+                    return
+                if output_duration >= SegmentedExport.MIN_DURATION:
+                    # 긴 내보내기는 조각 단위로 저장해 중단되더라도 같은 설정으로 다시 실행하면 이어서 진행
+                    job = SegmentedExport(self.app.video_clip, output_path, spec)
+                    job.run()
+                    telemetry.notes['segmented'] = True
+                    message += (f"\n(출력이 {SegmentedExport.MIN_DURATION / 60:g}분 이상이라 "
+                                f"{job.segment_seconds:g}초 조각 단위로 저장 - 중단되면 같은 설정으로 다시 내보내 이어서 진행)")
+                    if job.resumed_segments:
+                        telemetry.notes['resumed_segments'] = job.resumed_segments
+                        message += f"\n(이전 작업의 완료된 조각 {job.resumed_segments}개를 이어서 사용)"
+                else:
+                    ExportEngine.export(self.app.video_clip, output_path, spec)
+            if cache is not None:
+                try:
+                    cache.store(self.app.video_path, spec, output_path)
+                except OSError:
+                    # 캐시에 등록하지 못해도 내보내기는 성공
+                    pass
             
-            self.app.root.after(0, self._export_complete, True, "비디오가 성공적으로 export되었습니다!")
+            self.app.root.after(0, self._export_complete, True, message + tuned)
             
         except Exception as e:
             self.app.root.after(0, self._export_complete, False, f"Export 중 오류가 발생했습니다:\n{str(e)}")
@@ -87,6 +229,8 @@ class ExportController:
         """내보내기 완료 처리."""
         self.app.progress.stop()
         self.app.export_button.config(state=tk.NORMAL)
+        if getattr(self.app, 'prefetcher', None) is not None:
+            self.app.prefetcher.resume()
         
         if success:
             messagebox.showinfo("완료", message)
@@ -0,0 +1,141 @@
+"""타임라인 필름스트립 및 슬라이더 hover 미리보기 모듈."""
+
+import bisect
+import tkinter as tk
+
+import cv2
+
+from ..processors.video_processor import VideoProcessor
+from ..processors.thumbnail_worker import ThumbnailWorker
+
+
+class FilmstripController:
+    """슬라이더 아래 썸네일 스트립과 hover 미리보기를 관리하는 클래스."""
+
+    HOVER_SCALE = 2
+
+    def __init__(self, app):
+        """초기화.
+
+        Args:
+            app: VideoEditApp 인스턴스
+        """
+        self.app = app
+        self._worker = None
+        self._times = []
+        self._images = []
+        self._tile_photos = []
+        self._hover_window = None
+        self._hover_label = None
+        self._hover_photo = None
+
+    def load(self, video_path, duration, width, height):
+        """새 파일의 썸네일 추출 시작 (이전 작업은 취소)."""
+        self.clear()
+        if duration <= 0:
+            return
+        worker = ThumbnailWorker(
+            video_path, duration, width, height,
+            lambda thumbs: self.app.root.after(0, self._apply_thumbs, worker, thumbs)
+        )
+        self._worker = worker
+        worker.start()
+
+    def clear(self):
+        """추출 취소 및 스트립 비우기."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        self._times = []
+        self._images = []
+        self._tile_photos = []
+        if hasattr(self.app, 'filmstrip_canvas'):
+            self.app.filmstrip_canvas.delete("all")
+        self.hide_hover()
+
+    def _apply_thumbs(self, worker, thumbs):
+        """워커 결과 반영 (Tk 스레드)."""
+        if worker is not self._worker:
+            return  # 다른 파일로 바뀐 뒤 도착한 결과
+        self._times = [t for t, _ in thumbs]
+        self._images = [img for _, img in thumbs]
+        self.redraw()
+
+    def _nearest(self, time_seconds):
+        """time_seconds에 가장 가까운 썸네일 이미지."""
+        if not self._times:
+            return None
+        i = bisect.bisect_left(self._times, time_seconds)
+        if i >= len(self._times):
+            i = len(self._times) - 1
+        elif i > 0 and time_seconds - self._times[i - 1] < self._times[i] - time_seconds:
+            i -= 1
+        return self._images[i]
+
+    def _to_photo(self, image_bgr, height):
+        """회전을 반영한 BGR 썸네일을 지정 높이의 PhotoImage로 변환."""
+        from PIL import Image, ImageTk
+        rotated = VideoProcessor.rotate_frame_keep_full(image_bgr, self.app.rotation_angle)
+        h, w = rotated.shape[:2]
+        width = max(1, int(round(w * height / h)))
+        resized = cv2.resize(rotated, (width, height), interpolation=cv2.INTER_AREA)
+        return ImageTk.PhotoImage(image=Image.fromarray(cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)))
+
+    def redraw(self):
+        """캔버스 너비에 맞춰 썸네일 타일 다시 그리기."""
+        if not hasattr(self.app, 'filmstrip_canvas'):
+            return
+        canvas = self.app.filmstrip_canvas
+        canvas.delete("all")
+        self._tile_photos = []
+        if not self._times or self.app.video_duration <= 0:
+            return
+        canvas_w = canvas.winfo_width()
+        canvas_h = canvas.winfo_height()
+        if canvas_w <= 2 or canvas_h <= 2:
+            return
+
+        # 회전 반영 후 썸네일 비율로 타일 너비 결정
+        h, w = VideoProcessor.rotate_frame_keep_full(self._images[0], self.app.rotation_angle).shape[:2]
+        tile_w = max(1, int(round(w * canvas_h / h)))
+        x = 0
+        while x < canvas_w:
+            # 타일 중앙 위치에 해당하는 시간의 썸네일
+            center_t = (x + tile_w / 2.0) / canvas_w * self.app.video_duration
+            photo = self._to_photo(self._nearest(center_t), canvas_h)
+            self._tile_photos.append(photo)
+            canvas.create_image(x, 0, image=photo, anchor=tk.NW)
+            x += tile_w
+
+    def time_at(self, widget, x):
+        """위젯 내 x 좌표에 해당하는 재생 시간."""
+        width = widget.winfo_width()
+        if width <= 1:
+            return 0.0
+        ratio = min(max(x / width, 0.0), 1.0)
+        return ratio * self.app.video_duration
+
+    def show_hover(self, widget, event):
+        """슬라이더/필름스트립 위 마우스 위치의 썸네일을 팝업으로 표시."""
+        if not self._times:
+            return
+        image = self._nearest(self.time_at(widget, event.x))
+        if image is None:
+            return
+        self._hover_photo = self._to_photo(image, ThumbnailWorker.THUMB_HEIGHT * self.HOVER_SCALE)
+        if self._hover_window is None:
+            self._hover_window = tk.Toplevel(self.app.root)
+            self._hover_window.overrideredirect(True)
+            self._hover_label = tk.Label(self._hover_window, bd=1, relief=tk.SOLID, bg="black")
+            self._hover_label.pack()
+        self._hover_label.config(image=self._hover_photo)
+        x = event.x_root - self._hover_photo.width() // 2
+        y = widget.winfo_rooty() - self._hover_photo.height() - 8
+        self._hover_window.geometry(f"+{x}+{max(0, y)}")
+        self._hover_window.deiconify()
+        self._hover_window.lift()
+
+    def hide_hover(self):
+        """hover 팝업 숨기기."""
+        if self._hover_window is not None:
+            self._hover_window.withdraw()
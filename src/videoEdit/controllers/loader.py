@@ -0,0 +1,109 @@
+"""비디오 파일 비동기 로드 제어 모듈."""
+
+import os
+import tkinter as tk
+from tkinter import messagebox
+
+from ..processors.video_processor import VideoProcessor
+from ..processors.video_loader import VideoLoader
+
+
+class LoadController:
+    """파일 로드를 백그라운드에서 진행하며 결과를 단계별로 UI에 반영하는 클래스.
+
+    로드 중 다른 파일이 선택되면 이전 로드는 취소되고 그 결과는 버려진다.
+    """
+
+    def __init__(self, app):
+        """초기화.
+
+        Args:
+            app: VideoEditApp 인스턴스
+        """
+        self.app = app
+        self._loader = None
+        self._metadata = None
+
+    @property
+    def loading(self):
+        """로드가 진행 중인지 여부."""
+        return self._loader is not None
+
+    def load(self, video_path):
+        """새 파일 로드 시작 (진행 중인 로드는 취소)."""
+        self.cancel()
+        self._metadata = None
+
+        # 이전 파일 상태 정리 (편집용 클립은 새 클립이 준비될 때까지 사용하지 않음)
+        self.app.video_clip = None
+        self.app.decoder_choice = {}
+        self.app.total_frames = 0
+        self.app.video_duration = 0.0
+        self.app.export_button.config(state=tk.DISABLED)
+        if hasattr(self.app, 'play_button'):
+            self.app.play_button.config(state=tk.DISABLED)
+        self.app.filmstrip_controller.clear()
+        self.app.waveform_controller.clear()
+        self.app.file_label.config(text=f"{os.path.basename(video_path)} (불러오는 중...)", foreground="gray")
+        self.app._draw_preview_placeholder("불러오는 중...")
+
+        root = self.app.root
+        loader = VideoLoader(
+            video_path,
+            on_metadata=lambda metadata: root.after(0, self._apply_metadata, loader, metadata),
+            on_first_frame=lambda frame: root.after(0, self._apply_first_frame, loader, frame),
+            on_clip=lambda clip, details: root.after(0, self._apply_clip, loader, clip, details),
+            on_error=lambda message: root.after(0, self._apply_error, loader, message),
+        )
+        self._loader = loader
+        loader.start()
+
+    def cancel(self):
+        """진행 중인 로드 취소."""
+        if self._loader is not None:
+            self._loader.cancel()
+            self._loader = None
+
+    def _apply_metadata(self, loader, metadata):
+        """1단계: 메타데이터 반영 후 구간 초기화 및 백그라운드 분석 시작 (Tk 스레드)."""
+        if loader is not self._loader:
+            return
+        self._metadata = metadata
+        VideoProcessor.apply_video_info(self.app, loader.video_path, metadata)
+        self.app.on_video_info_loaded()
+
+    def _apply_first_frame(self, loader, frame):
+        """2단계: 첫 프레임 표시 (Tk 스레드)."""
+        if loader is not self._loader:
+            return
+        if frame is None:
+            self.app._draw_preview_placeholder("첫 프레임을 읽을 수 없습니다")
+            return
+        frame_cache = getattr(self.app, 'frame_cache', None)
+        if frame_cache is not None:
+            frame_cache.put(0, frame, source=loader.video_path)
+        if self.app.current_frame == 0:
+            VideoProcessor.render_frame(self.app, frame)
+
+    def _apply_clip(self, loader, clip, details):
+        """3단계: 편집용 클립과 추가 정보 반영, 내보내기 활성화 (Tk 스레드)."""
+        if loader is not self._loader:
+            clip.close()
+            return
+        self._loader = None
+        self.app.video_clip = clip
+        # 이후 미리보기/재생은 측정으로 고른 백엔드 사용
+        self.app.decoder_choice = details.get('decoders') or {}
+        if self._metadata is not None:
+            VideoProcessor.set_info_text(self.app, VideoProcessor.format_video_info(self._metadata, details))
+        self.app.export_button.config(state=tk.NORMAL)
+
+    def _apply_error(self, loader, message):
+        """로드 실패 처리 (Tk 스레드)."""
+        if loader is not self._loader:
+            return
+        self._loader = None
+        self.app.file_label.config(text=os.path.basename(loader.video_path), foreground="red")
+        if self._metadata is None:
+            self.app._draw_preview_placeholder()
+        messagebox.showerror("오류", message)
@@ -1,5 +1,6 @@
 """비디오 재생 관련 기능 모듈."""
 
+import threading
 import time
 
 # 직접 실행 시와 패키지로 import 시 모두 지원
@@ -8,12 +9,29 @@ if __name__ == "__main__":
     import os
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from processors.video_processor import VideoProcessor
+    from processors.perf_monitor import PerfMonitor
+    from processors.keyframe_index import KeyframeIndex
+    from processors.reverse_reader import ReverseReader
+    from processors.loop_buffer import LoopBuffer
 else:
     from ..processors.video_processor import VideoProcessor
+    from ..processors.perf_monitor import PerfMonitor
+    from ..processors.keyframe_index import KeyframeIndex
+    from ..processors.reverse_reader import ReverseReader
+    from ..processors.loop_buffer import LoopBuffer
 
 
 class PlaybackController:
     """비디오 재생 제어 클래스."""
+
+    # 지원하는 최대 표시 프레임 레이트 (이보다 높은 소스는 프레임을 건너뛰며 표시)
+    MAX_PLAYBACK_FPS = 120.0
+    # 렌더링 비용 이동평균 가중치
+    RENDER_COST_ALPHA = 0.2
+    # 지원 재생 속도
+    SPEEDS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0)
+    # 이 배속 이상에서는 키프레임만 디코딩해 표시
+    KEYFRAME_ONLY_SPEED = 4.0
     
     def __init__(self, app):
         """초기화.
@@ -22,6 +40,157 @@ class PlaybackController:
             app: VideoEditApp 인스턴스
         """
         self.app = app
+        self._render_cost = 0.0
+        self._next_due = None
+        self._last_presented_frame = -1
+        self._last_source_frame = -1
+        self._keyframes = None
+        self._keyframes_path = None
+        self._reverse_reader = None
+        self._loop_buffer = None
+        self.app.playback_speed = 1.0
+        self.app.playback_reverse = False
+        self.app.loop_buffer_enabled = False
+        self.reset_stats()
+
+    def reset_stats(self):
+        """재생 통계(표시/드롭/지연 프레임 수) 초기화."""
+        self.app.playback_stats = {
+            'presented': 0,
+            'dropped': 0,
+            'late': 0,
+        }
+
+    def reset_clock(self, media_time):
+        """미디어 클럭 기준점을 현재 시각과 주어진 재생 위치로 재설정."""
+        self.app._playback_start_time = time.perf_counter()
+        self.app._playback_start_frame_time = media_time
+        self._next_due = None
+        self._last_presented_frame = -1
+        self._last_source_frame = -1
+
+    def _rate(self):
+        """부호 있는 재생 배속 (역재생이면 음수)."""
+        speed = self.app.playback_speed
+        return -speed if self.app.playback_reverse else speed
+
+    def _media_time_now(self):
+        """미디어 클럭 기준 현재 재생 위치(초)."""
+        elapsed_time = time.perf_counter() - self.app._playback_start_time
+        return self.app._playback_start_frame_time + elapsed_time * self._rate()
+
+    def set_speed(self, speed):
+        """재생 배속 변경 (재생 중이면 현재 위치에서 클럭 재설정)."""
+        self.app.playback_speed = min(max(float(speed), self.SPEEDS[0]), self.SPEEDS[-1])
+        self._on_rate_changed()
+
+    def set_reverse(self, reverse):
+        """역재생 여부 변경."""
+        self.app.playback_reverse = bool(reverse)
+        self._on_rate_changed()
+
+    def _on_rate_changed(self):
+        if not self.app.is_playing:
+            return
+        self._prepare_readers()
+        self.reset_clock(self.app.current_time)
+
+    def _keyframe_only(self):
+        return self.app.playback_speed >= self.KEYFRAME_ONLY_SPEED
+
+    def _prepare_readers(self):
+        """배속/역재생/반복 재생에 필요한 키프레임 색인, 역재생 버퍼, 반복 버퍼 준비."""
+        reverse = self.app.playback_reverse
+        if reverse or self._keyframe_only():
+            self._load_keyframes()
+        if reverse and not self._keyframe_only():
+            if self._reverse_reader is None or self._reverse_reader.video_path != self.app.video_path:
+                self._close_reverse_reader()
+                canvas = getattr(self.app, 'preview_canvas', None)
+                max_side = max(canvas.winfo_width(), canvas.winfo_height()) if canvas is not None else 0
+                self._reverse_reader = ReverseReader(
+                    self.app.video_path, self.app.total_frames, self._keyframes,
+                    max_side=max_side if max_side > 2 else None,
+                )
+                # 첫 조각 디코딩을 클럭 시작 전에 요청 (준비될 때까지의 프레임은 드롭으로 집계)
+                first, last = self._loop_bounds()
+                self._reverse_reader.frame(max(first, self.app.current_frame - 1), floor=first, wrap_to=last)
+        else:
+            self._close_reverse_reader()
+        self._update_loop_buffer()
+
+    def set_loop_buffer(self, enabled):
+        """구간 반복 사전 렌더링 버퍼 사용 여부 변경."""
+        self.app.loop_buffer_enabled = bool(enabled)
+        if self.app.is_playing:
+            self._update_loop_buffer()
+        elif not enabled:
+            self._close_loop_buffer()
+
+    def _update_loop_buffer(self):
+        """반복 구간/표시 크기/회전/크롭이 바뀌었으면 버퍼를 새로 만들기 (예산 초과 구간, 확대 중에는 버퍼 없음)."""
+        if not self.app.loop_buffer_enabled or not hasattr(self.app, 'preview_canvas'):
+            self._close_loop_buffer()
+            return
+        first, last = self._loop_bounds()
+        canvas_w, canvas_h = VideoProcessor.canvas_size(self.app)
+        rect, scale = VideoProcessor.preview_rect(self.app, self.app.video_width, self.app.video_height,
+                                                  canvas_w, canvas_h)
+        if scale is not None:
+            # 확대/이동 중에는 단계마다 버퍼를 다시 만들지 않고 일반 경로(크롭 후 축소)로 표시
+            self._close_loop_buffer()
+            return
+        key = (self.app.video_path, first, last, canvas_w, canvas_h, self.app.rotation_angle, rect, scale)
+        if self._loop_buffer is not None and self._loop_buffer.key == key:
+            return
+        self._close_loop_buffer()
+        if LoopBuffer.fits(last - first + 1, canvas_w, canvas_h):
+            self._loop_buffer = LoopBuffer(*key)
+            self._loop_buffer.start(start_at=self.app.current_frame)
+
+    def _close_loop_buffer(self):
+        if self._loop_buffer is not None:
+            self._loop_buffer.close()
+            self._loop_buffer = None
+
+    def _close_reverse_reader(self):
+        if self._reverse_reader is not None:
+            self._reverse_reader.close()
+            self._reverse_reader = None
+
+    def _load_keyframes(self):
+        """키프레임 색인을 백그라운드로 로드 (파일당 한 번)."""
+        video_path = self.app.video_path
+        if self._keyframes_path == video_path:
+            return
+        self._keyframes_path = video_path
+        self._keyframes = None
+
+        def worker():
+            try:
+                index = KeyframeIndex.load(video_path)
+            except (OSError, RuntimeError):
+                return
+            if self._keyframes_path == video_path:
+                self._keyframes = index
+                if self._reverse_reader is not None and self._reverse_reader.video_path == video_path:
+                    self._reverse_reader.keyframes = index
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def request_prefetch(self, direction=0):
+        """일시정지 상태에서 현재 프레임 주변 프리페치 요청 (direction: 마지막 이동 방향)."""
+        prefetcher = getattr(self.app, 'prefetcher', None)
+        if prefetcher is None or self.app.is_playing or not self.app.video_path:
+            return
+        prefetcher.request(self.app.current_frame, direction)
+
+    def _frame_step(self):
+        """표시 프레임 간 소스 프레임 간격 (배속 적용 후 MAX_PLAYBACK_FPS 초과 시)."""
+        fps = self.app.video_fps * self.app.playback_speed
+        if fps <= self.MAX_PLAYBACK_FPS:
+            return 1
+        return int(-(-fps // self.MAX_PLAYBACK_FPS))
     
     def toggle_playback(self):
         """재생/일시정지 토글."""
@@ -38,19 +207,24 @@ class PlaybackController:
         if not self.app.video_path or self.app.video_duration == 0:
             return
         
+        # 재생 중에는 프리페처가 디코딩을 양보
+        if not self.app.is_playing and getattr(self.app, 'prefetcher', None) is not None:
+            self.app.prefetcher.pause()
         self.app.is_playing = True
         if hasattr(self.app, 'play_button'):
             self.app.play_button.config(text="⏸ 일시정지")
         
         # 재생 시작 시간 기록
-        self.app._playback_start_time = time.time()
-        self.app._playback_start_frame_time = self.app.current_time
+        self.reset_stats()
+        self._prepare_readers()
+        self.reset_clock(self.app.current_time)
         
         # 재생 루프 시작
         self._play_frame()
     
     def pause_playback(self):
         """비디오 재생 일시정지."""
+        was_playing = self.app.is_playing
         self.app.is_playing = False
         if hasattr(self.app, 'play_button'):
             self.app.play_button.config(text="▶ 재생")
@@ -58,10 +232,16 @@ class PlaybackController:
         if self.app._play_after_id is not None:
             self.app.root.after_cancel(self.app._play_after_id)
             self.app._play_after_id = None
+        
+        self._close_reverse_reader()
+        if was_playing and getattr(self.app, 'prefetcher', None) is not None:
+            self.app.prefetcher.resume()
+            self.request_prefetch(1)
     
     def stop_playback(self):
         """비디오 재생 중지."""
         self.pause_playback()
+        self._close_loop_buffer()
         self.app.current_time = 0.0
         self.app.current_frame = 0
         if hasattr(self.app, 'time_slider'):
@@ -88,71 +268,170 @@ class PlaybackController:
         
         # 재생 중이면 시작 시간 업데이트
         if self.app.is_playing:
-            self.app._playback_start_time = time.time()
-            self.app._playback_start_frame_time = self.app.current_time
+            self.reset_clock(self.app.current_time)
         
         # 프레임 업데이트
         VideoProcessor.seek_to_frame(self.app, self.app.current_time)
         self._update_time_label()
+        self.request_prefetch()
     
-    def _play_frame(self):
-        """비디오 프레임 재생."""
-        if not self.app.is_playing or not self.app.video_path:
-            return
-        
-        # 실제 경과 시간 계산
-        elapsed_time = time.time() - self.app._playback_start_time
-        target_time = self.app._playback_start_frame_time + elapsed_time
+    def _due_frame(self):
+        """미디어 클럭 기준으로 지금 표시해야 할 프레임 번호와 시간 계산 (구간 반복 포함)."""
+        fps = self.app.video_fps
+        target_time = self._media_time_now()
+        reverse = self.app.playback_reverse
         
         # 구간 체크
         if self.app.range_unit_mode == "frame":
-            target_frame = int(target_time * self.app.video_fps) if self.app.video_fps > 0 else 0
-            if target_frame >= self.app.end_frame:
-                # 재생이 끝나면 처음으로 돌아가서 계속 재생 (멈추지 않음)
-                self.app.current_frame = self.app.start_frame
-                self.app.current_time = self.app.start_frame / self.app.video_fps if self.app.video_fps > 0 else 0
-                self.app._playback_start_time = time.time()
-                self.app._playback_start_frame_time = self.app.current_time
-                target_time = self.app.current_time
-                target_frame = self.app.start_frame
-            
-            if target_frame < self.app.start_frame:
-                target_frame = self.app.start_frame
-                target_time = target_frame / self.app.video_fps if self.app.video_fps > 0 else 0
-                self.app._playback_start_time = time.time()
-                self.app._playback_start_frame_time = target_time
+            target_frame = int(target_time * fps) if fps > 0 else 0
+            if target_frame >= self.app.end_frame or target_frame < self.app.start_frame:
+                # 재생이 끝나면 처음(역재생은 끝)으로 돌아가서 계속 재생 (멈추지 않음)
+                if reverse:
+                    target_frame = max(self.app.start_frame, self.app.end_frame - 1)
+                    # 프레임 구간의 끝에서 시작하도록 클럭을 프레임 끝 직전에 맞춤
+                    target_time = (target_frame + 1) / fps - 1e-6 if fps > 0 else 0
+                else:
+                    target_frame = self.app.start_frame
+                    target_time = target_frame / fps if fps > 0 else 0
+                self.reset_clock(target_time)
         else:
             # 시간 단위 체크
-            if target_time >= self.app.end_time:
-                # 재생이 끝나면 처음으로 돌아가서 계속 재생 (멈추지 않음)
-                self.app.current_time = self.app.start_time
-                self.app._playback_start_time = time.time()
-                self.app._playback_start_frame_time = self.app.current_time
-                target_time = self.app.start_time
-            
-            if target_time < self.app.start_time:
-                target_time = self.app.start_time
-                self.app._playback_start_time = time.time()
-                self.app._playback_start_frame_time = target_time
+            if target_time >= self.app.end_time or target_time < self.app.start_time:
+                # 재생이 끝나면 처음(역재생은 끝)으로 돌아가서 계속 재생 (멈추지 않음)
+                if reverse:
+                    target_time = max(self.app.start_time, self.app.end_time - 1e-6)
+                else:
+                    target_time = self.app.start_time
+                self.reset_clock(target_time)
+            target_frame = int(target_time * fps) if fps > 0 else 0
+        
+        if target_frame >= self.app.total_frames:
+            target_frame = self.app.total_frames - 1
+            target_time = target_frame / fps if fps > 0 else 0
+        return target_frame, target_time
+    
+    def _loop_bounds(self):
+        """현재 반복 구간의 (첫 프레임, 마지막 프레임)."""
+        fps = self.app.video_fps
+        if self.app.range_unit_mode == "frame":
+            first, last = self.app.start_frame, self.app.end_frame - 1
+        else:
+            first = int(self.app.start_time * fps) if fps > 0 else 0
+            last = int(self.app.end_time * fps) - 1 if fps > 0 else 0
+        last = min(last, self.app.total_frames - 1)
+        return first, max(first, last)
+    
+    def _present(self, target_frame):
+        """배속/방향에 맞는 경로로 target_frame 표시.
+
+        - KEYFRAME_ONLY_SPEED 이상: target_frame 이전의 키프레임만 디코딩
+        - 역재생: GOP 단위 버퍼에서 역순으로 꺼냄
+        - 그 외: 일반 미리보기 경로 (순차 grab/seek + 프레임 캐시)
+        반복 버퍼가 켜져 있고 해당 프레임이 렌더링되어 있으면 그것을 우선 사용한다.
+
+        Returns:
+            표시했으면 True
+        """
+        # 반복 버퍼에 이미 렌더링된 프레임은 디코딩 없이 바로 표시 (아직 없으면 아래 경로로 디코딩)
+        if self._loop_buffer is not None:
+            frame_rgb = self._loop_buffer.get(target_frame)
+            if frame_rgb is not None:
+                VideoProcessor.present_rgb(self.app, frame_rgb)
+                self._last_source_frame = target_frame
+                return True
+        
+        if self._keyframe_only() and self._keyframes is not None:
+            source_frame = self._keyframes.at_or_before(target_frame)
+            if source_frame == self._last_source_frame:
+                return False
+            _, frame = VideoProcessor.read_frame(self.app, source_frame)
+            source_size = None
+        elif self._reverse_reader is not None:
+            source_frame = target_frame
+            first, last = self._loop_bounds()
+            frame = self._reverse_reader.frame(target_frame, floor=first, wrap_to=last)
+            # 역재생 버퍼 프레임은 축소되어 있으므로 크롭 영역을 원본 크기 기준으로 환산
+            source_size = (self.app.video_width, self.app.video_height)
+        else:
+            VideoProcessor.seek_to_frame(self.app, self.app.current_time)
+            self._last_source_frame = target_frame
+            return True
+        if frame is None:
+            return False
+        VideoProcessor.render_frame(self.app, frame, source_size=source_size)
+        self._last_source_frame = source_frame
+        return True
+    
+    def _play_frame(self):
+        """비디오 프레임 재생.
+
+        매 tick마다 미디어 클럭에서 표시할 프레임을 구하고, 다음 tick은
+        다음 프레임의 표시 시각에서 측정된 렌더링 비용을 뺀 시점으로 예약한다.
+        """
+        if not self.app.is_playing or not self.app.video_path:
+            return
+        
+        tick_start = time.perf_counter()
+        fps = self.app.video_fps if self.app.video_fps > 0 else 30.0
+        frame_interval = 1.0 / (fps * self.app.playback_speed)
+        step = self._frame_step()
+        stats = self.app.playback_stats
+        perf = PerfMonitor.of(self.app)
+        
+        # 예약 시각보다 반 프레임 이상 늦게 깨어난 tick은 지연으로 집계
+        if self._next_due is not None:
+            lateness = tick_start - self._next_due
+            perf.record('tick_late', max(0.0, lateness) * 1000.0)
+            if lateness > frame_interval * step / 2:
+                stats['late'] += 1
+        
+        # 구간/회전/표시 크기가 바뀌면 반복 버퍼 다시 만들기
+        if self.app.loop_buffer_enabled:
+            self._update_loop_buffer()
+        
+        target_frame, target_time = self._due_frame()
+        
+        # 건너뛴 프레임은 드롭으로 집계 (표시 간격 step 초과분, 키프레임 전용 모드 제외)
+        if self._last_presented_frame >= 0 and not self._keyframe_only():
+            direction = -1 if self.app.playback_reverse else 1
+            advanced = (target_frame - self._last_presented_frame) * direction
+            if advanced > step:
+                stats['dropped'] += advanced - step
         
         # 현재 시간과 프레임 업데이트
+        self.app.current_frame = target_frame
         self.app.current_time = target_time
-        if self.app.video_fps > 0:
-            self.app.current_frame = int(self.app.current_time * self.app.video_fps)
-            if self.app.current_frame >= self.app.total_frames:
-                self.app.current_frame = self.app.total_frames - 1
-                self.app.current_time = self.app.current_frame / self.app.video_fps
         
-        # 프레임 표시
-        VideoProcessor.seek_to_frame(self.app, self.app.current_time)
+        # 프레임 표시 (렌더링 비용 측정)
+        if target_frame != self._last_presented_frame:
+            render_start = time.perf_counter()
+            if self._present(target_frame):
+                cost = time.perf_counter() - render_start
+                self._render_cost += self.RENDER_COST_ALPHA * (cost - self._render_cost)
+                perf.record('render', cost * 1000.0)
+                stats['presented'] += 1
+                # 표시하지 못한 프레임(역재생 버퍼 미준비 등)은 다음 표시 때 드롭으로 집계
+                self._last_presented_frame = target_frame
+        for key, value in stats.items():
+            perf.set_counter(key, value)
         
         # UI 업데이트
         if hasattr(self.app, 'time_slider'):
             self.app.time_slider.set(self.app.current_time)
         self._update_time_label()
         
-        # 다음 프레임 예약 (약 30fps로 UI 업데이트, 실제 재생 속도는 시간 기반)
-        self.app._play_after_id = self.app.root.after(33, self._play_frame)
+        # 다음 프레임의 표시 시각 = 클럭 기준점 + (다음 프레임 시간 - 기준 재생 위치) / 배속
+        # (역재생은 다음 프레임 구간의 끝을 지나는 시각)
+        rate = self._rate()
+        if rate < 0:
+            next_frame_time = (target_frame - step + 1) / fps
+        else:
+            next_frame_time = (target_frame + step) / fps
+        next_due = self.app._playback_start_time + (next_frame_time - self.app._playback_start_frame_time) / rate
+        self._next_due = next_due
+        delay = next_due - time.perf_counter() - self._render_cost
+        delay_ms = max(1, int(round(delay * 1000)))
+        self.app._play_after_id = self.app.root.after(delay_ms, self._play_frame)
     
     def _update_time_label(self):
         """시간 및 프레임 레이블 업데이트."""
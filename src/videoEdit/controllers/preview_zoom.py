@@ -0,0 +1,138 @@
+"""미리보기 확대/이동(ROI) 제어 모듈."""
+
+from ..processors.video_processor import VideoProcessor
+
+
+class PreviewZoomController:
+    """미리보기 Canvas의 확대/이동과 1:1 픽셀 보기를 관리하는 클래스.
+
+    확대 상태는 app.preview_zoom(맞춤 기준 배율), app.preview_center(보이는 영역 중심,
+    회전·크롭된 프레임 기준 0~1), app.preview_one_to_one에 두고, 실제 렌더링은
+    VideoProcessor.preview_rect가 보이는 영역만 잘라낸 뒤 리사이즈한다.
+    """
+
+    ZOOM_STEP = 1.25
+    MAX_ZOOM = 32.0
+
+    def __init__(self, app):
+        """초기화.
+
+        Args:
+            app: VideoEditApp 인스턴스
+        """
+        self.app = app
+        self._drag_origin = None
+
+    def bind(self, canvas):
+        """Canvas에 Ctrl+휠 확대, 드래그 이동, 더블클릭 맞춤 바인딩."""
+        canvas.bind("<Control-MouseWheel>", lambda e: self._on_wheel(e, e.delta > 0))
+        canvas.bind("<Control-Button-4>", lambda e: self._on_wheel(e, True))  # Linux
+        canvas.bind("<Control-Button-5>", lambda e: self._on_wheel(e, False))  # Linux
+        canvas.bind("<ButtonPress-1>", self._on_drag_start)
+        canvas.bind("<B1-Motion>", self._on_drag)
+        canvas.bind("<ButtonRelease-1>", lambda _e: setattr(self, '_drag_origin', None))
+        canvas.bind("<Double-Button-1>", lambda _e: self.fit())
+
+    def _image_size(self):
+        """회전·크롭된 프레임 크기 (확대 기준)."""
+        width, height = VideoProcessor.rotated_size(self.app.video_width, self.app.video_height,
+                                                    self.app.rotation_angle)
+        crop = VideoProcessor.clamp_crop(width, height, self.app.crop_rect)
+        return (crop[2], crop[3]) if crop is not None else (width, height)
+
+    def _current_view(self):
+        """(보이는 영역, 배율, 프레임 크기, Canvas 크기) - 맞춤 보기면 영역은 프레임 전체."""
+        width, height = self._image_size()
+        canvas_w, canvas_h = VideoProcessor.canvas_size(self.app)
+        view, scale = VideoProcessor.preview_view(
+            width, height, canvas_w, canvas_h, zoom=self.app.preview_zoom,
+            center=self.app.preview_center, one_to_one=self.app.preview_one_to_one)
+        if view is None:
+            view, scale = (0, 0, width, height), VideoProcessor.fit_scale(width, height, canvas_w, canvas_h)
+        return view, scale, (width, height), (canvas_w, canvas_h)
+
+    def zoom_at(self, factor, x=None, y=None):
+        """Canvas 좌표 (x, y) 아래의 지점을 고정한 채 factor배 확대/축소 (좌표가 없으면 중앙)."""
+        if not self.app.video_path or not self.app.video_width:
+            return
+        view, scale, (width, height), (canvas_w, canvas_h) = self._current_view()
+        fit = VideoProcessor.fit_scale(width, height, canvas_w, canvas_h)
+        zoom = min(max(scale / fit * factor, 1.0), self.MAX_ZOOM)
+        x = canvas_w / 2.0 if x is None else x
+        y = canvas_h / 2.0 if y is None else y
+        # 커서 아래 프레임 좌표 (표시 영역은 Canvas 중앙에 배치됨)
+        u = view[0] + (x - (canvas_w - view[2] * scale) / 2.0) / scale
+        v = view[1] + (y - (canvas_h - view[3] * scale) / 2.0) / scale
+        new_scale = fit * zoom
+        self.app.preview_zoom = zoom
+        self.app.preview_one_to_one = False
+        self.app.preview_center = ((u + (canvas_w / 2.0 - x) / new_scale) / width,
+                                   (v + (canvas_h / 2.0 - y) / new_scale) / height)
+        self._changed()
+
+    def zoom_in(self):
+        self.zoom_at(self.ZOOM_STEP)
+
+    def zoom_out(self):
+        self.zoom_at(1 / self.ZOOM_STEP)
+
+    def one_to_one(self):
+        """현재 보이는 영역의 중심을 유지한 채 원본 1픽셀 = 화면 1픽셀로 보기."""
+        if not self.app.video_path or not self.app.video_width:
+            return
+        view, _scale, (width, height), _canvas = self._current_view()
+        self.app.preview_center = ((view[0] + view[2] / 2.0) / width, (view[1] + view[3] / 2.0) / height)
+        self.app.preview_one_to_one = True
+        self._changed()
+
+    def fit(self):
+        """전체가 보이도록 맞춤 보기로 되돌림."""
+        self.reset()
+        self._changed()
+
+    def reset(self):
+        """확대 상태 초기화 (새 파일/회전/크롭 변경 시, 다시 그리지 않음)."""
+        self.app.preview_zoom = 1.0
+        self.app.preview_center = (0.5, 0.5)
+        self.app.preview_one_to_one = False
+        self._drag_origin = None
+        self._update_label()
+
+    def _on_wheel(self, event, zoom_in):
+        """Ctrl+휠: 커서 위치 기준 확대/축소 (페이지 스크롤로 전파하지 않음)."""
+        self.zoom_at(self.ZOOM_STEP if zoom_in else 1 / self.ZOOM_STEP, event.x, event.y)
+        return "break"
+
+    def _on_drag_start(self, event):
+        self._drag_origin = (event.x, event.y)
+
+    def _on_drag(self, event):
+        """드래그한 만큼 보이는 영역 이동 (확대 중에만)."""
+        if self._drag_origin is None or not self.app.video_path or not self.app.video_width:
+            return
+        if self.app.preview_zoom <= 1.0 and not self.app.preview_one_to_one:
+            return
+        view, scale, (width, height), _canvas = self._current_view()
+        dx = event.x - self._drag_origin[0]
+        dy = event.y - self._drag_origin[1]
+        self._drag_origin = (event.x, event.y)
+        # 가장자리에서 더 밀리지 않도록 실제 보이는 영역 중심 기준으로 이동
+        self.app.preview_center = ((view[0] + view[2] / 2.0 - dx / scale) / width,
+                                   (view[1] + view[3] / 2.0 - dy / scale) / height)
+        self._changed()
+
+    def _changed(self):
+        self._update_label()
+        if self.app.video_path and not self.app.is_playing:
+            self.app.update_preview()
+
+    def _update_label(self):
+        if not hasattr(self.app, 'zoom_label'):
+            return
+        if self.app.preview_one_to_one:
+            text = "1:1"
+        elif self.app.preview_zoom <= 1.0:
+            text = "맞춤"
+        else:
+            text = f"{self.app.preview_zoom:.2f}x"
+        self.app.zoom_label.config(text=text)
@@ -1,5 +1,11 @@
 """구간 설정 관련 기능 모듈."""
 
+import bisect
+import threading
+
+from ..processors.scene_detector import SceneDetector
+from ..processors.auto_trim import AutoTrimmer
+
 
 class RangeController:
     """구간 설정 제어 클래스."""
@@ -11,12 +17,112 @@ class RangeController:
             app: VideoEditApp 인스턴스
         """
         self.app = app
+        self._scene_detector = None
+        # 장면 전환 프레임 번호 (0과 total_frames 포함, 정렬됨)
+        self.shot_boundaries = []
+    
+    def start_scene_analysis(self, video_path):
+        """장면 전환 백그라운드 분석 시작 (이전 분석은 취소)."""
+        if self._scene_detector is not None:
+            self._scene_detector.cancel()
+        self.shot_boundaries = []
+        self._set_scene_status("장면 분석 중...")
+        total = self.app.total_frames
+        detector = SceneDetector(
+            video_path, self.app.video_fps,
+            lambda cuts: self.app.root.after(0, self._apply_boundaries, detector, cuts),
+            lambda n: self.app.root.after(0, self._scene_progress, detector, n, total),
+        )
+        self._scene_detector = detector
+        detector.start()
+    
+    def _scene_progress(self, detector, analyzed, total):
+        """분석 진행률 표시 (Tk 스레드)."""
+        if detector is self._scene_detector and total > 0:
+            self._set_scene_status(f"장면 분석 중... {min(100, analyzed * 100 // total)}%")
+    
+    def _apply_boundaries(self, detector, cuts):
+        """분석 결과 반영 (Tk 스레드)."""
+        if detector is not self._scene_detector:
+            return  # 다른 파일로 바뀐 뒤 도착한 결과
+        self.shot_boundaries = sorted(set([0] + list(cuts) + [self.app.total_frames]))
+        self._set_scene_status(f"장면 전환 {len(cuts)}개")
+    
+    def _set_scene_status(self, text):
+        if hasattr(self.app, 'scene_status_label'):
+            self.app.scene_status_label.config(text=text)
+    
+    def _snap_enabled(self):
+        return (hasattr(self.app, 'snap_to_shot_var') and self.app.snap_to_shot_var.get()
+                and len(self.shot_boundaries) > 0)
+    
+    def nearest_boundary(self, frame):
+        """frame에 가장 가까운 장면 경계 프레임 (경계 정보가 없으면 frame 그대로)."""
+        bounds = self.shot_boundaries
+        if not bounds:
+            return frame
+        i = bisect.bisect_left(bounds, frame)
+        if i >= len(bounds):
+            return bounds[-1]
+        if i > 0 and frame - bounds[i - 1] <= bounds[i] - frame:
+            return bounds[i - 1]
+        return bounds[i]
+    
+    def auto_trim(self):
+        """앞/뒤 검은·정지 화면을 찾아 시작/종료 프레임 제안 (백그라운드)."""
+        if not self.app.video_path:
+            return
+        video_path = self.app.video_path
+        self._set_scene_status("자동 트림 분석 중...")
+        
+        def worker():
+            try:
+                proposal = AutoTrimmer(video_path).propose()
+            except (OSError, RuntimeError) as e:
+                self.app.root.after(0, self._set_scene_status, f"자동 트림 실패: {e}")
+                return
+            self.app.root.after(0, self._apply_trim_proposal, proposal)
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _apply_trim_proposal(self, proposal):
+        """자동 트림 결과를 구간에 반영 (Tk 스레드)."""
+        if proposal.video_path != self.app.video_path:
+            return
+        self.app.start_frame = proposal.start_frame
+        self.app.end_frame = min(proposal.end_frame, self.app.total_frames)
+        if self.app.video_fps > 0:
+            self.app.start_time = self.app.start_frame / self.app.video_fps
+            self.app.end_time = self.app.end_frame / self.app.video_fps
+        self._update_range_ui()
+        if self.app.current_frame < self.app.start_frame or self.app.current_frame >= self.app.end_frame:
+            self.app.playback_controller.seek_to_time(self.app.start_time)
+        if proposal.changed:
+            self._set_scene_status(f"자동 트림: {proposal.start_frame} ~ {proposal.end_frame} 프레임")
+        else:
+            self._set_scene_status("자동 트림: 잘라낼 구간 없음")
+    
+    def snap_range_to_shots(self):
+        """현재 시작/종료를 가장 가까운 장면 경계로 이동."""
+        if not self.shot_boundaries or self.app.video_fps <= 0:
+            return
+        start = self.nearest_boundary(self.app.start_frame)
+        end = self.nearest_boundary(self.app.end_frame)
+        if end <= start:
+            return
+        self.app.start_frame = start
+        self.app.end_frame = end
+        self.app.start_time = start / self.app.video_fps
+        self.app.end_time = end / self.app.video_fps
+        self._update_range_ui()
     
     def set_start_time(self, value_str):
         """시작 시간/프레임 설정."""
         try:
             if self.app.range_unit_mode == "frame":
                 frame_val = int(value_str)
+                if self._snap_enabled():
+                    frame_val = self.nearest_boundary(frame_val)
                 if frame_val < 0:
                     frame_val = 0
                 if frame_val >= self.app.end_frame:
@@ -31,6 +137,8 @@ class RangeController:
                     self.app.playback_controller.seek_to_time(self.app.current_time)
             else:
                 time_val = float(value_str)
+                if self._snap_enabled() and self.app.video_fps > 0:
+                    time_val = self.nearest_boundary(int(round(time_val * self.app.video_fps))) / self.app.video_fps
                 if time_val < 0:
                     time_val = 0
                 if time_val >= self.app.end_time:
@@ -41,6 +149,7 @@ class RangeController:
                     self.app.start_time_var.set(f"{self.app.start_time:.2f}")
                 if self.app.current_time < self.app.start_time:
                     self.app.playback_controller.seek_to_time(self.app.start_time)
+            self._notify_range_changed()
         except ValueError:
             self._update_range_ui()
     
@@ -49,6 +158,8 @@ class RangeController:
         try:
             if self.app.range_unit_mode == "frame":
                 frame_val = int(value_str)
+                if self._snap_enabled():
+                    frame_val = self.nearest_boundary(frame_val)
                 if frame_val > self.app.total_frames:
                     frame_val = self.app.total_frames
                 if frame_val <= self.app.start_frame:
@@ -63,6 +174,8 @@ class RangeController:
                     self.app.playback_controller.seek_to_time(self.app.current_time)
             else:
                 time_val = float(value_str)
+                if self._snap_enabled() and self.app.video_fps > 0:
+                    time_val = self.nearest_boundary(int(round(time_val * self.app.video_fps))) / self.app.video_fps
                 if time_val > self.app.video_duration:
                     time_val = self.app.video_duration
                 if time_val <= self.app.start_time:
@@ -73,9 +186,54 @@ class RangeController:
                     self.app.end_time_var.set(f"{self.app.end_time:.2f}")
                 if self.app.current_time > self.app.end_time:
                     self.app.playback_controller.seek_to_time(self.app.end_time)
+            self._notify_range_changed()
         except ValueError:
             self._update_range_ui()
     
+    def add_cut_range(self):
+        """현재 시작/종료 구간을 컷 리스트(남길 구간 목록)에 추가 (겹치는 구간은 합침)."""
+        if self.app.end_frame <= self.app.start_frame:
+            return
+        ranges = sorted(self.app.cut_list + [(self.app.start_frame, self.app.end_frame)])
+        merged = [ranges[0]]
+        for start, end in ranges[1:]:
+            if start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        self.app.cut_list = merged
+        self._update_cut_list_ui()
+    
+    def remove_last_cut_range(self):
+        """컷 리스트의 마지막 구간 삭제."""
+        if self.app.cut_list:
+            self.app.cut_list = self.app.cut_list[:-1]
+            self._update_cut_list_ui()
+    
+    def clear_cut_list(self):
+        """컷 리스트 비우기 (시작/종료 단일 구간으로 내보냄)."""
+        self.app.cut_list = []
+        self._update_cut_list_ui()
+    
+    def cut_list_times(self):
+        """컷 리스트를 초 단위 [(시작, 종료), ...]로 (비어 있으면 빈 목록)."""
+        fps = self.app.video_fps
+        if fps <= 0:
+            return []
+        return [(start / fps, end / fps) for start, end in getattr(self.app, 'cut_list', [])]
+    
+    def _update_cut_list_ui(self):
+        if hasattr(self.app, 'cut_list_label'):
+            cut_list = self.app.cut_list
+            if not cut_list:
+                text = "없음 (시작~종료 구간 사용)"
+            elif self.app.range_unit_mode == "frame":
+                text = ", ".join(f"{start}~{end}" for start, end in cut_list)
+            else:
+                text = ", ".join(f"{start:.2f}~{end:.2f}" for start, end in self.cut_list_times())
+            self.app.cut_list_label.config(text=text)
+        self._notify_range_changed()
+    
     def set_range_unit_mode(self, mode):
         """구간 설정 단위 모드 변경."""
         self.app.range_unit_mode = mode
@@ -101,3 +259,9 @@ class RangeController:
                 self.app.start_label.config(text="시작 시간(초):")
             if hasattr(self.app, 'end_label'):
                 self.app.end_label.config(text="종료 시간(초):")
+        self._update_cut_list_ui()
+    
+    def _notify_range_changed(self):
+        """구간 변경을 구간 표시 위젯(파형 스트립)에 반영."""
+        if hasattr(self.app, 'waveform_controller'):
+            self.app.waveform_controller.redraw_range()
@@ -0,0 +1,103 @@
+"""오디오 파형 스트립 표시 모듈."""
+
+import numpy as np
+
+from ..processors.waveform import WaveformWorker
+
+
+class WaveformController:
+    """필름스트립 아래 오디오 파형과 구간 표시를 관리하는 클래스."""
+
+    WAVE_COLOR = "#4fc3f7"
+    OUTSIDE_RANGE_COLOR = "#000000"
+
+    def __init__(self, app):
+        """초기화.
+
+        Args:
+            app: VideoEditApp 인스턴스
+        """
+        self.app = app
+        self._worker = None
+        self._finished = False
+        self.pyramid = None
+
+    def load(self, video_path):
+        """새 파일의 파형 계산 시작 (이전 작업은 취소)."""
+        self.clear()
+        worker = WaveformWorker(
+            video_path,
+            lambda pyramid: self.app.root.after(0, self._apply_pyramid, worker, pyramid)
+        )
+        self._worker = worker
+        worker.start()
+
+    def clear(self):
+        """계산 취소 및 스트립 비우기."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        self._finished = False
+        self.pyramid = None
+        if hasattr(self.app, 'waveform_canvas'):
+            self.app.waveform_canvas.delete("all")
+
+    def _apply_pyramid(self, worker, pyramid):
+        """워커 결과 반영 (Tk 스레드)."""
+        if worker is not self._worker:
+            return  # 다른 파일로 바뀐 뒤 도착한 결과
+        self.pyramid = pyramid
+        self._finished = True
+        self.redraw()
+
+    def redraw(self):
+        """파형과 구간 표시 다시 그리기."""
+        if not hasattr(self.app, 'waveform_canvas'):
+            return
+        canvas = self.app.waveform_canvas
+        canvas.delete("all")
+        canvas_w = canvas.winfo_width()
+        canvas_h = canvas.winfo_height()
+        if canvas_w <= 2 or canvas_h <= 2 or self.app.video_duration <= 0:
+            return
+        if self.pyramid is None:
+            if self._finished:
+                canvas.create_text(canvas_w // 2, canvas_h // 2, text="오디오 없음", fill="gray")
+            return
+
+        mins, maxs = self.pyramid.peaks(0.0, self.app.video_duration, canvas_w)
+        mid = canvas_h / 2.0
+        half = canvas_h / 2.0 - 1
+        xs = np.arange(canvas_w, dtype=np.float32)
+        top = mid - maxs * half
+        bottom = mid - mins * half
+        # 윗선(왼→오) + 아랫선(오→왼)을 하나의 다각형으로 그림
+        points = np.concatenate([
+            np.stack([xs, top], axis=1),
+            np.stack([xs[::-1], bottom[::-1]], axis=1),
+        ]).ravel().tolist()
+        canvas.create_polygon(points, fill=self.WAVE_COLOR, outline=self.WAVE_COLOR, tags=("wave",))
+        self.redraw_range()
+
+    def redraw_range(self):
+        """선택 구간(컷 리스트가 있으면 남길 구간들) 밖을 어둡게 표시."""
+        if not hasattr(self.app, 'waveform_canvas'):
+            return
+        canvas = self.app.waveform_canvas
+        canvas.delete("range")
+        canvas_w = canvas.winfo_width()
+        canvas_h = canvas.winfo_height()
+        duration = self.app.video_duration
+        if self.pyramid is None or duration <= 0 or canvas_w <= 2:
+            return
+        keep = self.app.range_controller.cut_list_times() or [(self.app.start_time, self.app.end_time)]
+        edges = [(start / duration * canvas_w, end / duration * canvas_w) for start, end in keep]
+        gaps = [(0, edges[0][0])] + [(edges[i][1], edges[i + 1][0]) for i in range(len(edges) - 1)]
+        gaps.append((edges[-1][1], canvas_w))
+        for a, b in gaps:
+            if b - a >= 1:
+                canvas.create_rectangle(a, 0, b, canvas_h, fill=self.OUTSIDE_RANGE_COLOR,
+                                        stipple="gray50", outline="", tags=("range",))
+        for x0, x1 in edges:
+            for x in (x0, x1):
+                canvas.create_line(x, 0, x, canvas_h, fill="#ffcc00", tags=("range",))
@@ -17,6 +17,14 @@ if __name__ == "__main__":
     from controllers.export import ExportController
     from handlers.file_handler import FileHandler
     from controllers.range_controller import RangeController
+    from controllers.filmstrip import FilmstripController
+    from controllers.waveform import WaveformController
+    from controllers.loader import LoadController
+    from controllers.preview_zoom import PreviewZoomController
+    from processors.perf_monitor import PerfMonitor
+    from processors.frame_cache import FrameCache
+    from processors.prefetcher import FramePrefetcher
+    from processors.source_stager import SourceStager
 else:
     # 패키지로 import 시 상대 import
     from .handlers.drag_drop import DragDropHandler
@@ -26,6 +34,14 @@ else:
     from .controllers.export import ExportController
     from .handlers.file_handler import FileHandler
     from .controllers.range_controller import RangeController
+    from .controllers.filmstrip import FilmstripController
+    from .controllers.waveform import WaveformController
+    from .controllers.loader import LoadController
+    from .controllers.preview_zoom import PreviewZoomController
+    from .processors.perf_monitor import PerfMonitor
+    from .processors.frame_cache import FrameCache
+    from .processors.prefetcher import FramePrefetcher
+    from .processors.source_stager import SourceStager
 
 
 class VideoEditApp:
@@ -39,6 +55,11 @@ class VideoEditApp:
         self.video_path = None
         self.video_clip = None
         self.rotation_angle = 0
+        self.crop_rect = None  # 회전된 프레임 기준 크롭 영역 (x, y, w, h), 미리보기/내보내기 공통
+        # 미리보기 확대 상태 (맞춤 기준 배율, 보이는 영역 중심 0~1, 원본 1:1 보기)
+        self.preview_zoom = 1.0
+        self.preview_center = (0.5, 0.5)
+        self.preview_one_to_one = False
         self.output_path = None
 
         self._preview_image_tk = None
@@ -51,9 +72,12 @@ class VideoEditApp:
         self.video_duration = 0.0
         self.video_fps = 30.0
         self.total_frames = 0
+        self.video_width = 0
+        self.video_height = 0
         self.current_frame = 0
         self._play_after_id = None
-        self._cap = None  # OpenCV VideoCapture
+        self._decoders = {}  # 미리보기 디코더 (백엔드 이름 -> DecoderBackend)
+        self.decoder_choice = {}  # 용도별 디코더 백엔드 (파일 로드 시 측정)
         
         # 구간 설정
         self.start_time = 0.0
@@ -61,6 +85,15 @@ class VideoEditApp:
         self.start_frame = 0
         self.end_frame = 0
         self.range_unit_mode = "frame"  # "frame" or "time"
+        self.cut_list = []  # 한 번에 내보낼 남길 구간 [(시작 프레임, 종료 프레임), ...]
+        
+        # 성능 계측 (HUD/리포트)
+        self.perf_monitor = PerfMonitor()
+        self.show_perf_hud = False
+        
+        # 미리보기 프레임 캐시 및 유휴 시간 프리페치
+        self.frame_cache = FrameCache()
+        self.prefetcher = FramePrefetcher(self.frame_cache)
         
         # 모듈 초기화
         self.drag_drop_handler = DragDropHandler(self)
@@ -69,6 +102,10 @@ class VideoEditApp:
         self.export_controller = ExportController(self)
         self.file_handler = FileHandler(self)
         self.range_controller = RangeController(self)
+        self.filmstrip_controller = FilmstripController(self)
+        self.waveform_controller = WaveformController(self)
+        self.load_controller = LoadController(self)
+        self.preview_zoom_controller = PreviewZoomController(self)
         
         # 드래그 앤 드롭 설정 (가능하면 root에 먼저 등록)
         self.drag_drop_handler.setup_drag_drop()
@@ -102,12 +139,16 @@ class VideoEditApp:
         self.file_handler.select_video()
             
     def load_video_info(self):
-        """비디오 정보 로드."""
+        """비디오 정보 로드 (백그라운드, 단계별로 UI 반영)."""
         # 기존 재생 중지
         self.playback_controller.stop_playback()
-        from .processors.video_processor import VideoProcessor
-        VideoProcessor.load_video_info(self.video_path, self)
+        self.load_controller.load(self.video_path)
+    
+    def on_video_info_loaded(self):
+        """메타데이터 로드 직후 구간 초기화 및 백그라운드 분석 시작."""
         # 구간 초기화 (전체 구간)
+        self.cut_list = []
+        self.export_controller.clear_crop()
         if self.video_duration > 0 and self.total_frames > 0:
             self.start_time = 0.0
             self.end_time = self.video_duration
@@ -124,6 +165,17 @@ class VideoEditApp:
                 else:
                     self.end_time_var.set(f"{self.video_duration:.2f}")
             self.range_controller._update_range_ui()
+            
+            # 타임라인 썸네일 백그라운드 추출
+            self.filmstrip_controller.load(self.video_path, self.video_duration,
+                                           self.video_width, self.video_height)
+            # 오디오 파형 백그라운드 계산
+            self.waveform_controller.load(self.video_path)
+            # 장면 전환 백그라운드 분석 (구간 스냅용)
+            self.range_controller.start_scene_analysis(self.video_path)
+            # 재생 위치 주변 프레임 프리페치
+            self.prefetcher.set_source(self.video_path, self.total_frames)
+            self.playback_controller.request_prefetch()
         
         # 시간 및 프레임 정보 즉시 업데이트
         self.playback_controller._update_time_label()
@@ -143,8 +195,11 @@ class VideoEditApp:
             self.rotation_angle = (self.rotation_angle + angle) % 360
             
         self.rotation_label.config(text=f"회전: {self.rotation_angle}°")
+        # 크롭 좌표는 회전된 프레임 기준이므로 회전이 바뀌면 해제
+        self.export_controller.clear_crop()
         if self.video_path:
             self.update_preview()
+            self.filmstrip_controller.redraw()
     
     def update_output_path(self):
         """출력 경로 자동 업데이트."""
@@ -190,6 +245,51 @@ class VideoEditApp:
         """구간 설정 단위 모드 변경."""
         self.range_controller.set_range_unit_mode(mode)
     
+    def set_playback_speed(self, value_str):
+        """재생 배속 변경 (예: "2x")."""
+        try:
+            speed = float(str(value_str).rstrip('x'))
+        except ValueError:
+            return
+        self.playback_controller.set_speed(speed)
+    
+    def toggle_reverse_playback(self):
+        """역재생 토글."""
+        self.playback_controller.set_reverse(self.reverse_var.get())
+    
+    def toggle_loop_buffer(self):
+        """구간 반복 사전 렌더링 버퍼 토글."""
+        self.playback_controller.set_loop_buffer(self.loop_buffer_var.get())
+    
+    def toggle_staging(self):
+        """원본 로컬 스테이징 토글 (미리보기 디코더를 다시 열어 바로 적용)."""
+        SourceStager.set_enabled(self.staging_var.get())
+        VideoProcessor.release_capture(self)
+        if self.video_path and not self.is_playing:
+            self.update_preview()
+    
+    def toggle_perf_hud(self):
+        """미리보기 성능 HUD 표시 토글."""
+        self.show_perf_hud = bool(self.perf_hud_var.get())
+        if self.video_path:
+            self.update_preview()
+    
+    def save_perf_report(self):
+        """성능 계측 리포트를 JSON 파일로 저장."""
+        from tkinter import filedialog, messagebox
+        file_path = filedialog.asksaveasfilename(
+            title="성능 리포트 저장",
+            defaultextension=".json",
+            filetypes=[("JSON 파일", "*.json"), ("모든 파일", "*.*")],
+            initialfile="perf_report.json"
+        )
+        if not file_path:
+            return
+        try:
+            self.perf_monitor.dump_json(file_path)
+        except OSError as e:
+            messagebox.showerror("오류", f"리포트를 저장할 수 없습니다:\n{str(e)}")
+    
     def _update_range_ui(self):
         """구간 설정 UI 업데이트."""
         self.range_controller._update_range_ui()
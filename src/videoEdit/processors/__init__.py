@@ -1,5 +1,37 @@
 """프로세서 모듈."""
 
 from .video_processor import VideoProcessor
+from .perf_monitor import PerfMonitor
+from .export_engine import ExportEngine, ExportSpec
+from .ffmpeg_utils import FFmpegUtils
+from .media_cache import MediaCache
+from .thumbnail_worker import ThumbnailWorker
+from .waveform import WaveformPyramid, WaveformWorker
+from .scene_detector import SceneDetector
+from .auto_trim import AutoTrimmer, TrimProposal
+from .frame_cache import FrameCache
+from .prefetcher import FramePrefetcher
+from .keyframe_index import KeyframeIndex
+from .reverse_reader import ReverseReader
+from .loop_buffer import LoopBuffer
+from .video_loader import VideoLoader
+from .decoders import (DecoderBackend, OpenCVDecoder, FFmpegPipeDecoder, PyAVDecoder, DecoderSelector,
+                       open_decoder, available_decoders)
+from .ffmpeg_writer import FFmpegWriter
+from .segmented_export import SegmentedExport
+from .export_cache import ExportCache
+from .watch_folder import FolderPreset, JobJournal, WatchFolderDaemon
+from .encoder_tuner import EncoderTuner
+from .frame_extractor import FrameExtractor
+from .source_stager import SourceStager, StagedStream
+from .export_telemetry import ExportTelemetry
 
-__all__ = ['VideoProcessor']
+__all__ = ['VideoProcessor', 'PerfMonitor', 'ExportEngine', 'ExportSpec', 'FFmpegUtils', 'MediaCache',
+           'ThumbnailWorker', 'WaveformPyramid', 'WaveformWorker',
+           'SceneDetector', 'AutoTrimmer', 'TrimProposal', 'FrameCache', 'FramePrefetcher',
+           'KeyframeIndex', 'ReverseReader', 'LoopBuffer', 'VideoLoader',
+           'DecoderBackend', 'OpenCVDecoder', 'FFmpegPipeDecoder', 'PyAVDecoder', 'DecoderSelector',
+           'open_decoder', 'available_decoders', 'FFmpegWriter', 'SegmentedExport',
+           'ExportCache', 'FolderPreset', 'JobJournal', 'WatchFolderDaemon', 'EncoderTuner',
+           'FrameExtractor', 'SourceStager', 'StagedStream',
+           'ExportTelemetry']
@@ -0,0 +1,183 @@
+"""앞/뒤 검은 화면·정지 화면 자동 트림 분석 모듈."""
+
+from dataclasses import dataclass, asdict
+
+import cv2
+import numpy as np
+
+from .ffmpeg_utils import FFmpegUtils
+
+
+@dataclass
+class TrimProposal:
+    """자동 트림 제안 결과.
+
+    Attributes:
+        video_path: 원본 경로
+        start_frame: 제안 시작 프레임
+        end_frame: 제안 종료 프레임 (exclusive, RangeController와 동일)
+        total_frames: 전체 프레임 수
+        fps: 원본 FPS
+    """
+
+    video_path: str
+    start_frame: int
+    end_frame: int
+    total_frames: int
+    fps: float
+
+    @property
+    def start_time(self):
+        return self.start_frame / self.fps if self.fps > 0 else 0.0
+
+    @property
+    def end_time(self):
+        return self.end_frame / self.fps if self.fps > 0 else 0.0
+
+    @property
+    def changed(self):
+        """트림할 구간이 있는지 여부."""
+        return self.start_frame > 0 or self.end_frame < self.total_frames
+
+    def to_dict(self):
+        data = asdict(self)
+        data['start_time'] = round(self.start_time, 3)
+        data['end_time'] = round(self.end_time, 3)
+        return data
+
+
+class AutoTrimmer:
+    """파일 양 끝에서 안쪽으로만 스캔해 검은/단색/정지 프레임 구간을 찾는 클래스.
+
+    전체를 디코딩하지 않고 WINDOW_SECONDS 단위 블록을 축소 그레이로 읽어
+    살아있는 프레임이 나올 때까지만 안쪽으로 진행한다.
+    """
+
+    ANALYSIS_W = 96
+    ANALYSIS_H = 54
+    # 평균 밝기가 이보다 낮으면 검은 화면
+    BLACK_LUMA = 20.0
+    # 표준편차가 이보다 낮으면 단색 화면 (페이드/슬레이트)
+    FLAT_STD = 4.0
+    # 직전 프레임과의 평균 절대차가 이보다 작으면 정지 화면
+    FROZEN_DIFF = 0.6
+    # 이보다 짧은 죽은 구간은 트림하지 않음
+    MIN_DEAD_SECONDS = 0.2
+    WINDOW_SECONDS = 5.0
+    # 각 끝에서 최대 스캔 비율
+    MAX_SCAN_FRACTION = 0.5
+
+    def __init__(self, video_path):
+        """초기화.
+
+        Args:
+            video_path: 원본 비디오 경로
+        """
+        self.video_path = video_path
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            raise OSError(f"비디오 파일을 열 수 없습니다: {video_path}")
+        self.fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self.total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        cap.release()
+
+    def _read_block(self, start_frame, count):
+        """start_frame부터 최대 count 프레임을 축소 그레이로 읽기 → (n, h, w)."""
+        w, h = self.ANALYSIS_W, self.ANALYSIS_H
+        # 반 프레임 앞에서 정확한 seek → 첫 출력 프레임이 start_frame
+        seek = max(0.0, (start_frame - 0.5) / self.fps)
+        result = FFmpegUtils.run([
+            '-loglevel', 'error', '-skip_loop_filter', 'all',
+            '-ss', f"{seek:.6f}", '-i', self.video_path,
+            '-an', '-frames:v', str(count),
+            '-vf', f"scale={w}:{h}:flags=fast_bilinear,format=gray",
+            '-f', 'rawvideo', '-pix_fmt', 'gray', '-',
+        ])
+        n = len(result.stdout) // (w * h)
+        return np.frombuffer(result.stdout[:n * w * h], dtype=np.uint8).reshape(n, h, w)
+
+    @staticmethod
+    def frame_flags(frames):
+        """프레임별 (보이는 화면 여부, 직전 프레임과 달라졌는지 여부).
+
+        visible: 검은 화면/단색 화면이 아님
+        changed: frames[i-1]과의 평균 절대차가 FROZEN_DIFF 이상 (frames[0]은 False)
+        """
+        flat = frames.reshape(frames.shape[0], -1).astype(np.float32)
+        mean = flat.mean(axis=1)
+        std = flat.std(axis=1)
+        visible = (mean >= AutoTrimmer.BLACK_LUMA) & (std >= AutoTrimmer.FLAT_STD)
+        diffs = np.abs(np.diff(flat, axis=0)).mean(axis=1)
+        changed = np.concatenate([[False], diffs >= AutoTrimmer.FROZEN_DIFF])
+        return visible, changed
+
+    def _scan_head(self, window, limit):
+        """앞에서부터 내용이 시작되는 프레임 찾기.
+
+        보이는 화면이면서 바로 다음 프레임에서 화면이 바뀌는 첫 프레임을 시작으로 본다
+        (검은 화면 뒤에 이어지는 정지 화면도 함께 트림됨).
+        """
+        start = 0
+        while start < limit:
+            # 다음 블록과 한 프레임 겹쳐 읽어 블록 경계의 변화도 판정
+            frames = self._read_block(start, min(window, limit - start) + 1)
+            if frames.shape[0] < 2:
+                break
+            visible, changed = self.frame_flags(frames)
+            hits = np.flatnonzero(visible[:-1] & changed[1:])
+            if hits.size:
+                return start + int(hits[0])
+            start += frames.shape[0] - 1
+        return 0
+
+    def _scan_tail(self, window, limit):
+        """뒤에서부터 내용이 끝나는 프레임 찾기 (exclusive 종료 프레임 반환).
+
+        보이는 화면이면서 직전 프레임에서 화면이 바뀐 마지막 프레임까지 유지한다.
+        """
+        end = self.total_frames
+        while end > limit:
+            block_start = max(limit, end - window)
+            # 첫 프레임의 변화 판정을 위해 한 프레임 앞부터 읽음
+            read_start = max(0, block_start - 1)
+            frames = self._read_block(read_start, end - read_start)
+            if frames.shape[0] < 2:
+                break
+            visible, changed = self.frame_flags(frames)
+            hits = np.flatnonzero(visible & changed)
+            if hits.size:
+                return read_start + int(hits[-1]) + 1
+            end = block_start
+        return self.total_frames
+
+    def propose(self):
+        """트림 제안 계산.
+
+        Returns:
+            TrimProposal
+        """
+        total = self.total_frames
+        if total <= 1:
+            return TrimProposal(self.video_path, 0, max(total, 0), total, self.fps)
+        window = max(2, int(round(self.WINDOW_SECONDS * self.fps)))
+        scan_limit = max(1, int(total * self.MAX_SCAN_FRACTION))
+
+        start = self._scan_head(window, scan_limit)
+        end = self._scan_tail(window, max(start + 1, total - scan_limit))
+
+        min_dead = int(round(self.MIN_DEAD_SECONDS * self.fps))
+        if start < min_dead:
+            start = 0
+        if total - end < min_dead:
+            end = total
+        if end <= start:
+            start, end = 0, total
+        return TrimProposal(self.video_path, start, end, total, self.fps)
+
+    @staticmethod
+    def analyze(video_path):
+        """프로세스 풀에서 쓰기 위한 함수형 진입점 (딕셔너리 반환)."""
+        try:
+            return AutoTrimmer(video_path).propose().to_dict()
+        except (OSError, RuntimeError) as e:
+            return {'video_path': video_path, 'error': str(e)}
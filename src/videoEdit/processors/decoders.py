@@ -0,0 +1,430 @@
+"""교체 가능한 비디오 디코더 백엔드 모듈."""
+
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+
+import cv2
+import numpy as np
+
+from .ffmpeg_utils import FFmpegUtils
+from .media_cache import MediaCache
+from .source_stager import SourceStager
+
+
+class DecoderBackend(ABC):
+    """디코더 백엔드 공통 인터페이스 (cv2.VideoCapture와 같은 seek/grab/read 방식).
+
+    프레임 번호는 OpenCV의 CAP_PROP_POS_FRAMES와 같은 표시 순서 기준이며,
+    position은 다음에 read()/grab()으로 얻을 프레임 번호다 (모르면 -1).
+    """
+
+    name = ''
+
+    def __init__(self, video_path):
+        """초기화.
+
+        Args:
+            video_path: 비디오 경로
+
+        Raises:
+            OSError: 파일을 열 수 없는 경우
+        """
+        self.video_path = video_path
+        self.fps = 30.0
+        self.frame_count = 0
+        self.width = 0
+        self.height = 0
+        self.position = 0
+
+    @staticmethod
+    def available():
+        """이 환경에서 사용 가능한지 여부."""
+        return True
+
+    def _probe(self):
+        """OpenCV로 메타데이터 읽기 (모든 백엔드의 프레임 번호 기준을 맞추기 위함)."""
+        cap = cv2.VideoCapture(SourceStager.local_path(self.video_path))
+        if not cap.isOpened():
+            raise OSError(f"비디오 파일을 열 수 없습니다: {self.video_path}")
+        self.fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self.frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        self.width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        cap.release()
+
+    @abstractmethod
+    def seek(self, frame_number):
+        """다음 read()가 frame_number를 반환하도록 위치 이동."""
+
+    def grab(self):
+        """다음 프레임을 디코딩만 하고 버림 (성공 여부 반환)."""
+        ret, _ = self.read()
+        return ret
+
+    def set_decimation(self, step, origin=0):
+        """앞으로 origin + floor(k * step)번 프레임(k = 0, 1, ...)만 read()한다는 힌트.
+
+        백엔드가 그 외 프레임의 변환을 디코딩 단계에서 건너뛰도록 할 수 있다.
+        기본 구현은 무시한다 (grab()이 이미 변환을 하지 않는 백엔드).
+
+        Args:
+            step: 프레임 간격 (Fraction, None이면 해제)
+            origin: 간격을 세기 시작하는 프레임 번호
+        """
+
+    @abstractmethod
+    def read(self):
+        """다음 프레임 읽기 → (성공 여부, BGR 프레임)."""
+
+    def close(self):
+        """디코더 해제."""
+
+
+class OpenCVDecoder(DecoderBackend):
+    """cv2.VideoCapture 백엔드."""
+
+    name = 'opencv'
+
+    def __init__(self, video_path):
+        super().__init__(video_path)
+        # 스테이징 사용 시 로컬 사본(복사 중이면 복사된 구간)에서 읽음
+        self._cap, self._source_stream = SourceStager.open_capture(video_path)
+        if not self._cap.isOpened():
+            self.close()
+            raise OSError(f"비디오 파일을 열 수 없습니다: {video_path}")
+        self.fps = self._cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self.frame_count = int(self._cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        self.width = int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+    def seek(self, frame_number):
+        self._cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        self.position = frame_number
+
+    def grab(self):
+        ret = self._cap.grab()
+        self.position = self.position + 1 if ret and self.position >= 0 else -1
+        return ret
+
+    def read(self):
+        ret, frame = self._cap.read()
+        if not ret or frame is None:
+            self.position = -1
+            return False, None
+        if self.position >= 0:
+            self.position += 1
+        return True, frame
+
+    def close(self):
+        if self._source_stream is None:
+            self._cap.release()
+            return
+        # 파일 객체 입력의 release()는 GIL 없이 스트림을 호출하므로 참조를 놓아 해제한 뒤 스트림을 닫음
+        self._cap = cv2.VideoCapture()
+        self._source_stream.close()
+
+
+class FFmpegPipeDecoder(DecoderBackend):
+    """ffmpeg 프로세스의 rawvideo 파이프 백엔드.
+
+    seek은 프로세스를 정확한 -ss 위치로 다시 시작하므로 느리지만,
+    순차 읽기는 ffmpeg의 멀티스레드 디코딩을 그대로 사용한다.
+    set_decimation()이 지정되면 select 필터로 필요 없는 프레임을 BGR 변환 전에 버리고,
+    그 프레임의 grab()은 파이프를 읽지 않고 위치만 옮긴다.
+    """
+
+    name = 'ffmpeg'
+
+    def __init__(self, video_path):
+        super().__init__(video_path)
+        self._probe()
+        self._proc = None
+        self._frame_bytes = self.width * self.height * 3
+        self._decimation = None  # (분자, 분모, origin)
+
+    def _stop(self):
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.stdout.close()
+            self._proc.wait()
+            self._proc = None
+
+    def seek(self, frame_number):
+        self._stop()
+        args = []
+        if frame_number > 0:
+            # 반 프레임 앞에서 정확한 seek → 첫 출력 프레임이 frame_number
+            args += ['-ss', f"{(frame_number - 0.5) / self.fps:.6f}"]
+        # ffmpeg는 파일 객체를 받지 않으므로 스테이징은 복사가 끝난 사본만 사용
+        args += ['-i', SourceStager.local_path(self.video_path), '-an', '-fps_mode', 'passthrough']
+        if self._decimation is not None:
+            args += ['-vf', self._select_filter(frame_number)]
+        args += ['-f', 'rawvideo', '-pix_fmt', 'bgr24', '-']
+        self._proc = FFmpegUtils.open_pipe(args)
+        self.position = frame_number
+
+    def set_decimation(self, step, origin=0):
+        decimation = None if step is None else (step.numerator, step.denominator, origin)
+        if decimation != self._decimation:
+            self._decimation = decimation
+            # 다음 read()에서 현재 위치부터 새 필터로 다시 시작
+            self._stop()
+
+    def _selected(self, frame_number):
+        """frame_number가 decimation 간격에 포함되는지 (정수 연산, select 필터와 같은 식)."""
+        p, q, origin = self._decimation
+        j = frame_number - origin
+        return j >= 0 and (j * q + p - 1) // p * p < (j + 1) * q
+
+    def _select_filter(self, first_frame):
+        """_selected()와 같은 조건의 select 필터 (n은 first_frame부터 0)."""
+        p, q, origin = self._decimation
+        j = f"(n+{first_frame - origin})"
+        return f"select='gte({j},0)*lt(floor(({j}*{q}+{p - 1})/{p})*{p},({j}+1)*{q})'"
+
+    def grab(self):
+        if self._decimation is not None and self.position >= 0 and not self._selected(self.position):
+            # select 필터가 이미 버린 프레임
+            self.position += 1
+            return True
+        return super().grab()
+
+    def read(self):
+        if self._decimation is not None and self.position >= 0 and not self._selected(self.position):
+            # 간격 밖 프레임을 요청하면 필터 없이 다시 시작
+            self.set_decimation(None)
+        if self._proc is None:
+            if self.position < 0:
+                return False, None
+            self.seek(self.position)
+        data = self._proc.stdout.read(self._frame_bytes)
+        if len(data) < self._frame_bytes:
+            self.position = -1
+            self._stop()
+            return False, None
+        self.position += 1
+        return True, np.frombuffer(data, dtype=np.uint8).reshape(self.height, self.width, 3)
+
+    def close(self):
+        self._stop()
+
+
+class PyAVDecoder(DecoderBackend):
+    """PyAV(libav* 바인딩) 백엔드 (av 패키지가 설치된 경우에만 사용)."""
+
+    name = 'pyav'
+
+    def __init__(self, video_path):
+        super().__init__(video_path)
+        import av
+        self._probe()
+        # PyAV 14부터 AVError가 없어지고 FFmpegError만 남음
+        self._error = getattr(av, 'FFmpegError', None) or getattr(av, 'AVError', Exception)
+        self._source = SourceStager.source_for(video_path)
+        try:
+            self._container = av.open(self._source)
+        except self._error as e:
+            if not isinstance(self._source, str):
+                self._source.close()
+            raise OSError(str(e)) from e
+        self._stream = self._container.streams.video[0]
+        self._stream.thread_type = 'AUTO'
+        self._frames = self._container.decode(self._stream)
+        self._skip_before = None
+
+    @staticmethod
+    def available():
+        try:
+            import av  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def seek(self, frame_number):
+        stream = self._stream
+        target = frame_number / self.fps
+        start = float(stream.start_time * stream.time_base) if stream.start_time is not None else 0.0
+        # 이전 키프레임으로 이동한 뒤 목표 프레임 전까지는 디코딩 후 버림
+        self._container.seek(int((start + target) / stream.time_base), stream=stream, backward=True)
+        self._frames = self._container.decode(stream)
+        self._skip_before = start + target - 0.5 / self.fps
+        self.position = frame_number
+
+    def _next(self):
+        """다음 프레임 (끝이거나 디코딩 오류면 None, cv2.VideoCapture.read()처럼 예외를 내지 않음)."""
+        try:
+            for frame in self._frames:
+                if self._skip_before is not None and frame.time is not None and frame.time < self._skip_before:
+                    continue
+                self._skip_before = None
+                return frame
+        except self._error:
+            pass
+        return None
+
+    def grab(self):
+        frame = self._next()
+        if frame is None:
+            self.position = -1
+            return False
+        self.position += 1
+        return True
+
+    def read(self):
+        frame = self._next()
+        if frame is None:
+            self.position = -1
+            return False, None
+        self.position += 1
+        return True, frame.to_ndarray(format='bgr24')
+
+    def close(self):
+        self._container.close()
+        if not isinstance(self._source, str):
+            self._source.close()
+
+
+DECODER_BACKENDS = {cls.name: cls for cls in (OpenCVDecoder, FFmpegPipeDecoder, PyAVDecoder)}
+
+
+def available_decoders():
+    """사용 가능한 백엔드 이름 목록."""
+    return [name for name, cls in DECODER_BACKENDS.items() if cls.available()]
+
+
+def open_decoder(video_path, backend=None):
+    """백엔드 이름으로 디코더 열기 (없거나 사용할 수 없으면 OpenCV)."""
+    cls = DECODER_BACKENDS.get(backend or '')
+    if cls is None or not cls.available():
+        cls = OpenCVDecoder
+    return cls(video_path)
+
+
+class DecoderSelector:
+    """코덱/해상도별 마이크로 벤치마크로 용도별(seek/순차) 가장 빠른 백엔드를 고르는 클래스.
+
+    측정 결과는 캐시 디렉터리의 JSON에 코덱·해상도 단위로 저장되므로 같은 종류의
+    파일은 다시 측정하지 않는다. VIDEOEDIT_DECODER 환경변수로 백엔드를 고정할 수 있다.
+    """
+
+    CACHE_KIND = 'decoders'
+    ROLES = ('seek', 'sequential')
+    SEEK_SAMPLES = (0.2, 0.45, 0.7, 0.9)
+    SEQUENTIAL_FRAMES = 30
+
+    _lock = threading.Lock()
+    _profile_keys = {}
+
+    @staticmethod
+    def override():
+        """환경변수로 고정한 백엔드 이름 (없으면 None)."""
+        name = os.environ.get('VIDEOEDIT_DECODER', '').strip().lower()
+        return name if name in DECODER_BACKENDS else None
+
+    @classmethod
+    def profile_key(cls, video_path):
+        """코덱 FourCC와 해상도로 만든 측정 결과 키 (파일별로 한 번만 조회)."""
+        source_key = MediaCache.source_key(video_path)
+        key = cls._profile_keys.get(source_key)
+        if key is not None:
+            return key
+        cap = cv2.VideoCapture(video_path)
+        fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        cap.release()
+        codec = ''.join(chr((fourcc >> (8 * i)) & 0xFF) for i in range(4)).strip('\x00 ') or 'unknown'
+        key = f"{codec}_{width}x{height}"
+        cls._profile_keys[source_key] = key
+        return key
+
+    @classmethod
+    def _cache_path(cls):
+        return os.path.join(MediaCache.cache_dir(cls.CACHE_KIND), 'profiles.json')
+
+    @classmethod
+    def _load_profiles(cls):
+        try:
+            with open(cls._cache_path(), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def measure(cls, video_path, backend):
+        """백엔드 하나의 seek 1회 평균(ms)과 순차 읽기 프레임당 평균(ms)."""
+        decoder = open_decoder(video_path, backend)
+        try:
+            total = max(1, decoder.frame_count)
+            start = time.perf_counter()
+            for fraction in cls.SEEK_SAMPLES:
+                decoder.seek(int(total * fraction))
+                decoder.read()
+            seek_ms = (time.perf_counter() - start) * 1000.0 / len(cls.SEEK_SAMPLES)
+
+            decoder.seek(int(total * 0.3))
+            decoder.read()
+            start = time.perf_counter()
+            count = 0
+            for _ in range(cls.SEQUENTIAL_FRAMES):
+                ret, _frame = decoder.read()
+                if not ret:
+                    break
+                count += 1
+            sequential_ms = (time.perf_counter() - start) * 1000.0 / max(1, count)
+        finally:
+            decoder.close()
+        return {'seek': round(seek_ms, 3), 'sequential': round(sequential_ms, 3)}
+
+    @classmethod
+    def calibrate(cls, video_path):
+        """필요하면 측정하고 용도별 백엔드 선택 결과 반환 → {'seek': 이름, 'sequential': 이름}."""
+        override = cls.override()
+        if override is not None:
+            return {role: override for role in cls.ROLES}
+        key = cls.profile_key(video_path)
+        names = available_decoders()
+        with cls._lock:
+            profiles = cls._load_profiles()
+            timings = profiles.get(key, {})
+            missing = [name for name in names if name not in timings]
+            for name in missing:
+                try:
+                    timings[name] = cls.measure(video_path, name)
+                except (OSError, RuntimeError):
+                    timings[name] = None
+            if missing:
+                profiles[key] = timings
+                tmp_path = cls._cache_path() + '.tmp'
+                try:
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        json.dump(profiles, f, indent=2)
+                    os.replace(tmp_path, cls._cache_path())
+                except OSError:
+                    pass
+        return cls._pick(timings, names)
+
+    @classmethod
+    def _pick(cls, timings, names):
+        choice = {}
+        for role in cls.ROLES:
+            measured = [(timings[name][role], name) for name in names if timings.get(name)]
+            choice[role] = min(measured)[1] if measured else OpenCVDecoder.name
+        return choice
+
+    @classmethod
+    def choose(cls, video_path, role):
+        """측정 없이 고를 수 있는 백엔드 (고정값 → 저장된 측정 결과 → OpenCV)."""
+        override = cls.override()
+        if override is not None:
+            return override
+        try:
+            timings = cls._load_profiles().get(cls.profile_key(video_path))
+        except OSError:
+            timings = None
+        if not timings:
+            return OpenCVDecoder.name
+        return cls._pick(timings, available_decoders())[role]
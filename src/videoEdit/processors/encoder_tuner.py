@@ -0,0 +1,204 @@
+"""인코더 preset/스레드 수 자동 선택 모듈."""
+
+import json
+import os
+import platform
+import tempfile
+import threading
+import time
+from dataclasses import replace
+
+import cv2
+import numpy as np
+
+from .export_engine import ExportEngine
+from .ffmpeg_writer import FFmpegWriter
+from .media_cache import MediaCache
+from .video_processor import VideoProcessor
+
+
+class EncoderTuner:
+    """짧은 표본 구간을 preset/스레드 수 조합별로 인코딩해 보고 목표에 맞는 설정을 고르는 클래스.
+
+    측정값(인코딩 fps, 비트레이트)은 캐시 디렉터리의 JSON에 머신·코덱·출력 해상도 단위로
+    저장되므로 같은 조건이면 다시 측정하지 않는다. 목표 속도(기본: 실시간, 또는 제한 시간 안에
+    끝나는 속도)를 만족하는 조합 중 비트레이트가 가장 작은(같은 CRF에서 압축률이 가장 좋은)
+    조합을 고르고, 만족하는 조합이 없으면 가장 빠른 조합을 고른다.
+    """
+
+    CACHE_KIND = 'encoders'
+    PRESETS = ('ultrafast', 'veryfast', 'faster', 'fast', 'medium', 'slow')
+    # preset을 지원하는 코덱 (그 외 코덱은 튜닝하지 않음)
+    TUNABLE_CODECS = ('libx264', 'libx265')
+    # 표본 위치(전체 길이 비율)와 길이
+    SAMPLE_POSITION = 0.4
+    SAMPLE_SECONDS = 2.0
+    SAMPLE_MAX_FRAMES = 120
+    # 측정 오차를 고려해 목표 속도보다 이만큼 빨라야 만족으로 봄
+    SPEED_MARGIN = 1.1
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def machine_key():
+        """측정 결과를 구분할 머신 식별자 (호스트 이름/아키텍처/CPU 수)."""
+        return f"{platform.node() or 'unknown'}_{platform.machine() or 'unknown'}_{os.cpu_count() or 1}cpu"
+
+    @staticmethod
+    def thread_candidates():
+        """측정할 인코더 스레드 수 (전체 코어와 절반)."""
+        cpus = os.cpu_count() or 1
+        return sorted({max(1, cpus // 2), cpus})
+
+    @classmethod
+    def profile_key(cls, codec, width, height):
+        return f"{cls.machine_key()}|{codec}_{width}x{height}"
+
+    @classmethod
+    def _cache_path(cls):
+        return os.path.join(MediaCache.cache_dir(cls.CACHE_KIND), 'profiles.json')
+
+    @classmethod
+    def _load_profiles(cls):
+        try:
+            with open(cls._cache_path(), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def _save_profiles(cls, profiles):
+        tmp_path = cls._cache_path() + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(profiles, f, indent=2)
+            os.replace(tmp_path, cls._cache_path())
+        except OSError:
+            pass
+
+    @classmethod
+    def _sample_frames(cls, decoder, spec, path):
+        """표본 구간을 spec대로 회전/크롭/축소해 path에 memmap으로 저장한 프레임 배열.
+
+        Raises:
+            OSError: 프레임을 읽을 수 없는 경우
+        """
+        count = max(1, min(cls.SAMPLE_MAX_FRAMES, int(round(cls.SAMPLE_SECONDS * decoder.fps))))
+        start = max(0, min(int(decoder.frame_count * cls.SAMPLE_POSITION), decoder.frame_count - count))
+        decoder.seek(start)
+        frames = None
+        written = 0
+        for index in range(count):
+            ret, decoded = decoder.read()
+            if not ret:
+                break
+            frame = VideoProcessor.transform_frame(decoded, spec.rotation_angle, spec.crop)
+            h, w = frame.shape[:2]
+            size = spec.output_size(w, h)
+            if size != (w, h):
+                frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+            if frames is None:
+                frames = np.memmap(path, dtype=np.uint8, mode='w+', shape=(count,) + frame.shape)
+            frames[index] = frame
+            written += 1
+        if frames is None:
+            raise OSError(f"프레임을 읽을 수 없습니다: {decoder.video_path}")
+        return frames[:written]
+
+    @staticmethod
+    def measure(frames, fps, codec, preset, threads, output_path):
+        """frames를 한 조합으로 인코딩해 {'fps': 인코딩 fps, 'kbps': 비트레이트} 반환.
+
+        Raises:
+            RuntimeError: 인코딩에 실패한 경우
+        """
+        height, width = frames.shape[1:3]
+        writer = FFmpegWriter(output_path, width, height, fps, codec=codec, preset=preset, threads=threads)
+        start = time.perf_counter()
+        writer.open()
+        try:
+            for frame in frames:
+                writer.write(frame)
+            writer.close()
+        except RuntimeError:
+            writer.abort()
+            raise
+        elapsed = max(time.perf_counter() - start, 1e-6)
+        kbps = os.path.getsize(output_path) * 8 / (len(frames) / fps) / 1000.0
+        return {'fps': round(len(frames) / elapsed, 2), 'kbps': round(kbps, 1)}
+
+    @classmethod
+    def calibrate(cls, video_path, spec):
+        """필요하면 측정하고 (조합별 측정값 {'preset/threads': {...}}, 출력 프레임 수) 반환.
+
+        Raises:
+            OSError: 원본을 열 수 없는 경우
+        """
+        _path, decoder = ExportEngine.open_source(video_path)
+        try:
+            output_frames = sum(ExportEngine.output_frame_count((end - start) / decoder.fps, spec.fps)
+                                for start, end in ExportEngine.frame_ranges(decoder, spec))
+            width, height = spec.frame_size(decoder.width, decoder.height)
+            key = cls.profile_key(spec.codec, width, height)
+            with cls._lock:
+                profiles = cls._load_profiles()
+                timings = profiles.get(key, {})
+                missing = [(preset, threads) for preset in cls.PRESETS for threads in cls.thread_candidates()
+                           if f"{preset}/{threads}" not in timings]
+                if missing:
+                    with tempfile.TemporaryDirectory(dir=MediaCache.cache_dir(cls.CACHE_KIND)) as work_dir:
+                        frames = cls._sample_frames(decoder, spec, os.path.join(work_dir, 'sample.raw'))
+                        for preset, threads in missing:
+                            try:
+                                timings[f"{preset}/{threads}"] = cls.measure(
+                                    frames, spec.fps, spec.codec, preset, threads,
+                                    os.path.join(work_dir, 'trial.mp4'))
+                            except RuntimeError:
+                                timings[f"{preset}/{threads}"] = None
+                        del frames
+                    profiles[key] = timings
+                    cls._save_profiles(profiles)
+        finally:
+            decoder.close()
+        return timings, output_frames
+
+    @classmethod
+    def pick(cls, timings, required_fps):
+        """required_fps 이상으로 인코딩하는 조합 중 비트레이트가 가장 작은 조합 → (preset, threads)."""
+        measured = [(name, value) for name, value in timings.items() if value]
+        if not measured:
+            return None
+        fast_enough = [(value['kbps'], -value['fps'], name) for name, value in measured
+                       if value['fps'] >= required_fps * cls.SPEED_MARGIN]
+        if fast_enough:
+            name = min(fast_enough)[2]
+        else:
+            name = max(measured, key=lambda item: item[1]['fps'])[0]
+        preset, threads = name.split('/')
+        return preset, int(threads)
+
+    @classmethod
+    def apply(cls, video_path, spec, deadline_minutes=None):
+        """spec의 preset/threads를 자동 선택한 값으로 바꾼 새 ExportSpec.
+
+        Args:
+            video_path: 원본 비디오 경로
+            spec: ExportSpec (구간/회전/크롭/크기/코덱이 측정 해상도와 출력 길이를 정함)
+            deadline_minutes: 이 시간(분) 안에 끝나는 조합 중 가장 작은 파일을 고름
+                (None이면 실시간 이상 속도로 인코딩하는 조합 중 가장 작은 파일)
+
+        Raises:
+            OSError: 원본을 열 수 없는 경우
+        """
+        if spec.codec not in cls.TUNABLE_CODECS:
+            return spec
+        timings, output_frames = cls.calibrate(video_path, spec)
+        if deadline_minutes:
+            required_fps = output_frames / (deadline_minutes * 60.0)
+        else:
+            required_fps = spec.fps
+        choice = cls.pick(timings, required_fps)
+        if choice is None:
+            return spec
+        preset, threads = choice
+        return replace(spec, preset=preset, threads=threads)
@@ -0,0 +1,173 @@
+"""동일한 내보내기 결과 재사용 캐시 모듈."""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from dataclasses import asdict
+
+from .media_cache import MediaCache
+
+
+class ExportCache:
+    """원본 파일과 정규화한 편집 설정으로 키를 만들어 완료된 내보내기 결과를 보관하는 클래스.
+
+    같은 키의 요청은 인코딩 없이 캐시 파일을 하드링크(불가능하면 복사)해 바로 끝낸다.
+    등록은 하드링크로만 하므로 출력 위치가 캐시와 다른 파일시스템(exFAT 외장 디스크 등)이면
+    수 GB 출력을 복사하지 않고 건너뛴다 (allow_copy=True로 복사 허용).
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 지운다.
+    """
+
+    CACHE_KIND = 'export_outputs'
+    DEFAULT_MAX_BYTES = 5 * 1024 ** 3
+
+    _lock = threading.Lock()
+
+    def __init__(self, max_bytes=None, cache_dir=None, allow_copy=False):
+        """초기화.
+
+        Args:
+            max_bytes: 캐시 전체 크기 상한 (바이트)
+            cache_dir: 캐시 디렉터리 (기본: 캐시 최상위 아래 export_outputs)
+            allow_copy: 하드링크할 수 없는 출력도 복사해서 등록할지 여부
+        """
+        self.max_bytes = max_bytes if max_bytes is not None else self.DEFAULT_MAX_BYTES
+        self.allow_copy = allow_copy
+        self.cache_dir = cache_dir or MediaCache.cache_dir(self.CACHE_KIND)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def normalize_spec(spec):
+        """출력 내용에 영향을 주는 설정만 반올림해 정리 (인코더 스레드 수 등은 제외)."""
+        values = asdict(spec)
+        values.pop('threads', None)
+        for name in ('fps', 'start_time', 'end_time'):
+            if values.get(name) is not None:
+                values[name] = round(float(values[name]), 3)
+        values['rotation_angle'] = int(values['rotation_angle']) % 360
+        if values.get('crop'):
+            values['crop'] = [int(v) for v in values['crop']]
+        if values.get('ranges'):
+            values['ranges'] = [[round(float(start), 3), round(float(end), 3)] for start, end in values['ranges']]
+        return values
+
+    @staticmethod
+    def key(video_path, spec, output_path):
+        """원본 식별 키 + 정규화한 설정 + 출력 컨테이너로 만든 캐시 키."""
+        ident = json.dumps({
+            'source': MediaCache.source_key(video_path),
+            'spec': ExportCache.normalize_spec(spec),
+            'container': os.path.splitext(output_path)[1].lower(),
+        }, sort_keys=True)
+        return hashlib.sha256(ident.encode('utf-8')).hexdigest()[:32]
+
+    @property
+    def index_path(self):
+        return os.path.join(self.cache_dir, 'index.json')
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index):
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    @staticmethod
+    def _link_or_copy(src, dst, allow_copy=True):
+        """dst를 지우고 src를 하드링크 (다른 파일시스템 등으로 실패하면 allow_copy일 때만 복사).
+
+        Returns:
+            dst를 만들었는지 여부
+        """
+        if os.path.lexists(dst):
+            os.remove(dst)
+        try:
+            os.link(src, dst)
+        except OSError:
+            if not allow_copy:
+                return False
+            shutil.copyfile(src, dst)
+        return True
+
+    @staticmethod
+    def _valid(entry, path):
+        """캐시 파일이 저장 당시 그대로인지 (하드링크된 출력이 덮어써졌는지 확인)."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return st.st_size == entry['size'] and st.st_mtime_ns == entry['mtime_ns']
+
+    def fetch(self, video_path, spec, output_path):
+        """캐시에 같은 결과가 있으면 output_path로 내보내고 True 반환."""
+        key = self.key(video_path, spec, output_path)
+        with self._lock:
+            index = self._load_index()
+            entry = index.get(key)
+            if entry is None:
+                return False
+            path = os.path.join(self.cache_dir, entry['file'])
+            if not self._valid(entry, path):
+                index.pop(key)
+                if os.path.exists(path):
+                    os.remove(path)
+                self._save_index(index)
+                return False
+            if os.path.abspath(output_path) != os.path.abspath(path):
+                self._link_or_copy(path, output_path)
+            entry['last_used'] = time.time()
+            self._save_index(index)
+        return True
+
+    def store(self, video_path, spec, output_path):
+        """완료된 출력 파일을 캐시에 등록하고 크기 상한에 맞게 정리.
+
+        Returns:
+            등록했는지 여부 (크기 상한 초과, 하드링크 불가로 건너뛰면 False)
+
+        Raises:
+            OSError: 캐시 디렉터리에 쓸 수 없는 경우
+        """
+        key = self.key(video_path, spec, output_path)
+        size = os.path.getsize(output_path)
+        if size > self.max_bytes:
+            return False
+        name = key + os.path.splitext(output_path)[1].lower()
+        path = os.path.join(self.cache_dir, name)
+        with self._lock:
+            if not self._link_or_copy(output_path, path, self.allow_copy):
+                return False
+            st = os.stat(path)
+            index = self._load_index()
+            index[key] = {
+                'file': name,
+                'size': st.st_size,
+                'mtime_ns': st.st_mtime_ns,
+                'source': os.path.abspath(video_path),
+                'created': time.time(),
+                'last_used': time.time(),
+            }
+            self._evict(index)
+            self._save_index(index)
+        return True
+
+    def _evict(self, index):
+        """오래 사용하지 않은 항목부터 지워 전체 크기를 max_bytes 이하로 유지."""
+        total = sum(entry['size'] for entry in index.values())
+        for key in sorted(index, key=lambda k: index[k]['last_used']):
+            if total <= self.max_bytes:
+                break
+            entry = index.pop(key)
+            total -= entry['size']
+            try:
+                os.remove(os.path.join(self.cache_dir, entry['file']))
+            except OSError:
+                pass
@@ -0,0 +1,461 @@
+"""비디오 내보내기 엔진 모듈 (GUI와 무관하게 실행 가능)."""
+
+import math
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import List, Optional, Tuple
+
+import cv2
+from proglog import default_bar_logger
+
+from .decoders import DecoderSelector, open_decoder
+from .ffmpeg_utils import FFmpegUtils
+from .ffmpeg_writer import FFmpegWriter
+from .video_processor import VideoProcessor
+
+
+@dataclass
+class ExportSpec:
+    """내보내기 설정.
+
+    Attributes:
+        fps: 출력 FPS
+        start_time: 구간 시작(초)
+        end_time: 구간 종료(초), None이면 끝까지
+        rotation_angle: 시계방향 회전 각도
+        codec: 비디오 코덱
+        preset: 인코더 preset
+        threads: 인코더 스레드 수
+        audio_copy: 가능하면 오디오를 재인코딩 없이 스트림 복사
+        max_height: 출력 높이 상한 (None이면 원본 크기, 넘으면 비율 유지 축소)
+        max_width: 출력 폭 상한 (max_height와 함께 지정하면 그 박스 안에 맞춤)
+        crop: 회전된 프레임 기준 크롭 영역 (x, y, w, h), None이면 전체
+        ranges: 남길 구간 목록 [(시작초, 종료초), ...] - 지정하면 start_time/end_time 대신
+            이 구간들을 순서대로 이어 붙여 내보냄
+    """
+
+    fps: float
+    start_time: float = 0.0
+    end_time: Optional[float] = None
+    rotation_angle: int = 0
+    codec: str = 'libx264'
+    preset: str = 'medium'
+    threads: int = 4
+    audio_copy: bool = True
+    max_height: Optional[int] = None
+    max_width: Optional[int] = None
+    crop: Optional[Tuple[int, int, int, int]] = None
+    ranges: Optional[List[Tuple[float, float]]] = None
+
+    @property
+    def is_trimmed(self):
+        """구간이 전체가 아닌지 여부."""
+        return self.start_time > 0 or self.end_time is not None or bool(self.ranges)
+
+    def time_ranges(self):
+        """내보낼 구간 목록 [(시작초, 종료초 또는 None), ...]."""
+        if self.ranges:
+            return [(float(start), float(end)) for start, end in self.ranges]
+        return [(self.start_time, self.end_time)]
+
+    def output_size(self, width, height):
+        """크롭/회전된 width x height 프레임의 출력 크기 (상한 박스 안으로만 축소, 미리보기 letterbox와 같은 배율)."""
+        scale = VideoProcessor.fit_scale(width, height, self.max_width or width, self.max_height or height)
+        if scale >= 1.0:
+            return width, height
+        return (max(2, int(round(width * scale / 2.0)) * 2),
+                max(2, int(round(height * scale / 2.0)) * 2))
+
+    def frame_size(self, source_width, source_height):
+        """원본 source_width x source_height 프레임을 회전/크롭/축소한 최종 출력 크기."""
+        width, height = VideoProcessor.rotated_size(source_width, source_height, self.rotation_angle)
+        crop = VideoProcessor.clamp_crop(width, height, self.crop)
+        if crop is not None:
+            width, height = crop[2:]
+        return self.output_size(width, height)
+
+
+class _Rendition:
+    """출력 하나의 프레임 매핑과 인코딩 스레드 (ExportEngine 내부용).
+
+    디코딩 스레드가 넘긴 프레임을 큐로 받아 크기 조정 후 FFmpegWriter로 인코딩한다.
+    인코딩 오류가 나면 error에 저장하고 이후 프레임은 버린다 (디코딩 쪽이 막히지 않도록).
+    """
+
+    QUEUE_FRAMES = 8
+
+    def __init__(self, output_path, spec, ranges, fps_in, first_output=0, last_output=None, with_audio=True):
+        self.output_path = output_path
+        self.spec = spec
+        self.ranges = ranges
+        self.fps_in = fps_in
+        # 구간별 출력 프레임 수 (구간마다 따로 반올림해 오디오 구간 길이와 맞춤)
+        self.range_counts = ExportEngine.range_counts(ranges, fps_in, spec.fps)
+        total = sum(self.range_counts)
+        # [first_output, count) 범위의 출력 프레임만 인코딩 (분할 내보내기용)
+        self.count = total if last_output is None else min(last_output, total)
+        self.written = first_output
+        self._range_index = 0
+        self._range_offset = 0
+        self.with_audio = with_audio
+        self.error = None
+        self._queue = queue.Queue(maxsize=self.QUEUE_FRAMES)
+        self._thread = None
+        self._writer = None
+        self._video_path = None
+        self._audio_codec = 'aac'
+
+    @property
+    def done(self):
+        return self.written >= self.count
+
+    def audio_ranges(self):
+        """출력 구간에 맞춘 원본 오디오 구간 [(시작초, 길이초), ...]."""
+        return ExportEngine.audio_ranges(self.ranges, self.fps_in, self.spec.fps)
+
+    def next_position(self):
+        """다음 출력 프레임의 (구간 번호, 원본 프레임 번호)."""
+        frame = self.next_source_frame()
+        return self._range_index, frame
+
+    def next_source_frame(self):
+        """다음 출력 프레임에 필요한 원본 프레임 번호."""
+        while (self._range_index < len(self.ranges) - 1
+               and self.written >= self._range_offset + self.range_counts[self._range_index]):
+            self._range_offset += self.range_counts[self._range_index]
+            self._range_index += 1
+        start, end = self.ranges[self._range_index]
+        index = ExportEngine.source_frame_index(self.written - self._range_offset, start, self.fps_in, self.spec.fps)
+        return min(index, end - 1)
+
+    def take(self, source_frame):
+        """source_frame을 사용하는 출력 프레임 수 (FPS를 올리면 2 이상)."""
+        repeat = 0
+        while not self.done and self.next_source_frame() == source_frame:
+            self.written += 1
+            repeat += 1
+        return repeat
+
+    def start(self, video_path, audio_codec):
+        self._video_path = video_path
+        self._audio_codec = audio_codec
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, frame, repeat):
+        """프레임을 repeat번 인코딩하도록 전달.
+
+        Raises:
+            RuntimeError: 인코딩 스레드에서 오류가 난 경우
+        """
+        if self.error is not None:
+            raise self.error
+        self._queue.put((frame, repeat))
+
+    def finish(self):
+        """남은 프레임 인코딩과 파일 마무리를 기다림.
+
+        Raises:
+            RuntimeError: 인코딩에 실패한 경우
+        """
+        self._queue.put(None)
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def abort(self):
+        """인코딩 중단."""
+        if self._thread is not None and self._thread.is_alive():
+            self.error = self.error or RuntimeError("내보내기가 중단되었습니다")
+            # 소비 스레드가 깨어나 종료하도록 큐를 비우고 종료 표시
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._queue.put(None)
+            self._thread.join()
+        if self._writer is not None:
+            self._writer.abort()
+            self._writer = None
+
+    def _scale(self, frame):
+        h, w = frame.shape[:2]
+        size = self.spec.output_size(w, h)
+        if size == (w, h):
+            return frame
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if self.error is not None:
+                continue
+            frame, repeat = item
+            try:
+                out = self._scale(frame)
+                if self._writer is None:
+                    height, width = out.shape[:2]
+                    spec = self.spec
+                    self._writer = FFmpegWriter(
+                        self.output_path, width, height, spec.fps,
+                        codec=spec.codec, preset=spec.preset, threads=spec.threads,
+                        audio_source=self._video_path if self.with_audio else None,
+                        audio_ranges=self.audio_ranges(), audio_codec=self._audio_codec,
+                    ).open()
+                for _ in range(repeat):
+                    self._writer.write(out)
+            except (OSError, RuntimeError) as e:
+                self.error = e if isinstance(e, RuntimeError) else RuntimeError(str(e))
+        if self.error is None and self._writer is not None:
+            try:
+                self._writer.close()
+            except RuntimeError as e:
+                self.error = e
+            self._writer = None
+
+
+class ExportEngine:
+    """ExportSpec에 따라 비디오를 내보내는 클래스.
+
+    DecoderSelector가 고른 순차 읽기 백엔드로 구간을 한 번 디코딩하고,
+    회전·크롭한 프레임을 (필요하면 축소해) FFmpegWriter로 인코딩한다. FPS를 줄일 때는 출력에
+    쓰이는 원본 프레임만 변환하고 나머지는 grab()으로 건너뛴다 (디코더에 간격을 알려 ffmpeg
+    백엔드는 변환 전에 버림). 오디오는 FPS가 그대로이고 코덱을 출력 컨테이너에
+    담을 수 있으면 스트림 복사하고 (구간 시작은 MP4/MOV edit list로 샘플 단위까지 맞춰짐,
+    edit list가 없는 컨테이너에서 잘라낸 구간은 싱크가 어긋나므로 제외), 그 외에는 AAC로 재인코딩한다.
+
+    export_many()는 구간/회전/크롭이 같은 여러 출력(FPS/크기/코덱만 다름)을 한 번의 디코딩·회전으로
+    만들며, 출력마다 별도 스레드와 ffmpeg 프로세스로 병렬 인코딩한다.
+    """
+
+    # 구간 사이 간격이 이 시간(초)보다 길면 grab으로 건너뛰지 않고 seek
+    GRAB_GAP_SECONDS = 2.0
+
+    # 확장자별로 스트림 복사가 가능한 오디오 코덱
+    AUDIO_COPY_CODECS = {
+        '.mp4': {'aac', 'mp3', 'alac', 'ac3', 'eac3', 'opus'},
+        '.m4v': {'aac', 'mp3', 'alac', 'ac3', 'eac3'},
+        '.mov': {'aac', 'mp3', 'alac', 'ac3', 'eac3', 'pcm_s16le', 'pcm_s24le'},
+        '.mkv': {'aac', 'mp3', 'alac', 'ac3', 'eac3', 'opus', 'vorbis', 'flac', 'pcm_s16le', 'pcm_s24le'},
+        '.webm': {'opus', 'vorbis'},
+        '.avi': {'mp3', 'ac3', 'pcm_s16le'},
+    }
+    # 잘라낸 구간의 오디오를 복사해도 되는 컨테이너 (edit list로 구간 시작을 맞출 수 있음, 그 외는 싱크가 어긋남)
+    TRIM_COPY_EXTENSIONS = {'.mp4', '.m4v', '.mov'}
+
+    @staticmethod
+    def source_frame_index(k, start_frame, fps_in, fps_out):
+        """출력 프레임 k에 대응하는 원본 프레임 번호 (FPS 변환 시 가장 가까운 이전 프레임)."""
+        return start_frame + int(math.floor(k * fps_in / fps_out + 1e-6))
+
+    @staticmethod
+    def decimation_step(fps_in, fps_out):
+        """FPS를 줄일 때 source_frame_index가 만드는 원본 프레임 간격 (Fraction, 간단한 비율이 아니면 None)."""
+        if fps_out >= fps_in:
+            return None
+        ratio = fps_in / fps_out
+        step = Fraction(ratio).limit_denominator(16)
+        if abs(float(step) - ratio) > 1e-9:
+            return None
+        return step
+
+    @staticmethod
+    def output_frame_count(duration, fps_out):
+        """구간 길이(초)를 fps_out으로 내보낼 때의 출력 프레임 수."""
+        return max(1, int(math.ceil(duration * fps_out - 1e-6)))
+
+    @staticmethod
+    def range_counts(ranges, fps_in, fps_out):
+        """원본 프레임 구간별 출력 프레임 수 (구간마다 따로 반올림)."""
+        return [ExportEngine.output_frame_count((end - start) / fps_in, fps_out) for start, end in ranges]
+
+    @staticmethod
+    def audio_ranges(ranges, fps_in, fps_out):
+        """원본 프레임 구간에 맞춘 원본 오디오 구간 [(시작초, 길이초), ...] (길이는 구간별 출력 프레임 수 기준)."""
+        return [(start / fps_in, count / fps_out)
+                for (start, _end), count in zip(ranges, ExportEngine.range_counts(ranges, fps_in, fps_out))]
+
+    @staticmethod
+    def frame_ranges(decoder, spec):
+        """spec의 구간들을 원본 프레임 번호 [(start, end), ...]로 변환."""
+        fps_in = decoder.fps
+        ranges = []
+        for start_time, end_time in spec.time_ranges():
+            start_frame = min(int(round(start_time * fps_in)), max(0, decoder.frame_count - 1))
+            end_frame = decoder.frame_count
+            if end_time is not None:
+                end_frame = min(end_frame, int(round(end_time * fps_in)))
+            ranges.append((start_frame, max(end_frame, start_frame + 1)))
+        return ranges
+
+    @staticmethod
+    def open_source(source):
+        """원본 경로와 순차 읽기용 디코더 (DecoderSelector가 고른 백엔드).
+
+        Raises:
+            OSError: 원본을 열 수 없는 경우
+        """
+        video_path = source if isinstance(source, str) else source.filename
+        backend = DecoderSelector.calibrate(video_path)['sequential']
+        return video_path, open_decoder(video_path, backend)
+
+    @staticmethod
+    def audio_codec_for(video_path, output_path, spec, fps_in, source_codec=None):
+        """출력에 사용할 오디오 코덱 ('copy' 또는 'aac')."""
+        # 여러 구간을 이어 붙이는 경우 오디오 필터를 거치므로 복사할 수 없음
+        if not spec.audio_copy or abs(spec.fps - fps_in) > 1e-3 or len(spec.time_ranges()) > 1:
+            return 'aac'
+        ext = os.path.splitext(output_path)[1].lower()
+        if spec.is_trimmed and ext not in ExportEngine.TRIM_COPY_EXTENSIONS:
+            return 'aac'
+        if source_codec is None:
+            source_codec = FFmpegUtils.audio_codec(video_path)
+        allowed = ExportEngine.AUDIO_COPY_CODECS.get(ext, set())
+        return 'copy' if source_codec in allowed else 'aac'
+
+    @staticmethod
+    def export(source, output_path, spec, logger='bar'):
+        """비디오 내보내기.
+
+        Args:
+            source: 원본 비디오 경로 또는 VideoFileClip
+            output_path: 출력 파일 경로
+            spec: ExportSpec
+            logger: proglog 진행 로거 ('bar', None 또는 로거 객체)
+
+        Raises:
+            OSError: 원본을 열 수 없는 경우
+            RuntimeError: 인코딩에 실패한 경우
+        """
+        ExportEngine.export_many(source, [(output_path, spec)], logger=logger)
+
+    @staticmethod
+    def export_many(source, outputs, logger='bar'):
+        """한 번의 디코딩으로 여러 출력 내보내기.
+
+        Args:
+            source: 원본 비디오 경로 또는 VideoFileClip
+            outputs: (출력 경로, ExportSpec) 목록 - 구간, 회전 각도, 크롭은 모두 같아야 함
+            logger: proglog 진행 로거 ('bar', None 또는 로거 객체)
+
+        Raises:
+            ValueError: 출력끼리 구간/회전/크롭이 다른 경우
+            OSError: 원본을 열 수 없는 경우
+            RuntimeError: 인코딩에 실패한 경우
+        """
+        if not outputs:
+            return
+        first = outputs[0][1]
+        for _path, spec in outputs[1:]:
+            if ((spec.time_ranges(), spec.rotation_angle, spec.crop)
+                    != (first.time_ranges(), first.rotation_angle, first.crop)):
+                raise ValueError("한 번에 내보내는 출력은 구간, 회전 각도, 크롭이 같아야 합니다")
+
+        video_path, decoder = ExportEngine.open_source(source)
+        renditions = []
+        try:
+            fps_in = decoder.fps
+            ranges = ExportEngine.frame_ranges(decoder, first)
+            source_codec = FFmpegUtils.audio_codec(video_path)
+            for output_path, spec in outputs:
+                rendition = _Rendition(output_path, spec, ranges, fps_in)
+                rendition.start(video_path, ExportEngine.audio_codec_for(
+                    video_path, output_path, spec, fps_in, source_codec=source_codec))
+                renditions.append(rendition)
+            ExportEngine._render(decoder, renditions, first.rotation_angle, logger, crop=first.crop)
+            renditions = []
+        finally:
+            for rendition in renditions:
+                rendition.abort()
+            decoder.close()
+
+    @staticmethod
+    def render_range(decoder, spec, first_output, last_output, output_path, logger='bar'):
+        """출력 프레임 [first_output, last_output)만 오디오 없이 output_path로 인코딩 (분할 내보내기용).
+
+        Args:
+            decoder: 원본을 연 디코더 (open_source)
+            spec: ExportSpec
+            first_output: 첫 출력 프레임 번호
+            last_output: 마지막 출력 프레임 번호 (포함하지 않음)
+            output_path: 출력 파일 경로
+            logger: proglog 진행 로거 ('bar', None 또는 로거 객체)
+
+        Raises:
+            OSError: 프레임을 하나도 읽지 못한 경우
+            RuntimeError: 인코딩에 실패한 경우
+        """
+        ranges = ExportEngine.frame_ranges(decoder, spec)
+        rendition = _Rendition(output_path, spec, ranges, decoder.fps,
+                               first_output=first_output, last_output=last_output, with_audio=False)
+        rendition.start(decoder.video_path, None)
+        try:
+            ExportEngine._render(decoder, [rendition], spec.rotation_angle, logger, crop=spec.crop)
+        finally:
+            rendition.abort()
+
+    @staticmethod
+    def _render(decoder, renditions, rotation_angle, logger, crop=None):
+        """시작된 출력들에 필요한 원본 프레임을 한 번씩 디코딩·회전·크롭해 나눠 주고 인코딩 완료까지 대기.
+
+        Raises:
+            OSError: 프레임을 하나도 읽지 못한 경우
+            RuntimeError: 인코딩에 실패한 경우
+        """
+        # 건너뛸 프레임이 이보다 많으면 grab 대신 seek (구간 사이 이동)
+        grab_limit = max(1, int(decoder.fps * ExportEngine.GRAB_GAP_SECONDS))
+        # 모든 출력의 FPS가 같고 원본보다 낮으면 쓰지 않는 프레임을 디코더 단계에서 버리도록 알림
+        fps_out = {r.spec.fps for r in renditions}
+        step = ExportEngine.decimation_step(decoder.fps, fps_out.pop()) if len(fps_out) == 1 else None
+        decimated_range = None
+        bar = default_bar_logger(logger)
+        bar(frame_index__total=max(r.count - r.written for r in renditions))
+        first_written = min(r.written for r in renditions)
+        last_update = 0.0
+        frame = None
+        while True:
+            active = [r for r in renditions if not r.done]
+            if not active:
+                break
+            # 구간 순서가 원본 순서와 다를 수 있으므로 (구간 번호, 프레임 번호) 순으로 진행
+            position = min(r.next_position() for r in active)
+            target = position[1]
+            if step is not None and position[0] != decimated_range:
+                decimated_range = position[0]
+                decoder.set_decimation(step, active[0].ranges[decimated_range][0])
+            gap = target - decoder.position if decoder.position >= 0 else -1
+            if 0 <= gap <= grab_limit:
+                # 어느 출력에도 쓰이지 않는 프레임은 디코딩만 하고 변환하지 않음
+                if not all(decoder.grab() for _ in range(gap)):
+                    break
+            else:
+                decoder.seek(target)
+            ret, decoded = decoder.read()
+            if not ret:
+                break
+            frame = VideoProcessor.transform_frame(decoded, rotation_angle, crop)
+            for rendition in active:
+                if rendition.next_position() == position:
+                    rendition.submit(frame, rendition.take(target))
+            now = time.monotonic()
+            if now - last_update > 0.1:
+                bar(frame_index__index=max(r.written for r in renditions) - first_written)
+                last_update = now
+
+        # 원본 프레임 수가 메타데이터보다 적으면 남은 출력 프레임은 마지막 프레임으로 채움
+        for rendition in renditions:
+            if not rendition.done:
+                if frame is None:
+                    raise OSError(f"프레임을 읽을 수 없습니다: {decoder.video_path}")
+                repeat = rendition.count - rendition.written
+                rendition.written = rendition.count
+                rendition.submit(frame, repeat)
+        for rendition in renditions:
+            rendition.finish()
@@ -0,0 +1,327 @@
+"""내보내기 작업 기록(텔레메트리)과 처리량 요약 모듈."""
+
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime
+
+import cv2
+
+from .export_cache import ExportCache
+from .export_engine import ExportEngine
+from .ffmpeg_writer import FFmpegWriter
+from .media_cache import MediaCache
+
+
+def _current_rss_mb():
+    """이 프로세스의 현재 RSS(MB) - psutil, /proc/self/statm, Windows API 순으로 시도 (알 수 없으면 None)."""
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if sys.platform == 'win32':
+        return _windows_rss_mb()
+    return None
+
+
+def _windows_rss_mb():
+    """Windows에서 이 프로세스의 현재 작업 집합(MB)."""
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                        ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                        ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return None
+        return counters.WorkingSetSize / (1024 * 1024)
+    except (AttributeError, OSError):
+        return None
+
+
+def _process_cpu_seconds():
+    """이 프로세스(모든 스레드)의 누적 CPU 시간(초)."""
+    t = os.times()
+    return t.user + t.system
+
+
+class ExportTelemetry:
+    """내보내기 한 건의 원본/설정/소요 시간/자원 사용량을 JSON Lines 로그에 한 줄씩 남기는 클래스.
+
+    with 블록으로 내보내기를 감싸면 벽시계 시간, CPU 시간, 최대 RSS를 블록 동안의 값으로 측정해
+    블록이 끝날 때(실패해도) 기록한다. RSS는 감시 스레드가 RSS_SAMPLE_SECONDS마다 표본을 뜬 최댓값이고,
+    ffmpeg 인코더 프로세스의 CPU 시간/최대 RSS는 os.wait4로 인코더마다 따로 받는다 (Windows는 제외).
+    같은 프로세스에서 동시에 진행된 다른 작업의 사용량도 함께 들어갈 수 있다.
+    summarize()는 기록을 출력 해상도·인코더 설정별, 기간별로 묶어 처리량을 요약한다.
+    """
+
+    CACHE_KIND = 'telemetry'
+    LOG_FILE = 'exports.jsonl'
+    PERIODS = ('day', 'week', 'month')
+    # 메모리 표본 간격 (초)
+    RSS_SAMPLE_SECONDS = 0.25
+
+    _lock = threading.Lock()
+
+    def __init__(self, video_path, outputs, origin, log_path=None):
+        """초기화.
+
+        Args:
+            video_path: 원본 비디오 경로
+            outputs: (출력 경로, ExportSpec) 목록
+            origin: 실행 위치 ('gui', 'cli', 'watch', 'autotrim')
+            log_path: 로그 경로 (기본: 캐시 디렉터리의 telemetry/exports.jsonl)
+        """
+        self.video_path = video_path
+        self.outputs = list(outputs)
+        self.origin = origin
+        self.log_path = log_path or self.default_log_path()
+        # 'ok', 'error', 'cached' (이전 결과 재사용)
+        self.status = 'ok'
+        self.notes = {}
+        self._started = None
+        self._cpu_started = None
+        self._peak_rss = None
+        self._encoder_cpu = 0.0
+        self._encoder_peak_rss = None
+        self._sampler = None
+        self._sampling = threading.Event()
+
+    @classmethod
+    def default_log_path(cls):
+        return os.path.join(MediaCache.cache_dir(cls.CACHE_KIND), cls.LOG_FILE)
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        self._cpu_started = _process_cpu_seconds()
+        self._sample_rss()
+        self._sampling.clear()
+        self._sampler = threading.Thread(target=self._sample_loop, daemon=True)
+        self._sampler.start()
+        FFmpegWriter.usage_hooks.append(self._on_encoder_exit)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        FFmpegWriter.usage_hooks.remove(self._on_encoder_exit)
+        self._sampling.set()
+        self._sampler.join()
+        self._sample_rss()
+        wall = time.perf_counter() - self._started
+        cpu = _process_cpu_seconds() - self._cpu_started + self._encoder_cpu
+        error = None
+        if exc_type is not None:
+            self.status = 'error'
+            error = str(exc) or exc_type.__name__
+        try:
+            self.write(self.build_record(wall, cpu, error))
+        except OSError:
+            # 기록 실패가 내보내기 결과에 영향을 주지 않도록 무시
+            pass
+        return False
+
+    def _sample_rss(self):
+        rss = _current_rss_mb()
+        if rss is not None and (self._peak_rss is None or rss > self._peak_rss):
+            self._peak_rss = rss
+
+    def _sample_loop(self):
+        while not self._sampling.wait(self.RSS_SAMPLE_SECONDS):
+            self._sample_rss()
+
+    def _on_encoder_exit(self, usage):
+        """인코더 프로세스 하나의 CPU 시간/최대 RSS 누적 (FFmpegWriter.usage_hooks)."""
+        self._encoder_cpu += usage.ru_utime + usage.ru_stime
+        # Linux는 KB, macOS는 바이트 단위
+        rss = usage.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+        if self._encoder_peak_rss is None or rss > self._encoder_peak_rss:
+            self._encoder_peak_rss = rss
+
+    @classmethod
+    def log_cached(cls, video_path, outputs, origin):
+        """이전 결과를 재사용해 인코딩하지 않은 내보내기 기록."""
+        with cls(video_path, outputs, origin) as telemetry:
+            telemetry.status = 'cached'
+
+    @staticmethod
+    def probe_input(video_path):
+        """원본 크기/해상도/FPS/코덱/길이 (읽을 수 없는 항목은 생략)."""
+        info = {'path': os.path.abspath(video_path)}
+        try:
+            info['size'] = os.path.getsize(video_path)
+        except OSError:
+            return info
+        cap = cv2.VideoCapture(video_path)
+        if cap.isOpened():
+            fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+            fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+            frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            info.update({
+                'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                'fps': round(fps, 3),
+                'codec': ''.join(chr((fourcc >> (8 * i)) & 0xFF) for i in range(4)).strip('\x00 ') or 'unknown',
+                'duration': round(frames / fps, 3) if fps > 0 else None,
+            })
+        cap.release()
+        return info
+
+    @staticmethod
+    def output_info(output_path, spec, source, wall):
+        """출력 한 개의 설정/해상도/프레임 수/크기/인코딩 fps."""
+        values = ExportCache.normalize_spec(spec)
+        values['threads'] = spec.threads
+        info = {'path': os.path.abspath(output_path), 'spec': values}
+        if source.get('width') and source.get('height'):
+            info['width'], info['height'] = spec.frame_size(source['width'], source['height'])
+        duration = source.get('duration')
+        if duration:
+            seconds = sum((duration if end is None else min(end, duration)) - start
+                          for start, end in spec.time_ranges())
+            info['seconds'] = round(max(seconds, 0.0), 3)
+            info['frames'] = ExportEngine.output_frame_count(info['seconds'], spec.fps)
+            if wall > 0:
+                info['encode_fps'] = round(info['frames'] / wall, 2)
+        try:
+            info['size'] = os.path.getsize(output_path)
+        except OSError:
+            pass
+        return info
+
+    def build_record(self, wall, cpu, error=None):
+        """로그 한 줄에 쓸 기록."""
+        source = self.probe_input(self.video_path)
+        record = {
+            'time': round(time.time(), 3),
+            'origin': self.origin,
+            'status': self.status,
+            'machine': platform.node() or 'unknown',
+            'input': source,
+            # 캐시 재사용/실패한 작업은 인코딩 fps를 계산하지 않음
+            'outputs': [self.output_info(path, spec, source, wall if self.status == 'ok' else 0)
+                        for path, spec in self.outputs],
+            'wall_seconds': round(wall, 3),
+            'cpu_seconds': round(cpu, 3),
+            'peak_rss_mb': round(self._peak_rss, 1) if self._peak_rss is not None else None,
+            'child_peak_rss_mb': round(self._encoder_peak_rss, 1) if self._encoder_peak_rss is not None else None,
+        }
+        if error:
+            record['error'] = error
+        if self.notes:
+            record['notes'] = dict(self.notes)
+        return record
+
+    def write(self, record):
+        """기록을 로그 끝에 한 줄로 추가 (여러 프로세스가 같은 로그에 써도 줄 단위로 남도록 한 번에 씀)."""
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+    @classmethod
+    def load(cls, log_path=None, since=None):
+        """로그의 기록 목록 (since(epoch 초) 이후만, 깨진 줄은 건너뜀)."""
+        records = []
+        try:
+            with open(log_path or cls.default_log_path(), 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if since is None or record.get('time', 0) >= since:
+                        records.append(record)
+        except OSError:
+            pass
+        return records
+
+    @staticmethod
+    def group_key(output):
+        """요약 기준: 출력 해상도 + 코덱/preset/스레드 수."""
+        spec = output.get('spec', {})
+        resolution = f"{output['width']}x{output['height']}" if output.get('width') else 'unknown'
+        return resolution, f"{spec.get('codec')}/{spec.get('preset')}/{spec.get('threads')}"
+
+    @classmethod
+    def period_label(cls, timestamp, period):
+        moment = datetime.fromtimestamp(timestamp)
+        if period == 'day':
+            return moment.strftime('%Y-%m-%d')
+        if period == 'month':
+            return moment.strftime('%Y-%m')
+        year, week, _day = moment.isocalendar()
+        return f"{year}-W{week:02d}"
+
+    @staticmethod
+    def _summary(rows):
+        """(출력, 기록) 목록의 처리량 요약."""
+        fps = [output['encode_fps'] for output, _record in rows if output.get('encode_fps')]
+        seconds = sum(output.get('seconds', 0.0) for output, _record in rows)
+        wall = sum(record['wall_seconds'] for _output, record in rows)
+        cpu = sum(record['cpu_seconds'] for _output, record in rows)
+        rss = [record['peak_rss_mb'] for _output, record in rows if record.get('peak_rss_mb')]
+        child_rss = [record['child_peak_rss_mb'] for _output, record in rows if record.get('child_peak_rss_mb')]
+        size = sum(output.get('size', 0) for output, _record in rows)
+        return {
+            'count': len(rows),
+            'frames': sum(output.get('frames', 0) for output, _record in rows),
+            'median_fps': round(statistics.median(fps), 2) if fps else None,
+            'realtime': round(seconds / wall, 2) if wall > 0 else None,
+            'cpu_per_minute': round(cpu / (seconds / 60.0), 1) if seconds > 0 else None,
+            'peak_rss_mb': max(rss) if rss else None,
+            'child_peak_rss_mb': max(child_rss) if child_rss else None,
+            'mb_per_minute': round(size / (1024 * 1024) / (seconds / 60.0), 1) if seconds > 0 else None,
+        }
+
+    @classmethod
+    def summarize(cls, records, period='week'):
+        """성공한(캐시 재사용 제외) 내보내기를 해상도·설정별, 기간별로 요약.
+
+        여러 출력을 한 번에 내보낸 기록은 출력마다 한 건으로 세며, 벽시계/CPU 시간은 출력마다
+        전체 값이 들어가므로 동시 인코딩한 출력끼리는 공유된 값이다.
+
+        Returns:
+            {'groups': [{'resolution', 'settings', ...요약}], 'timeline': [{'period', 'resolution',
+            'settings', ...요약}], 'total': 기록 수, 'errors': 실패 수, 'cached': 캐시 재사용 수}
+        """
+        if period not in cls.PERIODS:
+            raise ValueError(f"지원하지 않는 기간 단위: {period} (사용 가능: {', '.join(cls.PERIODS)})")
+        groups = {}
+        timeline = {}
+        for record in records:
+            if record.get('status') != 'ok':
+                continue
+            label = cls.period_label(record['time'], period)
+            for output in record.get('outputs', []):
+                key = cls.group_key(output)
+                groups.setdefault(key, []).append((output, record))
+                timeline.setdefault((label,) + key, []).append((output, record))
+        return {
+            'groups': [dict(resolution=key[0], settings=key[1], **cls._summary(rows))
+                       for key, rows in sorted(groups.items())],
+            'timeline': [dict(period=key[0], resolution=key[1], settings=key[2], **cls._summary(rows))
+                         for key, rows in sorted(timeline.items())],
+            'total': len(records),
+            'errors': sum(1 for record in records if record.get('status') == 'error'),
+            'cached': sum(1 for record in records if record.get('status') == 'cached'),
+        }
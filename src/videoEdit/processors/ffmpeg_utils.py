@@ -0,0 +1,60 @@
+"""ffmpeg 실행 파일 호출 관련 기능 모듈."""
+
+import re
+import subprocess
+
+
+class FFmpegUtils:
+    """MoviePy가 사용하는 ffmpeg 바이너리를 직접 호출하는 유틸리티 클래스."""
+
+    @staticmethod
+    def ffmpeg_exe():
+        """ffmpeg 실행 파일 경로 (MoviePy/imageio-ffmpeg 설정을 그대로 사용)."""
+        from moviepy.config import get_setting
+        return get_setting("FFMPEG_BINARY")
+
+    @staticmethod
+    def run(args, timeout=None):
+        """ffmpeg를 실행하고 완료를 기다림.
+
+        Args:
+            args: ffmpeg 실행 파일 뒤에 붙일 인자 리스트
+            timeout: 초 단위 제한 시간
+
+        Returns:
+            subprocess.CompletedProcess (stdout/stderr는 bytes)
+
+        Raises:
+            RuntimeError: ffmpeg가 0이 아닌 코드로 종료한 경우
+        """
+        cmd = [FFmpegUtils.ffmpeg_exe(), '-hide_banner', '-nostdin'] + list(args)
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=timeout)
+        if result.returncode != 0:
+            message = result.stderr.decode('utf-8', errors='replace').strip().splitlines()
+            raise RuntimeError(f"ffmpeg 실행 실패: {message[-1] if message else result.returncode}")
+        return result
+
+    @staticmethod
+    def open_pipe(args):
+        """ffmpeg를 stdout 파이프로 실행 (스트리밍 읽기용).
+
+        Returns:
+            subprocess.Popen (stdout=PIPE, stderr는 버림)
+        """
+        cmd = [FFmpegUtils.ffmpeg_exe(), '-hide_banner', '-nostdin', '-loglevel', 'error'] + list(args)
+        return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=1 << 20)
+
+    @staticmethod
+    def audio_codec(path):
+        """첫 번째 오디오 스트림의 코덱 이름 (오디오가 없거나 읽을 수 없으면 None).
+
+        ffprobe 없이 `ffmpeg -i`의 스트림 정보 출력을 파싱한다.
+        """
+        cmd = [FFmpegUtils.ffmpeg_exe(), '-hide_banner', '-nostdin', '-i', path]
+        try:
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        text = result.stderr.decode('utf-8', errors='replace')
+        match = re.search(r'Stream #\S+.*?: Audio: (\w+)', text)
+        return match.group(1) if match else None
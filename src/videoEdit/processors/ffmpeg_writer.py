@@ -0,0 +1,159 @@
+"""ffmpeg stdin 파이프 인코더 모듈."""
+
+import os
+import subprocess
+import tempfile
+from fractions import Fraction
+
+from .ffmpeg_utils import FFmpegUtils
+
+
+class FFmpegWriter:
+    """BGR 프레임을 rawvideo로 stdin에 넘겨 ffmpeg로 인코딩하는 클래스.
+
+    audio_source를 지정하면 해당 파일의 오디오(구간)를 두 번째 입력으로 함께 담는다.
+    """
+
+    # 인코더 프로세스가 끝날 때 그 프로세스의 자원 사용량(resource.struct_rusage)을 받는 함수 목록
+    # (os.wait4를 지원하는 플랫폼만, ExportTelemetry가 내보내기 동안 등록)
+    usage_hooks = []
+
+    def __init__(self, output_path, width, height, fps, codec='libx264', preset='medium', threads=4,
+                 audio_source=None, audio_ranges=None, audio_codec='aac'):
+        """초기화.
+
+        Args:
+            output_path: 출력 파일 경로
+            width: 프레임 폭
+            height: 프레임 높이
+            fps: 출력 FPS
+            codec: 비디오 코덱
+            preset: 인코더 preset (libx264/libx265만 적용)
+            threads: 인코더 스레드 수
+            audio_source: 오디오를 가져올 파일 (None이면 오디오 없음)
+            audio_ranges: 이어 붙일 오디오 구간 [(시작초, 길이초 또는 None), ...] (None이면 전체)
+            audio_codec: 오디오 코덱 ('copy'면 스트림 복사)
+        """
+        self.output_path = output_path
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.codec = codec
+        self.preset = preset
+        self.threads = threads
+        self.audio_source = audio_source
+        self.audio_ranges = audio_ranges or [(0.0, None)]
+        self.audio_codec = audio_codec
+        self._proc = None
+        self._stderr = None
+
+    def build_args(self):
+        """ffmpeg 인자 리스트 (실행 파일 제외)."""
+        rate = Fraction(self.fps).limit_denominator(1001)
+        args = [
+            '-hide_banner', '-nostdin', '-loglevel', 'error', '-y',
+            '-f', 'rawvideo', '-pix_fmt', 'bgr24', '-s', f"{self.width}x{self.height}",
+            '-r', f"{rate.numerator}/{rate.denominator}", '-i', '-',
+        ]
+        audio_outputs = []
+        if self.audio_source is not None:
+            audio_inputs, audio_outputs = self.audio_args(self.audio_source, self.audio_ranges, self.audio_codec, 1)
+            args += audio_inputs
+        args += ['-c:v', self.codec]
+        if self.codec in ('libx264', 'libx265'):
+            args += ['-preset', self.preset, '-pix_fmt', 'yuv420p']
+            if self.width % 2 or self.height % 2:
+                # yuv420p는 짝수 크기만 가능
+                args += ['-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2']
+        args += ['-threads', str(self.threads)] + audio_outputs
+        args.append(self.output_path)
+        return args
+
+    @staticmethod
+    def audio_args(source, audio_ranges, audio_codec, input_index):
+        """원본 오디오 구간을 input_index번 입력으로 추가하는 인자 → (입력 인자, 출력 인자).
+
+        구간이 하나면 입력 -ss/-t로 자르고 (스트림 복사 가능), 여러 개면 atrim/concat
+        필터로 이어 붙인다 (오디오가 없는 원본이면 필터를 쓰지 않고 비디오만 담음).
+        """
+        if len(audio_ranges) == 1:
+            start, duration = audio_ranges[0]
+            inputs = ['-ss', f"{start:.6f}"] if start > 0 else []
+            if duration is not None:
+                inputs += ['-t', f"{duration:.6f}"]
+            inputs += ['-i', source]
+            return inputs, ['-map', '0:v:0', '-map', f'{input_index}:a:0?', '-c:a', audio_codec]
+
+        if FFmpegUtils.audio_codec(source) is None:
+            return [], ['-map', '0:v:0']
+        parts = []
+        for i, (start, duration) in enumerate(audio_ranges):
+            parts.append(f"[{input_index}:a:0]atrim=start={start:.6f}:duration={duration:.6f},"
+                         f"asetpts=PTS-STARTPTS[a{i}]")
+        labels = ''.join(f"[a{i}]" for i in range(len(audio_ranges)))
+        graph = ';'.join(parts) + f";{labels}concat=n={len(audio_ranges)}:v=0:a=1[aout]"
+        return ['-i', source], ['-filter_complex', graph, '-map', '0:v:0', '-map', '[aout]', '-c:a', audio_codec]
+
+    def open(self):
+        """인코더 프로세스 시작."""
+        # 기존 파일이 내보내기 캐시와 하드링크되어 있을 수 있으므로 덮어쓰지 않고 새로 만듦
+        if os.path.lexists(self.output_path):
+            os.remove(self.output_path)
+        self._stderr = tempfile.TemporaryFile()
+        self._proc = subprocess.Popen(
+            [FFmpegUtils.ffmpeg_exe()] + self.build_args(),
+            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=self._stderr,
+        )
+        return self
+
+    def write(self, frame):
+        """BGR 프레임 한 장 인코딩.
+
+        Raises:
+            RuntimeError: 인코더가 먼저 종료된 경우
+        """
+        try:
+            self._proc.stdin.write(memoryview(frame).cast('B') if frame.flags.c_contiguous else frame.tobytes())
+        except (BrokenPipeError, OSError):
+            self._raise_failure()
+
+    def _wait(self):
+        """인코더 종료 대기 → 종료 코드 (가능하면 os.wait4로 이 프로세스만의 자원 사용량을 usage_hooks에 전달)."""
+        if self._proc.returncode is None and hasattr(os, 'wait4'):
+            try:
+                _pid, status, usage = os.wait4(self._proc.pid, 0)
+            except ChildProcessError:
+                return self._proc.wait()
+            self._proc.returncode = os.waitstatus_to_exitcode(status)
+            for hook in list(self.usage_hooks):
+                hook(usage)
+        return self._proc.wait()
+
+    def _raise_failure(self):
+        self._wait()
+        self._stderr.seek(0)
+        message = self._stderr.read().decode('utf-8', errors='replace').strip().splitlines()
+        self._stderr.close()
+        raise RuntimeError(f"ffmpeg 인코딩 실패: {message[-1] if message else self._proc.returncode}")
+
+    def close(self):
+        """입력을 닫고 인코딩 완료 대기.
+
+        Raises:
+            RuntimeError: ffmpeg가 0이 아닌 코드로 종료한 경우
+        """
+        try:
+            self._proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        if self._wait() != 0:
+            self._raise_failure()
+        self._stderr.close()
+
+    def abort(self):
+        """인코딩 중단 (출력 파일은 불완전할 수 있음)."""
+        if self._proc is not None and self._proc.poll() is None:
+            self._proc.kill()
+            self._wait()
+        if self._stderr is not None:
+            self._stderr.close()
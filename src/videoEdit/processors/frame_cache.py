@@ -0,0 +1,69 @@
+"""디코딩된 미리보기 프레임 LRU 캐시 모듈."""
+
+import threading
+from collections import OrderedDict
+
+
+class FrameCache:
+    """프레임 번호 → BGR 프레임 LRU 캐시 (바이트 예산 기준, 스레드 안전).
+
+    미리보기 디코더와 백그라운드 프리페처가 함께 채우고 읽는다.
+    """
+
+    DEFAULT_MAX_BYTES = 384 * 1024 * 1024
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """초기화.
+
+        Args:
+            max_bytes: 캐시가 보관할 최대 프레임 바이트 수
+        """
+        self.max_bytes = max_bytes
+        self._frames = OrderedDict()
+        self._bytes = 0
+        self._source = None
+        self._lock = threading.Lock()
+
+    def reset(self, source=None):
+        """모든 프레임을 비우고 대상 파일 지정."""
+        with self._lock:
+            self._frames.clear()
+            self._bytes = 0
+            self._source = source
+
+    @property
+    def source(self):
+        """현재 캐시 대상 파일 경로."""
+        return self._source
+
+    def get(self, frame_number):
+        """캐시된 프레임 (없으면 None)."""
+        with self._lock:
+            frame = self._frames.get(frame_number)
+            if frame is not None:
+                self._frames.move_to_end(frame_number)
+            return frame
+
+    def __contains__(self, frame_number):
+        with self._lock:
+            return frame_number in self._frames
+
+    def put(self, frame_number, frame, source=None):
+        """프레임 추가 (source가 현재 대상과 다르면 무시)."""
+        if frame is None:
+            return
+        with self._lock:
+            if source is not None and source != self._source:
+                return
+            old = self._frames.pop(frame_number, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._frames[frame_number] = frame
+            self._bytes += frame.nbytes
+            while self._bytes > self.max_bytes and len(self._frames) > 1:
+                _, evicted = self._frames.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    def __len__(self):
+        with self._lock:
+            return len(self._frames)
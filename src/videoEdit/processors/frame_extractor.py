@@ -0,0 +1,148 @@
+"""프레임/이미지 시퀀스 추출 모듈."""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from fractions import Fraction
+
+import cv2
+from proglog import default_bar_logger
+
+from .export_engine import ExportEngine
+from .video_processor import VideoProcessor
+
+
+def encode_image(path, frame, rotation_angle, crop, params):
+    """프레임 한 장을 회전/크롭 후 이미지 파일로 저장 (프로세스 풀 작업) → 저장 경로.
+
+    Raises:
+        OSError: 저장에 실패한 경우
+    """
+    image = VideoProcessor.transform_frame(frame, rotation_angle, crop)
+    if not cv2.imwrite(path, image, params):
+        raise OSError(f"이미지를 저장할 수 없습니다: {path}")
+    return path
+
+
+class FrameExtractor:
+    """구간의 N프레임마다 한 장씩(또는 모든 프레임을) JPEG/PNG로 저장하는 클래스.
+
+    원본은 순차 읽기 백엔드로 한 번만 디코딩하며, 필요 없는 프레임은 grab()으로 건너뛰고
+    (간격이 길면 seek, ffmpeg 백엔드는 select 필터로 변환 전에 버림) 필요한 프레임만 변환한다.
+    회전/크롭과 이미지 인코딩은 프로세스 풀에서 병렬로 처리하고, 처리 대기 중인 프레임 수를
+    jobs의 배수로 제한해 메모리 사용량을 묶어 둔다.
+    """
+
+    FORMATS = ('jpg', 'png')
+    # 작업자당 대기시킬 수 있는 프레임 수
+    PENDING_PER_JOB = 2
+
+    def __init__(self, video_path, output_dir, every=1, start_time=0.0, end_time=None, rotation_angle=0,
+                 crop=None, image_format='jpg', quality=95, jobs=None):
+        """초기화.
+
+        Args:
+            video_path: 원본 비디오 경로
+            output_dir: 이미지 저장 디렉터리
+            every: N프레임마다 한 장 (1이면 모든 프레임)
+            start_time: 구간 시작(초)
+            end_time: 구간 종료(초), None이면 끝까지
+            rotation_angle: 시계방향 회전 각도
+            crop: 회전된 프레임 기준 크롭 영역 (x, y, w, h), None이면 전체
+            image_format: 'jpg' 또는 'png'
+            quality: JPEG 품질 (0~100, PNG는 무시)
+            jobs: 이미지 인코딩 프로세스 수 (1 이하면 디코딩 스레드에서 직접 저장)
+
+        Raises:
+            ValueError: every가 1보다 작거나 지원하지 않는 형식인 경우
+        """
+        if every < 1:
+            raise ValueError("every는 1 이상이어야 합니다")
+        if image_format not in self.FORMATS:
+            raise ValueError(f"지원하지 않는 이미지 형식: {image_format} (사용 가능: {', '.join(self.FORMATS)})")
+        self.video_path = video_path
+        self.output_dir = output_dir
+        self.every = int(every)
+        self.start_time = start_time
+        self.end_time = end_time
+        self.rotation_angle = rotation_angle
+        self.crop = crop
+        self.image_format = image_format
+        self.quality = quality
+        self.jobs = jobs if jobs is not None else (os.cpu_count() or 1)
+
+    def image_params(self):
+        """cv2.imwrite 옵션."""
+        if self.image_format == 'jpg':
+            return [cv2.IMWRITE_JPEG_QUALITY, int(self.quality)]
+        return [cv2.IMWRITE_PNG_COMPRESSION, 3]
+
+    def image_path(self, frame_number):
+        """원본 프레임 번호로 만든 이미지 경로."""
+        return os.path.join(self.output_dir, f"frame_{frame_number:07d}.{self.image_format}")
+
+    def run(self, logger='bar'):
+        """추출 실행 → {'frames': 저장한 장 수, 'seconds': 걸린 시간, 'fps': 초당 저장 장 수}.
+
+        Raises:
+            OSError: 원본을 열 수 없거나 이미지를 저장할 수 없는 경우
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        started = time.perf_counter()
+        _path, decoder = ExportEngine.open_source(self.video_path)
+        pool = ProcessPoolExecutor(max_workers=self.jobs) if self.jobs > 1 else None
+        pending = set()
+        saved = 0
+        try:
+            start = min(int(round(self.start_time * decoder.fps)), max(0, decoder.frame_count - 1))
+            end = decoder.frame_count
+            if self.end_time is not None:
+                end = min(end, int(round(self.end_time * decoder.fps)))
+            targets = range(start, max(end, start + 1), self.every)
+            # 건너뛸 프레임이 이보다 많으면 grab 대신 seek
+            grab_limit = max(1, int(decoder.fps * ExportEngine.GRAB_GAP_SECONDS))
+            params = self.image_params()
+            bar = default_bar_logger(logger)
+            bar(frame_index__total=len(targets))
+            last_update = 0.0
+            # 디코더가 쓰지 않는 프레임의 변환을 건너뛸 수 있도록 간격을 알림
+            decoder.set_decimation(Fraction(self.every) if self.every > 1 else None, start)
+            decoder.seek(start)
+            for target in targets:
+                gap = target - decoder.position if decoder.position >= 0 else -1
+                if 0 <= gap <= grab_limit:
+                    if not all(decoder.grab() for _ in range(gap)):
+                        break
+                else:
+                    decoder.seek(target)
+                ret, frame = decoder.read()
+                if not ret:
+                    break
+                path = self.image_path(target)
+                if pool is None:
+                    encode_image(path, frame, self.rotation_angle, self.crop, params)
+                    saved += 1
+                else:
+                    if len(pending) >= self.jobs * self.PENDING_PER_JOB:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                        saved += len(done)
+                    pending.add(pool.submit(encode_image, path, frame, self.rotation_angle, self.crop, params))
+                now = time.monotonic()
+                if now - last_update > 0.1:
+                    bar(frame_index__index=saved)
+                    last_update = now
+            for future in pending:
+                future.result()
+            saved += len(pending)
+            pending = set()
+            bar(frame_index__index=saved)
+        finally:
+            for future in pending:
+                future.cancel()
+            if pool is not None:
+                pool.shutdown(wait=True)
+            decoder.close()
+        seconds = time.perf_counter() - started
+        return {'frames': saved, 'seconds': round(seconds, 3), 'fps': round(saved / max(seconds, 1e-6), 2)}
@@ -0,0 +1,90 @@
+"""비디오 키프레임 위치 색인 모듈."""
+
+import bisect
+import os
+
+import numpy as np
+
+from .ffmpeg_utils import FFmpegUtils
+from .media_cache import MediaCache
+
+
+class KeyframeIndex:
+    """키프레임의 프레임 번호(표시 순서 기준) 목록.
+
+    디코딩 없이 패킷만 복사(-c copy)하며 framecrc로 pts/플래그를 읽어 만든다.
+    프레임 번호는 전체 패킷 pts를 정렬한 순위이므로 B-프레임/VFR에서도
+    OpenCV의 CAP_PROP_POS_FRAMES와 일치한다.
+    """
+
+    CACHE_KIND = 'keyframes'
+
+    def __init__(self, frames, total_frames):
+        """초기화.
+
+        Args:
+            frames: 키프레임 프레임 번호 (오름차순)
+            total_frames: 전체 프레임 수
+        """
+        self.frames = [int(f) for f in frames]
+        self.total_frames = int(total_frames)
+        if not self.frames or self.frames[0] != 0:
+            self.frames.insert(0, 0)
+
+    def at_or_before(self, frame):
+        """frame 이하의 가장 가까운 키프레임."""
+        i = bisect.bisect_right(self.frames, frame) - 1
+        return self.frames[max(0, i)]
+
+    def after(self, frame):
+        """frame보다 뒤의 첫 키프레임 (없으면 total_frames)."""
+        i = bisect.bisect_right(self.frames, frame)
+        return self.frames[i] if i < len(self.frames) else self.total_frames
+
+    @staticmethod
+    def parse_framecrc(text):
+        """framecrc 출력에서 (키프레임 번호 리스트, 전체 프레임 수) 추출."""
+        entries = []
+        for line in text.splitlines():
+            if not line or line.startswith('#'):
+                continue
+            cols = [c.strip() for c in line.split(',')]
+            if len(cols) < 6:
+                continue
+            pts = int(cols[2])
+            flags = 0x1
+            for col in cols[6:]:
+                if col.startswith('F='):
+                    flags = int(col[2:], 16)
+            entries.append((pts, bool(flags & 0x1)))
+        entries.sort(key=lambda e: e[0])
+        keyframes = [i for i, (_pts, key) in enumerate(entries) if key]
+        return keyframes, len(entries)
+
+    @classmethod
+    def load(cls, video_path):
+        """캐시를 확인하고 없으면 색인 생성.
+
+        Raises:
+            RuntimeError: ffmpeg 실행 실패
+            OSError: 파일 접근 실패
+        """
+        cache_path = MediaCache.cache_file(cls.CACHE_KIND, video_path, '.npz')
+        try:
+            with np.load(cache_path) as data:
+                return cls(data['frames'].tolist(), int(data['total_frames']))
+        except (OSError, KeyError, ValueError):
+            pass
+
+        result = FFmpegUtils.run([
+            '-loglevel', 'error', '-i', video_path,
+            '-map', '0:v:0', '-c', 'copy', '-f', 'framecrc', '-',
+        ])
+        keyframes, total = cls.parse_framecrc(result.stdout.decode('ascii', errors='replace'))
+        tmp_path = cache_path + '.tmp.npz'
+        try:
+            np.savez(tmp_path, frames=np.asarray(keyframes, dtype=np.int64), total_frames=total)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+        return cls(keyframes, total)
@@ -0,0 +1,158 @@
+"""구간 반복 재생용 사전 렌더링 버퍼 모듈."""
+
+import os
+import tempfile
+import threading
+
+import cv2
+import numpy as np
+
+from .media_cache import MediaCache
+from .video_processor import VideoProcessor
+from .decoders import DecoderSelector, open_decoder
+
+
+class LoopBuffer:
+    """반복 구간을 표시 해상도(회전/크롭/letterbox/RGB 변환 완료)로 미리 렌더링해 두는 버퍼.
+
+    프레임은 캐시 디렉터리의 임시 파일에 np.memmap으로 기록하므로 메모리는
+    OS 페이지 캐시가 관리한다. 첫 바퀴 동안 백그라운드에서 채워지며, 채워진
+    프레임은 디코딩 없이 바로 표시할 수 있다.
+    """
+
+    CACHE_KIND = 'loop'
+    # 버퍼 파일 최대 크기 (초과하는 구간은 버퍼 없이 스트리밍 재생)
+    MAX_BYTES = 1536 * 1024 * 1024
+
+    def __init__(self, video_path, first, last, canvas_w, canvas_h, rotation_angle, crop=None, scale=None):
+        """초기화.
+
+        Args:
+            video_path: 원본 비디오 경로
+            first: 구간 첫 프레임
+            last: 구간 마지막 프레임 (포함)
+            canvas_w: 표시 폭
+            canvas_h: 표시 높이
+            rotation_angle: 미리보기 회전 각도
+            crop: 회전된 프레임 기준 크롭 영역 (x, y, w, h), None이면 전체
+            scale: 표시 배율 (None이면 맞춤)
+        """
+        self.video_path = video_path
+        self.first = first
+        self.last = last
+        self.canvas_w = canvas_w
+        self.canvas_h = canvas_h
+        self.rotation_angle = rotation_angle
+        self.crop = crop
+        self.scale = scale
+        self._ready = np.zeros(last - first + 1, dtype=bool)
+        self._cancel = threading.Event()
+        self._thread = None
+        self._frames = None
+        self._path = None
+
+    @property
+    def key(self):
+        """버퍼 재사용 판단용 키 (구간/표시 크기/회전/크롭/배율이 같으면 재사용)."""
+        return (self.video_path, self.first, self.last, self.canvas_w, self.canvas_h, self.rotation_angle,
+                self.crop, self.scale)
+
+    @classmethod
+    def fits(cls, frame_count, canvas_w, canvas_h):
+        """구간 전체가 크기 예산 안에 들어가는지 여부."""
+        return frame_count * canvas_w * canvas_h * 3 <= cls.MAX_BYTES
+
+    def start(self, start_at=None):
+        """버퍼 파일 생성 후 백그라운드 렌더링 시작.
+
+        Args:
+            start_at: 먼저 렌더링할 프레임 (현재 재생 위치, 이후 구간 끝까지 → 구간 처음부터)
+        """
+        count = self.last - self.first + 1
+        fd, self._path = tempfile.mkstemp(suffix='.rgb', dir=MediaCache.cache_dir(self.CACHE_KIND))
+        os.close(fd)
+        self._frames = np.memmap(self._path, dtype=np.uint8, mode='w+',
+                                 shape=(count, self.canvas_h, self.canvas_w, 3))
+        # 매핑 후 바로 삭제해 비정상 종료 시에도 파일이 남지 않게 함 (Windows는 실패 → close()에서 삭제)
+        try:
+            os.remove(self._path)
+            self._path = None
+        except OSError:
+            pass
+        if start_at is None or not self.first <= start_at <= self.last:
+            start_at = self.first
+        self._thread = threading.Thread(target=self._run, args=(start_at,), daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """렌더링 중단 및 버퍼 파일 삭제 (UI 스레드에서 부르므로 렌더링 스레드를 기다리지 않음).
+
+        렌더링 중이면 파일 삭제는 스레드가 멈출 때 한다.
+        """
+        self._cancel.set()
+        self._frames = None
+        if not self.building:
+            self._remove_file()
+
+    def _remove_file(self):
+        if self._path is not None:
+            try:
+                os.remove(self._path)
+            except OSError:
+                pass
+            self._path = None
+
+    def get(self, frame_number):
+        """렌더링된 RGB 프레임 (아직 채워지지 않았거나 구간 밖이면 None)."""
+        index = frame_number - self.first
+        frames = self._frames
+        if frames is None or index < 0 or index >= len(self._ready) or not self._ready[index]:
+            return None
+        return frames[index]
+
+    def covers(self, frame_number):
+        """frame_number가 버퍼 구간 안인지 여부."""
+        return self.first <= frame_number <= self.last
+
+    @property
+    def building(self):
+        """백그라운드 렌더링이 진행 중인지 여부."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _render_span(self, cap, lo, hi):
+        """[lo, hi] 프레임을 한 번의 seek 후 순차 렌더링."""
+        cap.seek(lo)
+        frames = self._frames
+        for frame_number in range(lo, hi + 1):
+            if self._cancel.is_set():
+                return False
+            ret, frame = cap.read()
+            if not ret:
+                return False
+            index = frame_number - self.first
+            rotated = VideoProcessor.transform_frame(frame, self.rotation_angle, self.crop)
+            fitted = VideoProcessor.letterbox_bgr(rotated, self.canvas_w, self.canvas_h, self.scale)
+            cv2.cvtColor(fitted, cv2.COLOR_BGR2RGB, dst=frames[index])
+            # 프레임을 다 쓴 뒤에 공개
+            self._ready[index] = True
+        return True
+
+    def _run(self, start_at):
+        try:
+            self._render(start_at)
+        finally:
+            # 렌더링 중에 닫힌 버퍼의 파일은 여기서 삭제
+            if self._cancel.is_set():
+                self._remove_file()
+
+    def _render(self, start_at):
+        try:
+            cap = open_decoder(self.video_path, DecoderSelector.choose(self.video_path, 'sequential'))
+        except OSError:
+            return
+        try:
+            # 재생 위치부터 렌더링해 첫 바퀴도 버퍼에서 표시되도록 함
+            if self._render_span(cap, start_at, self.last) and start_at > self.first:
+                self._render_span(cap, self.first, start_at - 1)
+        finally:
+            cap.close()
@@ -0,0 +1,39 @@
+"""로컬 캐시 디렉터리 관리 모듈."""
+
+import hashlib
+import os
+
+
+class MediaCache:
+    """썸네일/분석 결과/벤치마크 등 로컬 캐시 경로를 제공하는 클래스."""
+
+    @staticmethod
+    def root_dir():
+        """캐시 최상위 디렉터리 (VIDEOEDIT_CACHE_DIR 환경변수로 변경 가능)."""
+        root = os.environ.get('VIDEOEDIT_CACHE_DIR')
+        if not root:
+            base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+            root = os.path.join(base, 'videoEdit')
+        return root
+
+    @staticmethod
+    def cache_dir(kind):
+        """종류별 캐시 디렉터리 (없으면 생성)."""
+        path = os.path.join(MediaCache.root_dir(), kind)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    @staticmethod
+    def source_key(video_path):
+        """원본 파일 식별 키 (절대 경로 + 크기 + 수정 시각 기반 해시).
+
+        파일이 교체되거나 수정되면 키가 바뀌어 이전 캐시를 사용하지 않는다.
+        """
+        st = os.stat(video_path)
+        ident = f"{os.path.abspath(video_path)}|{st.st_size}|{st.st_mtime_ns}"
+        return hashlib.sha1(ident.encode('utf-8')).hexdigest()[:24]
+
+    @staticmethod
+    def cache_file(kind, video_path, suffix):
+        """원본 파일별 캐시 파일 경로."""
+        return os.path.join(MediaCache.cache_dir(kind), MediaCache.source_key(video_path) + suffix)
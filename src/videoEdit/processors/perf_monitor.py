@@ -0,0 +1,131 @@
+"""미리보기/재생 파이프라인 성능 계측 모듈."""
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+
+class PerfMonitor:
+    """단계별 소요 시간을 최근 N개 샘플로 모아 백분위수를 계산하는 클래스."""
+
+    # 미리보기 경로 단계 (HUD/리포트 표시 순서)
+    PREVIEW_STAGES = (
+        'open', 'seek', 'decode', 'rotate', 'letterbox',
+        'color_convert', 'photoimage', 'blit',
+    )
+    # 재생 경로 단계
+    PLAYBACK_STAGES = ('tick_late', 'render')
+
+    def __init__(self, window: int = 240, enabled: bool = True):
+        """초기화.
+
+        Args:
+            window: 단계별로 유지할 최근 샘플 수
+            enabled: False면 기록하지 않음
+        """
+        self.window = window
+        self.enabled = enabled
+        self._samples = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def of(app):
+        """app에 연결된 모니터 반환 (없으면 기록하지 않는 모니터)."""
+        monitor = getattr(app, 'perf_monitor', None)
+        if monitor is None:
+            return _NULL_MONITOR
+        return monitor
+
+    @contextmanager
+    def stage(self, name: str):
+        """with 블록의 소요 시간을 name 단계로 기록."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000.0)
+
+    def record(self, name: str, value_ms: float):
+        """단계 소요 시간(ms) 샘플 추가."""
+        if not self.enabled:
+            return
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = deque(maxlen=self.window)
+                self._samples[name] = samples
+            samples.append(float(value_ms))
+
+    def set_counter(self, name: str, value: int):
+        """누적 카운터 값 설정 (드롭 프레임 수 등)."""
+        with self._lock:
+            self._counters[name] = int(value)
+
+    def reset(self):
+        """모든 샘플과 카운터 초기화."""
+        with self._lock:
+            self._samples.clear()
+            self._counters.clear()
+
+    def summary(self):
+        """단계별 count/last/mean/p50/p95/p99/max (ms) 딕셔너리."""
+        with self._lock:
+            snapshot = {name: list(samples) for name, samples in self._samples.items()}
+        result = {}
+        for name, values in snapshot.items():
+            if not values:
+                continue
+            arr = np.asarray(values)
+            p50, p95, p99 = np.percentile(arr, (50, 95, 99))
+            result[name] = {
+                'count': int(arr.size),
+                'last': round(float(arr[-1]), 3),
+                'mean': round(float(arr.mean()), 3),
+                'p50': round(float(p50), 3),
+                'p95': round(float(p95), 3),
+                'p99': round(float(p99), 3),
+                'max': round(float(arr.max()), 3),
+            }
+        return result
+
+    def report(self):
+        """JSON으로 저장 가능한 리포트 딕셔너리."""
+        with self._lock:
+            counters = dict(self._counters)
+        return {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'window': self.window,
+            'stages_ms': self.summary(),
+            'counters': counters,
+        }
+
+    def dump_json(self, path: str):
+        """리포트를 JSON 파일로 저장."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+
+    def hud_lines(self):
+        """HUD 오버레이용 텍스트 줄 목록."""
+        summary = self.summary()
+        lines = []
+        for name in self.PREVIEW_STAGES + self.PLAYBACK_STAGES:
+            s = summary.get(name)
+            if s is None:
+                continue
+            lines.append(f"{name:<13} p50 {s['p50']:6.2f}  p95 {s['p95']:6.2f}  p99 {s['p99']:6.2f} ms")
+        with self._lock:
+            counters = dict(self._counters)
+        if counters:
+            lines.append("  ".join(f"{k}: {v}" for k, v in sorted(counters.items())))
+        return lines
+
+
+_NULL_MONITOR = PerfMonitor(window=1, enabled=False)
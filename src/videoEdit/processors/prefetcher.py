@@ -0,0 +1,134 @@
+"""일시정지 중 재생 위치 주변 프레임 프리페치 모듈."""
+
+import threading
+import time
+
+from .decoders import DecoderSelector, open_decoder
+
+
+class FramePrefetcher:
+    """유휴 시간에 current_frame 주변 프레임을 미리 디코딩해 FrameCache를 채우는 클래스.
+
+    미리보기 디코더(app._decoders)와 별개의 디코더를 사용하며, 재생이나
+    내보내기가 시작되면 pause()로 다음 프레임 디코딩 전에 즉시 물러난다.
+    """
+
+    # 마지막 조작 후 이 시간(초)이 지나야 프리페치 시작
+    IDLE_DELAY = 0.15
+
+    def __init__(self, cache, window=48, bias=0.75):
+        """초기화.
+
+        Args:
+            cache: 채울 FrameCache
+            window: 현재 프레임 주변에서 미리 읽을 전체 프레임 수
+            bias: 마지막 이동 방향 쪽에 할당할 비율 (0.5면 양쪽 균등)
+        """
+        self.cache = cache
+        self.window = window
+        self.bias = bias
+        self._video_path = None
+        self._total_frames = 0
+        self._center = 0
+        self._direction = 1
+        self._request_time = 0.0
+        self._generation = 0
+        self._paused = 0
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def set_source(self, video_path, total_frames):
+        """프리페치 대상 파일 변경."""
+        with self._cond:
+            self._video_path = video_path
+            self._total_frames = total_frames
+            self._generation += 1
+            self._cond.notify()
+
+    def request(self, center, direction=0):
+        """center 주변 프리페치 요청 (direction: -1 뒤로, +1 앞으로, 0 이전 방향 유지)."""
+        with self._cond:
+            self._center = center
+            if direction:
+                self._direction = 1 if direction > 0 else -1
+            self._request_time = time.monotonic()
+            self._generation += 1
+            self._cond.notify()
+
+    def pause(self):
+        """재생/내보내기 등 디코더가 필요한 작업 시작 시 호출 (중첩 가능)."""
+        with self._cond:
+            self._paused += 1
+            self._generation += 1
+
+    def resume(self):
+        """pause()에 대응하는 재개."""
+        with self._cond:
+            self._paused = max(0, self._paused - 1)
+            self._cond.notify()
+
+    def _window_range(self, center, direction, total):
+        """방향 편향을 반영한 [lo, hi] 프레임 범위."""
+        lead = int(round(self.window * self.bias))
+        trail = self.window - lead
+        if direction < 0:
+            lo, hi = center - lead, center + trail
+        else:
+            lo, hi = center - trail, center + lead
+        return max(0, lo), min(total - 1, hi)
+
+    def _should_stop(self, generation):
+        return self._paused > 0 or generation != self._generation
+
+    def _run(self):
+        cap = None
+        cap_path = None
+        while True:
+            with self._cond:
+                while self._video_path is None or self._paused > 0 or self._total_frames <= 0:
+                    self._cond.wait()
+                wait = self._request_time + self.IDLE_DELAY - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                generation = self._generation
+                video_path = self._video_path
+                center = self._center
+                direction = self._direction
+                total = self._total_frames
+
+            if cap_path != video_path:
+                if cap is not None:
+                    cap.close()
+                    cap = None
+                cap_path = video_path
+                try:
+                    cap = open_decoder(video_path, DecoderSelector.choose(video_path, 'sequential'))
+                except OSError:
+                    pass
+
+            lo, hi = self._window_range(center, direction, total)
+            missing = [n for n in range(lo, hi + 1) if n not in self.cache]
+            if missing and cap is not None:
+                self._fill(cap, video_path, missing[0], missing[-1], generation)
+
+            with self._cond:
+                # 새 요청이 없으면 다음 요청까지 대기
+                if generation == self._generation and not self._should_stop(generation):
+                    self._cond.wait()
+
+    def _fill(self, cap, video_path, lo, hi, generation):
+        """[lo, hi]를 한 번의 seek 후 순차 디코딩하며 캐시에 추가."""
+        cap.seek(lo)
+        for n in range(lo, hi + 1):
+            if self._should_stop(generation):
+                return
+            if n in self.cache:
+                if not cap.grab():
+                    return
+                continue
+            ret, frame = cap.read()
+            if not ret:
+                return
+            self.cache.put(n, frame, source=video_path)
@@ -0,0 +1,150 @@
+"""역재생용 GOP 단위 프레임 버퍼 모듈."""
+
+import threading
+
+import cv2
+
+from .decoders import DecoderSelector, open_decoder
+
+
+class ReverseReader:
+    """GOP(또는 CHUNK_FRAMES 조각)를 앞으로 디코딩해 버퍼에 담고 역순으로 꺼내는 클래스.
+
+    디코딩은 모두 백그라운드 스레드에서 하며, frame()은 기다리지 않는다: 요청한 프레임이 아직
+    버퍼에 없으면 None을 반환하고(호출 측에서 드롭으로 집계) 해당 조각을 가장 먼저 디코딩하도록 요청한다.
+    새 요청은 대기 중인 요청을 대체하고, 더 이상 필요 없는 조각의 디코딩은 중간에 멈춘다.
+    메모리에는 현재/다음 조각 두 개만 유지한다.
+    """
+
+    # 한 버퍼에 담는 최대 프레임 수 (긴 GOP는 이 단위로 나눔)
+    CHUNK_FRAMES = 60
+
+    def __init__(self, video_path, total_frames, keyframes=None, max_side=None):
+        """초기화.
+
+        Args:
+            video_path: 원본 비디오 경로
+            total_frames: 전체 프레임 수
+            keyframes: KeyframeIndex (없으면 CHUNK_FRAMES 고정 간격으로 나눔)
+            max_side: 버퍼 프레임의 긴 변 최대 크기 (미리보기 크기로 축소해 메모리 절약)
+        """
+        self.video_path = video_path
+        self.total_frames = total_frames
+        self.keyframes = keyframes
+        self.max_side = max_side
+        self._cap = None
+        self._cap_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._chunks = {}
+        # 유지할 조각 시작 프레임 집합과 디코딩 대기열 [(lo, hi)] (최신 요청이 대체)
+        self._wanted = set()
+        self._queue = []
+        self._worker = None
+        self._closed = False
+
+    def close(self):
+        """버퍼와 디코더 해제 (디코딩 중인 스레드는 다음 프레임에서 멈춤)."""
+        self._closed = True
+        with self._lock:
+            self._chunks.clear()
+            self._queue = []
+            self._wanted = set()
+        with self._cap_lock:
+            if self._cap is not None:
+                self._cap.close()
+                self._cap = None
+
+    def chunk_bounds(self, frame):
+        """frame이 속한 조각의 [lo, hi) 범위."""
+        if self.keyframes is not None:
+            gop_start = self.keyframes.at_or_before(frame)
+            gop_end = min(self.keyframes.after(frame), self.total_frames)
+        else:
+            gop_start, gop_end = 0, self.total_frames
+        lo = gop_start + ((frame - gop_start) // self.CHUNK_FRAMES) * self.CHUNK_FRAMES
+        return lo, min(lo + self.CHUNK_FRAMES, gop_end)
+
+    def _shrink(self, frame):
+        if not self.max_side:
+            return frame
+        h, w = frame.shape[:2]
+        scale = self.max_side / float(max(h, w))
+        if scale >= 1.0:
+            return frame
+        size = (max(1, int(w * scale)), max(1, int(h * scale)))
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+    def _load(self, lo, hi):
+        """[lo, hi) 조각을 한 번의 seek 후 순차 디코딩해 버퍼에 저장 (필요 없어지면 중단)."""
+        frames = []
+        with self._cap_lock:
+            if self._closed:
+                return
+            if self._cap is None:
+                try:
+                    self._cap = open_decoder(self.video_path, DecoderSelector.choose(self.video_path, 'sequential'))
+                except OSError:
+                    return
+            self._cap.seek(lo)
+            for _ in range(hi - lo):
+                if self._closed or lo not in self._wanted:
+                    return
+                ret, frame = self._cap.read()
+                if not ret:
+                    break
+                frames.append(self._shrink(frame))
+        with self._lock:
+            if lo in self._wanted:
+                self._chunks[lo] = frames
+
+    def _run(self):
+        """대기열의 조각을 차례로 디코딩 (대기열이 비면 종료)."""
+        while not self._closed:
+            with self._lock:
+                if not self._queue:
+                    self._worker = None
+                    return
+                lo, hi = self._queue.pop(0)
+            self._load(lo, hi)
+        with self._lock:
+            self._worker = None
+
+    def _request(self, chunks):
+        """chunks [(lo, hi)] 순서로 디코딩 요청 (이전 대기 요청은 대체, 그 외 조각은 해제)."""
+        with self._lock:
+            self._wanted = {lo for lo, _hi in chunks}
+            for key in [k for k in self._chunks if k not in self._wanted]:
+                del self._chunks[key]
+            self._queue = [(lo, hi) for lo, hi in chunks if lo not in self._chunks]
+            if self._queue and self._worker is None and not self._closed:
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+
+    def frame(self, n, floor=0, wrap_to=None):
+        """프레임 n을 버퍼에서 반환 (없으면 디코딩을 요청하고 기다리지 않음).
+
+        Args:
+            n: 프레임 번호
+            floor: 역재생 구간의 시작 프레임 (이보다 앞 조각은 미리 읽지 않음)
+            wrap_to: floor에 도달한 뒤 이어서 표시할 프레임 (구간 반복용)
+
+        Returns:
+            BGR 프레임 (max_side로 축소됨) 또는 None (아직 디코딩되지 않음)
+        """
+        lo, hi = self.chunk_bounds(n)
+        # 현재 조각을 먼저, 다음에 표시할(앞쪽) 조각을 그다음으로 디코딩
+        chunks = [(lo, hi)]
+        next_frame = lo - 1 if lo - 1 >= floor else wrap_to
+        if next_frame is not None and 0 <= next_frame < self.total_frames:
+            next_chunk = self.chunk_bounds(next_frame)
+            if next_chunk[0] != lo:
+                chunks.append(next_chunk)
+        self._request(chunks)
+        with self._lock:
+            frames = self._chunks.get(lo)
+        if not frames:
+            return None
+        index = n - lo
+        if index >= len(frames):
+            return frames[-1]
+        return frames[index]
@@ -0,0 +1,177 @@
+"""장면 전환(shot boundary) 검출 모듈."""
+
+import os
+import threading
+
+import numpy as np
+
+from .ffmpeg_utils import FFmpegUtils
+from .media_cache import MediaCache
+
+
+class SceneDetector:
+    """저해상도 그레이 프레임의 히스토그램/픽셀 차이로 장면 전환을 찾는 클래스.
+
+    ffmpeg가 디코딩 단계에서 루프 필터를 생략하고 64x36으로 축소한 그레이
+    프레임만 파이프로 넘기며, 지표 계산은 BATCH 프레임 단위로 NumPy에서 한 번에 한다.
+    """
+
+    CACHE_KIND = 'scenes'
+    ANALYSIS_W = 64
+    ANALYSIS_H = 36
+    HIST_BINS = 32
+    BATCH = 256
+    # 장면 전환 판정: 절대 임계값 + 주변 대비 배수
+    THRESHOLD = 0.3
+    LOCAL_RATIO = 3.0
+    LOCAL_WINDOW = 15
+    # 장면 최소 길이(초) - 플래시 등으로 인한 연속 검출 방지
+    MIN_SHOT_SECONDS = 0.25
+
+    def __init__(self, video_path, fps, on_done, on_progress=None):
+        """초기화.
+
+        Args:
+            video_path: 원본 비디오 경로
+            fps: 원본 FPS (최소 장면 길이 계산용)
+            on_done: 완료 시 장면 전환 프레임 번호 리스트로 호출 (워커 스레드에서, 취소 시 호출 안 함)
+            on_progress: 분석한 프레임 수로 주기적으로 호출 (선택)
+        """
+        self.video_path = video_path
+        self.fps = fps if fps > 0 else 30.0
+        self.on_done = on_done
+        self.on_progress = on_progress
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """백그라운드 분석 시작."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """분석 중단 요청."""
+        self._cancel.set()
+
+    def _cache_path(self):
+        return MediaCache.cache_file(self.CACHE_KIND, self.video_path, '.npz')
+
+    @staticmethod
+    def frame_scores(frames, previous=None):
+        """연속 프레임 간 변화 점수 (0~1).
+
+        Args:
+            frames: (n, h, w) uint8 그레이 프레임 배치
+            previous: 직전 배치의 마지막 프레임 (없으면 첫 프레임 점수는 0)
+
+        Returns:
+            길이 n의 float32 배열
+        """
+        n = frames.shape[0]
+        pixels = frames.shape[1] * frames.shape[2]
+        bins = SceneDetector.HIST_BINS
+        shift = int(np.log2(256 // bins))
+
+        # 배치 전체 히스토그램을 한 번의 bincount로 계산
+        binned = (frames >> shift).reshape(n, -1).astype(np.int64)
+        binned += (np.arange(n, dtype=np.int64) * bins)[:, None]
+        hists = np.bincount(binned.ravel(), minlength=n * bins).reshape(n, bins) / float(pixels)
+
+        if previous is not None:
+            prev_hist = np.bincount((previous >> shift).ravel(), minlength=bins) / float(pixels)
+            stacked = np.concatenate([previous[None], frames])
+            hists_prev = np.concatenate([prev_hist[None], hists[:-1]])
+        else:
+            stacked = np.concatenate([frames[:1], frames])
+            hists_prev = np.concatenate([hists[:1], hists[:-1]])
+
+        hist_diff = 0.5 * np.abs(hists - hists_prev).sum(axis=1)
+        pix_diff = np.abs(np.diff(stacked.astype(np.int16), axis=0)).reshape(n, -1).mean(axis=1) / 255.0
+        return (0.5 * hist_diff + 0.5 * pix_diff).astype(np.float32)
+
+    @staticmethod
+    def detect(scores, fps):
+        """점수 배열에서 장면 전환 프레임 번호 검출."""
+        scores = np.asarray(scores, dtype=np.float32)
+        if scores.size < 2:
+            return []
+        window = SceneDetector.LOCAL_WINDOW
+        padded = np.pad(scores, window, mode='edge')
+        # 주변 구간 중앙값 (자기 자신 포함, 큰 값 하나는 중앙값에 영향이 적음)
+        windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * window + 1)
+        local = np.median(windows, axis=1)
+        candidates = np.flatnonzero(
+            (scores > SceneDetector.THRESHOLD) &
+            (scores > local * SceneDetector.LOCAL_RATIO)
+        )
+
+        min_gap = max(1, int(round(fps * SceneDetector.MIN_SHOT_SECONDS)))
+        boundaries = []
+        for idx in candidates:
+            if idx == 0:
+                continue
+            if boundaries and idx - boundaries[-1] < min_gap:
+                # 가까운 후보 중 점수가 더 큰 쪽 유지
+                if scores[idx] > scores[boundaries[-1]]:
+                    boundaries[-1] = int(idx)
+                continue
+            boundaries.append(int(idx))
+        return boundaries
+
+    def compute(self):
+        """캐시를 확인하고 없으면 전체 분석 (취소 시 None)."""
+        cache_path = self._cache_path()
+        try:
+            with np.load(cache_path) as data:
+                return [int(v) for v in data['boundaries']]
+        except (OSError, KeyError, ValueError):
+            pass
+
+        w, h = self.ANALYSIS_W, self.ANALYSIS_H
+        frame_bytes = w * h
+        proc = FFmpegUtils.open_pipe([
+            '-skip_loop_filter', 'all', '-flags2', 'fast',
+            '-i', self.video_path, '-an', '-fps_mode', 'passthrough',
+            '-vf', f"scale={w}:{h}:flags=fast_bilinear,format=gray",
+            '-f', 'rawvideo', '-pix_fmt', 'gray', '-',
+        ])
+        score_parts = []
+        previous = None
+        analyzed = 0
+        try:
+            while not self._cancel.is_set():
+                data = proc.stdout.read(frame_bytes * self.BATCH)
+                n = len(data) // frame_bytes
+                if n == 0:
+                    break
+                frames = np.frombuffer(data[:n * frame_bytes], dtype=np.uint8).reshape(n, h, w)
+                score_parts.append(self.frame_scores(frames, previous))
+                previous = frames[-1]
+                analyzed += n
+                if self.on_progress is not None:
+                    self.on_progress(analyzed)
+        finally:
+            if self._cancel.is_set():
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+
+        if self._cancel.is_set():
+            return None
+        scores = np.concatenate(score_parts) if score_parts else np.zeros(0, dtype=np.float32)
+        boundaries = self.detect(scores, self.fps)
+        tmp_path = cache_path + '.tmp.npz'
+        try:
+            np.savez(tmp_path, boundaries=np.asarray(boundaries, dtype=np.int64), scores=scores)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+        return boundaries
+
+    def _run(self):
+        try:
+            boundaries = self.compute()
+        except OSError:
+            boundaries = []
+        if boundaries is not None and not self._cancel.is_set():
+            self.on_done(boundaries)
@@ -0,0 +1,134 @@
+"""중단 후 이어서 할 수 있는 분할 내보내기 모듈."""
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import asdict
+
+from .export_engine import ExportEngine
+from .ffmpeg_utils import FFmpegUtils
+from .ffmpeg_writer import FFmpegWriter
+from .media_cache import MediaCache
+
+
+class SegmentedExport:
+    """출력을 일정 길이의 조각으로 나눠 인코딩하고, 완료된 조각을 manifest에 기록하는 클래스.
+
+    중단된 뒤 같은 원본/설정/출력 경로로 다시 실행하면 완료된 조각은 건너뛰고 남은 조각부터
+    인코딩한다. 모든 조각이 끝나면 스트림 복사로 이어 붙이면서 원본 구간 오디오를 함께 담는다.
+    """
+
+    CACHE_KIND = 'exports'
+    SEGMENT_SECONDS = 30.0
+    # 출력 길이가 이 값(초) 이상이면 GUI 내보내기에서 분할 모드 사용
+    MIN_DURATION = 120.0
+    MANIFEST_VERSION = 1
+
+    def __init__(self, source, output_path, spec, work_dir=None, segment_seconds=None):
+        """초기화.
+
+        Args:
+            source: 원본 비디오 경로 또는 VideoFileClip
+            output_path: 출력 파일 경로
+            spec: ExportSpec
+            work_dir: 조각/manifest 저장 디렉터리 (기본: 캐시 디렉터리 아래 작업별 디렉터리)
+            segment_seconds: 조각 길이(초)
+        """
+        self.video_path = source if isinstance(source, str) else source.filename
+        self.output_path = output_path
+        self.spec = spec
+        self.segment_seconds = segment_seconds or self.SEGMENT_SECONDS
+        self.work_dir = work_dir or os.path.join(
+            MediaCache.cache_dir(self.CACHE_KIND), self.job_key(self.video_path, output_path, spec))
+        self.resumed_segments = 0
+
+    @staticmethod
+    def job_key(video_path, output_path, spec):
+        """원본 파일 + 설정 + 출력 경로로 만든 작업 키 (같은 작업이면 같은 키)."""
+        ident = json.dumps({
+            'source': MediaCache.source_key(video_path),
+            'spec': asdict(spec),
+            'output': os.path.abspath(output_path),
+        }, sort_keys=True)
+        return hashlib.sha1(ident.encode('utf-8')).hexdigest()[:24]
+
+    @property
+    def manifest_path(self):
+        return os.path.join(self.work_dir, 'manifest.json')
+
+    def _segment_path(self, index, partial=False):
+        ext = os.path.splitext(self.output_path)[1] or '.mp4'
+        return os.path.join(self.work_dir, f"seg_{index:04d}{'.part' if partial else ''}{ext}")
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_manifest(self, manifest):
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def plan(self, output_frames):
+        """출력 프레임 [0, output_frames)를 나눈 조각 목록 [(first, last), ...]."""
+        step = max(1, int(round(self.segment_seconds * self.spec.fps)))
+        return [(k, min(k + step, output_frames)) for k in range(0, output_frames, step)]
+
+    def run(self, logger='bar'):
+        """남은 조각을 인코딩하고 최종 파일로 합치기.
+
+        Raises:
+            OSError: 원본을 열 수 없거나 작업 디렉터리에 쓸 수 없는 경우
+            RuntimeError: 인코딩 또는 합치기에 실패한 경우
+        """
+        os.makedirs(self.work_dir, exist_ok=True)
+        _video_path, decoder = ExportEngine.open_source(self.video_path)
+        try:
+            fps_in = decoder.fps
+            ranges = ExportEngine.frame_ranges(decoder, self.spec)
+            audio_ranges = ExportEngine.audio_ranges(ranges, fps_in, self.spec.fps)
+            output_frames = sum(ExportEngine.range_counts(ranges, fps_in, self.spec.fps))
+            segments = self.plan(output_frames)
+
+            manifest = self._load_manifest()
+            if (manifest is None or manifest.get('version') != self.MANIFEST_VERSION
+                    or manifest.get('segments') != [list(s) for s in segments]):
+                manifest = {'version': self.MANIFEST_VERSION, 'segments': [list(s) for s in segments], 'done': []}
+                self._save_manifest(manifest)
+            done = {i for i in manifest['done'] if os.path.exists(self._segment_path(i))}
+            self.resumed_segments = len(done)
+
+            for index, (first, last) in enumerate(segments):
+                if index in done:
+                    continue
+                partial_path = self._segment_path(index, partial=True)
+                ExportEngine.render_range(decoder, self.spec, first, last, partial_path, logger=logger)
+                os.replace(partial_path, self._segment_path(index))
+                done.add(index)
+                manifest['done'] = sorted(done)
+                self._save_manifest(manifest)
+        finally:
+            decoder.close()
+
+        self._concat(len(segments), audio_ranges, fps_in)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _concat(self, segment_count, audio_ranges, fps_in):
+        """조각을 스트림 복사로 이어 붙이고 원본 구간 오디오를 추가."""
+        list_path = os.path.join(self.work_dir, 'segments.txt')
+        with open(list_path, 'w', encoding='utf-8') as f:
+            for index in range(segment_count):
+                path = self._segment_path(index).replace("'", "'\\''")
+                f.write(f"file '{path}'\n")
+        audio_codec = ExportEngine.audio_codec_for(self.video_path, self.output_path, self.spec, fps_in)
+        audio_inputs, audio_outputs = FFmpegWriter.audio_args(self.video_path, audio_ranges, audio_codec, 1)
+        args = (['-loglevel', 'error', '-y', '-f', 'concat', '-safe', '0', '-i', list_path] + audio_inputs
+                + ['-c:v', 'copy'] + audio_outputs + [self.output_path])
+        if os.path.lexists(self.output_path):
+            os.remove(self.output_path)
+        FFmpegUtils.run(args)
@@ -0,0 +1,339 @@
+"""느린 저장소(NAS 등) 원본의 로컬 스테이징(미리 읽기) 모듈."""
+
+import io
+import os
+import threading
+import time
+
+import cv2
+
+from .media_cache import MediaCache
+
+
+class SourceStager:
+    """원본을 큰 순차 읽기로 로컬 캐시 파일에 복사해 두고, 복사된 구간은 로컬 사본에서 읽게 하는 클래스.
+
+    cv2.VideoCapture는 작은 임의 위치 읽기를 많이 하므로 네트워크 저장소에서는 seek이 지연 시간에
+    묶인다. 백그라운드 스레드가 CHUNK_BYTES 단위로 (디코더가 마지막으로 읽은 위치 다음부터) 복사하고,
+    디코더가 아직 복사되지 않은 청크를 읽으면 그 청크 전체를 한 번에 가져와 사본에 채운다.
+    복사는 프로세스별 임시 파일(.<pid>.part)에 하고, 끝나면 최종 이름으로 바꾼 뒤 완료 표시 파일을 남기므로
+    같은 원본을 여러 프로세스(GUI와 CLI 등)가 동시에 스테이징해도 서로의 파일을 덮어쓰지 않는다.
+    원본이 바뀌지 않았다면 다음부터는 바로 로컬 사본을 연다.
+    한 번에 한 원본(마지막으로 연 파일)만 백그라운드로 복사한다.
+    """
+
+    CACHE_KIND = 'staging'
+    CHUNK_BYTES = 8 * 1024 * 1024
+    # 사본 전체 크기 상한 (넘으면 오래 사용하지 않은 사본부터 지움, 이보다 큰 원본은 스테이징 안 함)
+    DEFAULT_MAX_BYTES = 20 * 1024 ** 3
+    # 이 시간 동안 수정되지 않은 임시 파일은 종료된 프로세스가 남긴 것으로 보고 정리
+    STALE_PART_SECONDS = 24 * 3600
+
+    # VIDEOEDIT_STAGING=1 이면 기본으로 사용 (GUI에서는 체크박스로 변경)
+    enabled = os.environ.get('VIDEOEDIT_STAGING', '').strip().lower() in ('1', 'true', 'on')
+
+    _lock = threading.Lock()
+    _active = {}  # 원본 식별 키 -> SourceStager
+
+    def __init__(self, video_path, key, size):
+        """초기화.
+
+        Args:
+            video_path: 원본 비디오 경로
+            key: 원본 식별 키 (MediaCache.source_key)
+            size: 원본 크기 (바이트)
+        """
+        self.video_path = video_path
+        self.key = key
+        self.size = size
+        self.data_path = os.path.join(MediaCache.cache_dir(self.CACHE_KIND),
+                                      key + os.path.splitext(video_path)[1].lower())
+        self.done_path = self.data_path + '.done'
+        self.part_path = f"{self.data_path}.{os.getpid()}.part"
+        # 현재 읽을 로컬 사본 경로 (복사 중에는 임시 파일)
+        self.copy_path = self.part_path
+        self._fetched = bytearray((size + self.CHUNK_BYTES - 1) // self.CHUNK_BYTES)
+        self._remaining = len(self._fetched)
+        self._inflight = set()
+        self._cond = threading.Condition()
+        self._cursor = 0
+        self._out = None
+        self._thread = None
+        self._cancel = threading.Event()
+
+    @classmethod
+    def set_enabled(cls, enabled):
+        """사용 여부 변경 (끄면 진행 중인 백그라운드 복사 중단)."""
+        cls.enabled = bool(enabled)
+        if not cls.enabled:
+            with cls._lock:
+                for stager in cls._active.values():
+                    stager.stop()
+
+    @classmethod
+    def get(cls, video_path):
+        """원본의 스테이저 (사용하지 않거나 스테이징할 수 없으면 None). 필요하면 백그라운드 복사 시작."""
+        if not cls.enabled:
+            return None
+        try:
+            key = MediaCache.source_key(video_path)
+            size = os.path.getsize(video_path)
+        except OSError:
+            return None
+        with cls._lock:
+            stager = cls._active.get(key)
+            if stager is None:
+                if size <= 0 or size > cls.DEFAULT_MAX_BYTES:
+                    return None
+                stager = cls(video_path, key, size)
+                try:
+                    stager._prepare()
+                except OSError:
+                    return None
+                cls._active[key] = stager
+            # 다른 원본의 복사는 멈추고 이 원본에 대역폭을 씀
+            for other in cls._active.values():
+                if other is not stager:
+                    other.stop()
+            stager.start()
+            return stager
+
+    @classmethod
+    def local_path(cls, video_path):
+        """복사가 끝난 로컬 사본 경로 (없으면 원본 경로, 복사는 백그라운드로 시작)."""
+        stager = cls.get(video_path)
+        return stager.copy_path if stager is not None and stager.complete else video_path
+
+    @classmethod
+    def source_for(cls, video_path):
+        """디코더가 열 대상: 로컬 사본 경로, 복사 중이면 StagedStream, 사용하지 않으면 원본 경로."""
+        stager = cls.get(video_path)
+        if stager is None:
+            return video_path
+        if stager.complete:
+            return stager.copy_path
+        return StagedStream(stager)
+
+    @classmethod
+    def open_capture(cls, video_path):
+        """스테이징을 거쳐 cv2.VideoCapture 열기 → (cap, 닫아야 할 스트림 또는 None).
+
+        OpenCV가 파일 객체 입력을 지원하지 않으면(4.10 미만) 복사가 끝난 뒤부터 사본을 연다.
+        """
+        source = cls.source_for(video_path)
+        if isinstance(source, StagedStream):
+            if hasattr(cv2, 'IStreamReader'):
+                return cv2.VideoCapture(source, cv2.CAP_FFMPEG, []), source
+            source.close()
+            source = video_path
+        return cv2.VideoCapture(source), None
+
+    @property
+    def complete(self):
+        return self._remaining == 0
+
+    def fetched(self, index):
+        return bool(self._fetched[index])
+
+    def _prepare(self):
+        """완료된 사본이 있으면 재사용, 없으면 이 프로세스의 임시 파일 생성 (캐시 정리 포함).
+
+        Raises:
+            OSError: 사본 파일을 만들 수 없는 경우
+        """
+        if (os.path.exists(self.done_path) and os.path.exists(self.data_path)
+                and os.path.getsize(self.data_path) == self.size):
+            self._fetched[:] = b'\x01' * len(self._fetched)
+            self._remaining = 0
+            self.copy_path = self.data_path
+            os.utime(self.done_path)
+            return
+        self._evict(self.size)
+        with open(self.part_path, 'wb') as f:
+            f.truncate(self.size)
+        self._out = open(self.part_path, 'r+b')
+
+    def _evict(self, needed):
+        """오래 사용하지 않은(완료 표시 시각 기준) 완료 사본부터 지워 needed 바이트 자리 확보.
+
+        다른 프로세스가 복사 중인 임시 파일은 건드리지 않고, 오래 방치된 임시 파일만 지운다.
+        """
+        cache_dir = MediaCache.cache_dir(self.CACHE_KIND)
+        active = {stager.copy_path for stager in self._active.values()}
+        now = time.time()
+        entries = []
+        for name in os.listdir(cache_dir):
+            path = os.path.join(cache_dir, name)
+            if name.endswith('.done') or path in active:
+                continue
+            try:
+                size = os.path.getsize(path)
+                if name.endswith('.part'):
+                    if now - os.path.getmtime(path) > self.STALE_PART_SECONDS:
+                        os.remove(path)
+                    continue
+                if not os.path.exists(path + '.done'):
+                    continue
+                entries.append((os.path.getmtime(path + '.done'), path, size))
+            except OSError:
+                continue
+        total = sum(size for _used, _path, size in entries)
+        for _used, path, size in sorted(entries):
+            if total + needed <= self.DEFAULT_MAX_BYTES:
+                break
+            for victim in (path + '.done', path):
+                try:
+                    os.remove(victim)
+                except OSError:
+                    pass
+            total -= size
+
+    def start(self):
+        """백그라운드 복사 시작 (이미 진행 중이거나 끝났으면 무시)."""
+        if self.complete or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._cancel.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """백그라운드 복사 중단 (이미 복사된 청크와 읽기 중 가져오는 청크는 계속 사용)."""
+        self._cancel.set()
+
+    def _next_missing(self):
+        """cursor부터 순환하며 아직 복사되지 않았고 가져오는 중도 아닌 첫 청크 (없으면 None)."""
+        count = len(self._fetched)
+        for offset in range(count):
+            index = (self._cursor + offset) % count
+            if not self._fetched[index] and index not in self._inflight:
+                return index
+        return None
+
+    def _run(self):
+        try:
+            with open(self.video_path, 'rb', buffering=0) as source:
+                while not self._cancel.is_set():
+                    with self._cond:
+                        index = self._next_missing()
+                    if index is None:
+                        break
+                    self.fetch(index, source)
+        except OSError:
+            # 원본을 읽을 수 없으면 복사를 멈추고 디코더는 읽을 때 가져온 청크만 사용
+            pass
+
+    def fetch(self, index, source):
+        """청크 하나를 source(원본 파일 객체)에서 읽어 사본에 저장 (이미 있거나 가져오는 중이면 기다림).
+
+        Raises:
+            OSError: 원본을 읽을 수 없는 경우
+        """
+        with self._cond:
+            while index in self._inflight:
+                self._cond.wait()
+            if self._fetched[index]:
+                return
+            self._inflight.add(index)
+        try:
+            offset = index * self.CHUNK_BYTES
+            length = min(self.CHUNK_BYTES, self.size - offset)
+            source.seek(offset)
+            parts = []
+            while length > 0:
+                data = source.read(length)
+                if not data:
+                    raise OSError(f"원본을 끝까지 읽을 수 없습니다: {self.video_path}")
+                parts.append(data)
+                length -= len(data)
+            with self._cond:
+                self._out.seek(offset)
+                self._out.write(b''.join(parts))
+                self._out.flush()
+                self._fetched[index] = 1
+                self._remaining -= 1
+                if self._remaining == 0:
+                    self._finish()
+        finally:
+            with self._cond:
+                self._inflight.discard(index)
+                self._cond.notify_all()
+
+    def note_miss(self, index):
+        """디코더가 복사되지 않은 청크를 읽음 → 백그라운드 복사를 그 다음 위치부터 이어감."""
+        self._cursor = (index + 1) % len(self._fetched)
+
+    def _finish(self):
+        """모든 청크 복사 완료: 임시 파일을 최종 이름으로 바꾸고 완료 표시 파일 작성 (_cond를 잡은 상태에서 호출).
+
+        이름을 바꿀 수 없으면(Windows에서 임시 파일을 읽는 중인 경우 등) 이 프로세스에서만 임시 파일을 사용한다.
+        """
+        self._out.close()
+        self._out = None
+        try:
+            os.replace(self.part_path, self.data_path)
+            self.copy_path = self.data_path
+            with open(self.done_path, 'w', encoding='utf-8') as f:
+                f.write(self.video_path)
+        except OSError:
+            pass
+
+
+class StagedStream(io.BufferedIOBase):
+    """SourceStager의 사본을 읽는 파일 객체 (복사되지 않은 청크는 원본에서 청크 단위로 가져와 채움)."""
+
+    def __init__(self, stager):
+        super().__init__()
+        self._stager = stager
+        self._local = open(stager.copy_path, 'rb')
+        self._source = None
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._stager.size
+        self._pos = max(0, offset)
+        return self._pos
+
+    def read(self, size=-1):
+        stager = self._stager
+        if size is None or size < 0:
+            size = stager.size - self._pos
+        size = min(size, stager.size - self._pos)
+        parts = []
+        while size > 0:
+            index = self._pos // stager.CHUNK_BYTES
+            if not stager.fetched(index):
+                if self._source is None:
+                    self._source = open(stager.video_path, 'rb', buffering=0)
+                stager.fetch(index, self._source)
+                stager.note_miss(index)
+            length = min(size, (index + 1) * stager.CHUNK_BYTES - self._pos)
+            self._local.seek(self._pos)
+            data = self._local.read(length)
+            if not data:
+                break
+            parts.append(data)
+            self._pos += len(data)
+            size -= len(data)
+        return b''.join(parts)
+
+    def read1(self, size=-1):
+        return self.read(size)
+
+    def close(self):
+        if not self.closed:
+            self._local.close()
+            if self._source is not None:
+                self._source.close()
+        super().close()
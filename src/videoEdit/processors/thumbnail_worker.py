@@ -0,0 +1,132 @@
+"""타임라인 필름스트립용 썸네일 백그라운드 추출 모듈."""
+
+import os
+import threading
+
+import numpy as np
+
+from .ffmpeg_utils import FFmpegUtils
+from .media_cache import MediaCache
+
+
+class ThumbnailWorker:
+    """균등 간격 썸네일을 키프레임만 디코딩해 점진적으로 추출하는 클래스.
+
+    미리보기용 VideoCapture(app._cap)와 별개로 ffmpeg 프로세스를 사용하므로
+    메인 디코더의 위치나 상태에 영향을 주지 않는다.
+    """
+
+    THUMB_HEIGHT = 72
+    # 점진적 세분화 단계 (각 단계에서 새로 필요한 위치만 추출)
+    LEVELS = (8, 16, 32, 64)
+    CACHE_KIND = 'thumbnails'
+
+    def __init__(self, video_path, duration, width, height, on_update):
+        """초기화.
+
+        Args:
+            video_path: 원본 비디오 경로
+            duration: 길이(초)
+            width, height: 원본 해상도 (썸네일 비율 계산용)
+            on_update: 썸네일이 추가될 때마다 [(time, bgr_image), ...]로 호출 (워커 스레드에서)
+        """
+        self.video_path = video_path
+        self.duration = duration
+        self.on_update = on_update
+        self.thumb_h = self.THUMB_HEIGHT
+        aspect = (width / height) if width > 0 and height > 0 else 16 / 9
+        self.thumb_w = max(2, int(round(self.thumb_h * aspect / 2.0)) * 2)
+        self._thumbs = {}
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """백그라운드 추출 시작."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """추출 중단 요청."""
+        self._cancel.set()
+
+    def _cache_path(self):
+        return MediaCache.cache_file(self.CACHE_KIND, self.video_path, f"_{self.thumb_h}.npz")
+
+    def _load_cache(self):
+        try:
+            with np.load(self._cache_path()) as data:
+                times = data['times']
+                images = data['images']
+        except (OSError, KeyError, ValueError):
+            return
+        if images.ndim != 4 or images.shape[1:3] != (self.thumb_h, self.thumb_w):
+            return
+        for t, image in zip(times, images):
+            self._thumbs[round(float(t), 4)] = image
+
+    def _save_cache(self):
+        times = sorted(self._thumbs)
+        if not times:
+            return
+        path = self._cache_path()
+        tmp_path = path + '.tmp.npz'
+        try:
+            np.savez(tmp_path, times=np.asarray(times), images=np.stack([self._thumbs[t] for t in times]))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _extract(self, time_seconds, keyframes_only=True):
+        """time_seconds 직전 키프레임 하나만 축소 디코딩."""
+        args = ['-loglevel', 'error']
+        if keyframes_only:
+            args += ['-skip_frame', 'nokey']
+        result = FFmpegUtils.run(args + [
+            '-ss', f"{time_seconds:.3f}", '-noaccurate_seek',
+            '-i', self.video_path,
+            '-an', '-frames:v', '1',
+            '-vf', f"scale={self.thumb_w}:{self.thumb_h}",
+            '-f', 'rawvideo', '-pix_fmt', 'bgr24', '-',
+        ], timeout=30)
+        expected = self.thumb_w * self.thumb_h * 3
+        if len(result.stdout) < expected:
+            # 마지막 GOP 부근에서는 nokey 디코딩이 프레임을 내지 않는 경우가 있음
+            if keyframes_only:
+                return self._extract(time_seconds, keyframes_only=False)
+            return None
+        return np.frombuffer(result.stdout[:expected], dtype=np.uint8).reshape(self.thumb_h, self.thumb_w, 3)
+
+    def _snapshot(self):
+        return [(t, self._thumbs[t]) for t in sorted(self._thumbs)]
+
+    def _run(self):
+        if self.duration <= 0:
+            return
+        self._load_cache()
+        if self._thumbs:
+            self.on_update(self._snapshot())
+
+        changed = False
+        for count in self.LEVELS:
+            step = self.duration / count
+            # 이전 단계 위치를 포함하도록 i * step 사용 (8 → 16 → 32 ...)
+            targets = [round(i * step, 4) for i in range(count)]
+            added = False
+            for t in targets:
+                if self._cancel.is_set():
+                    return
+                if t in self._thumbs:
+                    continue
+                try:
+                    image = self._extract(t)
+                except (RuntimeError, OSError):
+                    image = None
+                if image is not None:
+                    self._thumbs[t] = image
+                    added = True
+            if added:
+                changed = True
+                self.on_update(self._snapshot())
+
+        if changed and not self._cancel.is_set():
+            self._save_cache()
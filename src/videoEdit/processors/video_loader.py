@@ -0,0 +1,103 @@
+"""비디오 파일 단계별 백그라운드 로드 모듈."""
+
+import threading
+
+import cv2
+
+from .decoders import DecoderSelector
+
+
+class VideoLoader:
+    """파일을 백그라운드에서 열고 단계별로 결과를 알리는 클래스.
+
+    1) 컨테이너 메타데이터(프레임 수/FPS/해상도) → 2) 첫 프레임 →
+    3) 편집용 MoviePy 클립과 오디오 정보, 디코더 백엔드 측정 결과 순으로 콜백을 호출한다.
+    콜백은 워커 스레드에서 호출되며, cancel() 이후에는 호출되지 않는다.
+    """
+
+    def __init__(self, video_path, on_metadata, on_first_frame, on_clip, on_error):
+        """초기화.
+
+        Args:
+            video_path: 비디오 경로
+            on_metadata: 메타데이터 딕셔너리로 호출
+            on_first_frame: 첫 프레임(BGR, 실패 시 None)으로 호출
+            on_clip: (VideoFileClip, 추가 정보 딕셔너리)로 호출
+            on_error: 오류 메시지 문자열로 호출
+        """
+        self.video_path = video_path
+        self.on_metadata = on_metadata
+        self.on_first_frame = on_first_frame
+        self.on_clip = on_clip
+        self.on_error = on_error
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """백그라운드 로드 시작."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """로드 중단 요청 (진행 중인 단계가 끝나면 이후 단계는 실행하지 않음)."""
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @staticmethod
+    def read_metadata(cap):
+        """열린 VideoCapture에서 메타데이터 추출."""
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        return {
+            'frame_count': frame_count,
+            'fps': fps,
+            'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            'duration': frame_count / fps if fps > 0 else 0,
+        }
+
+    def _run(self):
+        cap = cv2.VideoCapture(self.video_path)
+        try:
+            if not cap.isOpened():
+                if not self.cancelled:
+                    self.on_error("비디오 파일을 열 수 없습니다.")
+                return
+            metadata = self.read_metadata(cap)
+            if self.cancelled:
+                return
+            self.on_metadata(metadata)
+
+            ret, frame = cap.read()
+            if self.cancelled:
+                return
+            self.on_first_frame(frame if ret else None)
+        finally:
+            cap.release()
+
+        try:
+            from moviepy.editor import VideoFileClip
+            clip = VideoFileClip(self.video_path)
+        except Exception as e:
+            if not self.cancelled:
+                self.on_error(f"비디오를 로드하는 중 오류가 발생했습니다:\n{str(e)}")
+            return
+        if self.cancelled:
+            clip.close()
+            return
+        details = {
+            'has_audio': clip.audio is not None,
+            'audio_fps': clip.audio.fps if clip.audio is not None else None,
+        }
+        # 처음 보는 코덱/해상도면 백엔드별 마이크로 벤치마크 (이후에는 저장된 결과 사용)
+        try:
+            details['decoders'] = DecoderSelector.calibrate(self.video_path)
+        except (OSError, RuntimeError):
+            details['decoders'] = None
+        if self.cancelled:
+            clip.close()
+            return
+        self.on_clip(clip, details)
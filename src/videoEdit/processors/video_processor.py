@@ -2,12 +2,16 @@
 
 import cv2
 import numpy as np
-from tkinter import messagebox
-from moviepy.editor import VideoFileClip
+
+from .perf_monitor import PerfMonitor
+from .decoders import DecoderSelector, open_decoder
 
 
 class VideoProcessor:
     """비디오 처리 관련 기능을 제공하는 클래스."""
+
+    # 이 프레임 수 이내의 앞쪽 이동은 seek 대신 grab()으로 순차 디코딩
+    MAX_GRAB_GAP = 12
     
     @staticmethod
     def rotate_frame_keep_full(frame_bgr, angle_deg: int):
@@ -48,8 +52,65 @@ class VideoProcessor:
         )
 
     @staticmethod
-    def letterbox_bgr(frame_bgr, target_w: int, target_h: int):
-        """프레임을 letterbox 방식으로 리사이즈."""
+    def rotated_size(width, height, angle_deg: int):
+        """rotate_frame_keep_full 결과 프레임의 (폭, 높이)."""
+        angle = angle_deg % 360
+        if angle in (0, 180):
+            return width, height
+        if angle in (90, 270):
+            return height, width
+        m = cv2.getRotationMatrix2D((width / 2.0, height / 2.0), -angle, 1.0)
+        cos = abs(m[0, 0])
+        sin = abs(m[0, 1])
+        return int(height * sin + width * cos), int(height * cos + width * sin)
+
+    @staticmethod
+    def clamp_crop(width, height, crop):
+        """크롭 영역 (x, y, w, h)를 width x height 프레임 안으로 제한 (전체 영역이면 None)."""
+        if not crop:
+            return None
+        x, y, w, h = (int(v) for v in crop)
+        x = min(max(x, 0), width - 1)
+        y = min(max(y, 0), height - 1)
+        w = min(max(w, 1), width - x)
+        h = min(max(h, 1), height - y)
+        if (x, y, w, h) == (0, 0, width, height):
+            return None
+        return x, y, w, h
+
+    @staticmethod
+    def transform_frame(frame_bgr, angle_deg: int, crop=None):
+        """프레임을 회전한 뒤 crop 영역만 남긴 결과 (crop은 회전된 프레임 기준 (x, y, w, h)).
+
+        90도 단위 회전은 crop 영역을 원본 좌표로 옮겨 먼저 잘라내므로 남길 영역만 회전한다.
+        """
+        angle = angle_deg % 360
+        src_h, src_w = frame_bgr.shape[:2]
+        out_w, out_h = VideoProcessor.rotated_size(src_w, src_h, angle)
+        crop = VideoProcessor.clamp_crop(out_w, out_h, crop)
+        if crop is None:
+            return VideoProcessor.rotate_frame_keep_full(frame_bgr, angle)
+        x, y, w, h = crop
+        if angle == 0:
+            return frame_bgr[y:y + h, x:x + w]
+        if angle == 90:
+            source = frame_bgr[src_h - x - w:src_h - x, y:y + h]
+        elif angle == 180:
+            source = frame_bgr[src_h - y - h:src_h - y, src_w - x - w:src_w - x]
+        elif angle == 270:
+            source = frame_bgr[x:x + w, src_w - y - h:src_w - y]
+        else:
+            return VideoProcessor.rotate_frame_keep_full(frame_bgr, angle)[y:y + h, x:x + w]
+        return VideoProcessor.rotate_frame_keep_full(source, angle)
+
+    @staticmethod
+    def fit_scale(width, height, target_w, target_h):
+        """width x height를 비율 유지로 target_w x target_h 안에 맞출 때의 배율 (letterbox와 같은 계산)."""
+        return min(target_w / width, target_h / height)
+
+    @staticmethod
+    def letterbox_bgr(frame_bgr, target_w: int, target_h: int, scale=None):
+        """프레임을 letterbox 방식으로 리사이즈 (scale을 주면 그 배율, 단 target 안에 들어가는 만큼만)."""
         target_w = max(int(target_w), 1)
         target_h = max(int(target_h), 1)
 
@@ -57,7 +118,8 @@ class VideoProcessor:
         if w <= 0 or h <= 0:
             return cv2.resize(frame_bgr, (target_w, target_h))
 
-        scale = min(target_w / w, target_h / h)
+        fit = VideoProcessor.fit_scale(w, h, target_w, target_h)
+        scale = fit if scale is None else min(scale, fit)
         new_w = max(1, int(w * scale))
         new_h = max(1, int(h * scale))
         resized = cv2.resize(frame_bgr, (new_w, new_h), interpolation=cv2.INTER_AREA)
@@ -69,66 +131,122 @@ class VideoProcessor:
         return canvas
     
     @staticmethod
-    def load_video_info(video_path, app):
-        """비디오 정보를 로드하고 UI에 표시."""
-        try:
-            # OpenCV로 비디오 정보 읽기
-            cap = cv2.VideoCapture(video_path)
-            if not cap.isOpened():
-                messagebox.showerror("오류", "비디오 파일을 열 수 없습니다.")
-                return
-            
-            # 비디오 정보 추출
-            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            duration = frame_count / fps if fps > 0 else 0
-            
-            cap.release()
-            
-            # MoviePy로도 로드 (편집용)
-            app.video_clip = VideoFileClip(video_path)
-            
-            # 재생 관련 변수 설정
-            app.video_duration = duration
-            app.video_fps = fps if fps > 0 else 30.0
-            app.total_frames = frame_count
-            app.current_time = 0.0
-            app.current_frame = 0
-            import tkinter as tk
-            if hasattr(app, 'time_slider'):
-                app.time_slider.config(to=duration)
-            if hasattr(app, 'play_button'):
-                app.play_button.config(state=tk.NORMAL)
-            
-            # 정보 표시
-            info = f"프레임 수: {frame_count:,}\n"
-            info += f"FPS: {fps:.2f}\n"
-            info += f"시간: {duration:.2f}초\n"
-            info += f"해상도: {width}x{height}"
-            
-            import tkinter as tk
-            app.info_text.config(state=tk.NORMAL)
-            app.info_text.delete(1.0, tk.END)
-            app.info_text.insert(1.0, info)
-            app.info_text.config(state=tk.DISABLED)
-            
-            # FPS 기본값 설정
-            app.fps_var.set(str(int(fps)) if fps > 0 else "30")
-            
-            # 파일명 표시
-            import os
-            app.file_label.config(text=os.path.basename(video_path), foreground="black")
-            
-            # 미리보기 업데이트
-            app.update_preview()
-            
-            # Export 버튼 활성화
-            app.export_button.config(state=tk.NORMAL)
-            
-        except Exception as e:
-            messagebox.showerror("오류", f"비디오를 로드하는 중 오류가 발생했습니다:\n{str(e)}")
+    def preview_view(width, height, canvas_w, canvas_h, zoom=1.0, center=(0.5, 0.5), one_to_one=False):
+        """width x height 프레임을 zoom배(맞춤 기준) 또는 1:1로 볼 때 canvas에 보이는 영역.
+
+        Returns:
+            (프레임 기준 (x, y, w, h), 표시 배율), 맞춤 보기면 (None, None)
+        """
+        if one_to_one:
+            scale = 1.0
+        elif zoom <= 1.0:
+            return None, None
+        else:
+            scale = VideoProcessor.fit_scale(width, height, canvas_w, canvas_h) * zoom
+        view_w = min(width, max(1, int(round(canvas_w / scale))))
+        view_h = min(height, max(1, int(round(canvas_h / scale))))
+        x = min(max(int(round(center[0] * width - view_w / 2.0)), 0), width - view_w)
+        y = min(max(int(round(center[1] * height - view_h / 2.0)), 0), height - view_h)
+        return (x, y, view_w, view_h), scale
+
+    @staticmethod
+    def preview_rect(app, frame_w, frame_h, canvas_w, canvas_h, source_size=None):
+        """미리보기에서 회전된 프레임 중 계산할 영역과 배율 (크롭 + 확대/이동 반영).
+
+        Args:
+            source_size: 프레임이 축소된 경우(역재생 버퍼 등) 원본 (폭, 높이) - 크롭은 원본 좌표 기준이므로
+                프레임 크기에 맞게 환산한다
+
+        Returns:
+            (회전된 프레임 기준 (x, y, w, h) 또는 None, 표시 배율 또는 None=맞춤)
+        """
+        if source_size is not None and tuple(source_size) != (frame_w, frame_h):
+            rect, scale = VideoProcessor.preview_rect(app, source_size[0], source_size[1], canvas_w, canvas_h)
+            if rect is None:
+                return rect, scale
+            src_w, src_h = VideoProcessor.rotated_size(source_size[0], source_size[1], app.rotation_angle)
+            out_w, out_h = VideoProcessor.rotated_size(frame_w, frame_h, app.rotation_angle)
+            fx, fy = out_w / src_w, out_h / src_h
+            x, y, w, h = rect
+            rect = (int(round(x * fx)), int(round(y * fy)), max(1, int(round(w * fx))), max(1, int(round(h * fy))))
+            # 확대/1:1 배율도 원본 픽셀 기준이므로 축소된 만큼 키운다
+            return rect, (scale / fx if scale is not None else None)
+        width, height = VideoProcessor.rotated_size(frame_w, frame_h, app.rotation_angle)
+        crop = VideoProcessor.clamp_crop(width, height, getattr(app, 'crop_rect', None))
+        if crop is not None:
+            width, height = crop[2:]
+        view, scale = VideoProcessor.preview_view(
+            width, height, canvas_w, canvas_h, zoom=getattr(app, 'preview_zoom', 1.0),
+            center=getattr(app, 'preview_center', (0.5, 0.5)),
+            one_to_one=getattr(app, 'preview_one_to_one', False))
+        if view is None:
+            return crop, None
+        if crop is not None:
+            view = (crop[0] + view[0], crop[1] + view[1], view[2], view[3])
+        return view, scale
+
+    @staticmethod
+    def format_video_info(metadata, details=None):
+        """비디오 정보 표시용 문자열 (details가 없으면 추가 정보는 로드 중으로 표시)."""
+        info = f"프레임 수: {metadata['frame_count']:,}\n"
+        info += f"FPS: {metadata['fps']:.2f}\n"
+        info += f"시간: {metadata['duration']:.2f}초\n"
+        info += f"해상도: {metadata['width']}x{metadata['height']}"
+        if details is None:
+            info += "\n오디오: 확인 중..."
+        elif details.get('has_audio'):
+            info += f"\n오디오: 있음 ({details['audio_fps']}Hz)"
+        else:
+            info += "\n오디오: 없음"
+        if details and details.get('decoders'):
+            decoders = details['decoders']
+            info += f"\n디코더: 탐색 {decoders['seek']} / 순차 {decoders['sequential']}"
+        return info
+
+    @staticmethod
+    def set_info_text(app, text):
+        """비디오 정보 Text 위젯 내용 교체."""
+        import tkinter as tk
+        app.info_text.config(state=tk.NORMAL)
+        app.info_text.delete(1.0, tk.END)
+        app.info_text.insert(1.0, text)
+        app.info_text.config(state=tk.DISABLED)
+
+    @staticmethod
+    def apply_video_info(app, video_path, metadata):
+        """백그라운드에서 읽은 메타데이터를 앱 상태와 UI에 반영."""
+        import os
+        import tkinter as tk
+        
+        VideoProcessor.release_capture(app)
+        frame_cache = getattr(app, 'frame_cache', None)
+        if frame_cache is not None:
+            frame_cache.reset(video_path)
+        
+        fps = metadata['fps']
+        duration = metadata['duration']
+        
+        # 재생 관련 변수 설정
+        app.video_duration = duration
+        app.video_fps = fps if fps > 0 else 30.0
+        app.total_frames = metadata['frame_count']
+        app.video_width = metadata['width']
+        app.video_height = metadata['height']
+        app.current_time = 0.0
+        app.current_frame = 0
+        if hasattr(app, 'time_slider'):
+            app.time_slider.config(to=duration)
+        if hasattr(app, 'play_button'):
+            app.play_button.config(state=tk.NORMAL)
+        
+        # 정보 표시
+        VideoProcessor.set_info_text(app, VideoProcessor.format_video_info(metadata))
+        
+        # FPS 기본값 설정
+        app.fps_var.set(str(int(fps)) if fps > 0 else "30")
+        
+        # 파일명 표시
+        app.file_label.config(text=os.path.basename(video_path), foreground="black")
     
     @staticmethod
     def update_preview(app):
@@ -138,6 +256,87 @@ class VideoProcessor:
             return
         VideoProcessor.seek_to_frame(app, app.current_time)
     
+    @staticmethod
+    def release_capture(app):
+        """재사용 중인 미리보기 디코더 해제."""
+        for decoder in getattr(app, '_decoders', {}).values():
+            decoder.close()
+        app._decoders = {}
+        app._decoder_path = None
+
+    @staticmethod
+    def preview_decoder(app, role):
+        """용도('seek' 또는 'sequential')에 맞는 미리보기 디코더 (같은 백엔드면 공유).
+
+        백엔드는 app.decoder_choice(파일 로드 시 측정 결과)를 따르고, 없으면
+        DecoderSelector.choose()로 정한다.
+
+        Raises:
+            OSError: 파일을 열 수 없는 경우
+        """
+        if getattr(app, '_decoder_path', None) != app.video_path:
+            VideoProcessor.release_capture(app)
+            app._decoder_path = app.video_path
+        choice = getattr(app, 'decoder_choice', None) or {}
+        name = choice.get(role) or DecoderSelector.choose(app.video_path, role)
+        decoder = app._decoders.get(name)
+        if decoder is None:
+            with PerfMonitor.of(app).stage('open'):
+                decoder = open_decoder(app.video_path, name)
+            app._decoders[name] = decoder
+        return decoder
+
+    @staticmethod
+    def read_frame(app, frame_number):
+        """지정한 프레임을 BGR로 읽기.
+
+        디코더를 매번 새로 열지 않고 app._decoders에 유지하며 (재생 중에는 순차 읽기,
+        일시정지 중에는 seek에 빠른 백엔드 사용), 바로 뒤의 프레임(재생 중 순차 읽기)은
+        seek 대신 grab()으로 건너뛴다.
+        app.frame_cache가 있으면 캐시(프리페치 결과 포함)를 먼저 확인하고
+        새로 디코딩한 프레임도 캐시에 넣는다.
+
+        Returns:
+            (frame_number, frame) - 실패 시 frame은 None
+        """
+        perf = PerfMonitor.of(app)
+        role = 'sequential' if getattr(app, 'is_playing', False) else 'seek'
+        try:
+            decoder = VideoProcessor.preview_decoder(app, role)
+        except OSError:
+            return frame_number, None
+
+        # 프레임 범위 체크
+        total_frames = app.total_frames if app.total_frames > 0 else decoder.frame_count
+        if frame_number >= total_frames:
+            frame_number = total_frames - 1
+        if frame_number < 0:
+            frame_number = 0
+
+        frame_cache = getattr(app, 'frame_cache', None)
+        if frame_cache is not None:
+            cached = frame_cache.get(frame_number)
+            if cached is not None:
+                return frame_number, cached
+
+        # 가까운 앞쪽 프레임은 순차 디코딩이 키프레임 seek보다 빠름
+        gap = frame_number - decoder.position if decoder.position >= 0 else -1
+        if gap != 0:
+            with perf.stage('seek'):
+                if 0 < gap <= VideoProcessor.MAX_GRAB_GAP:
+                    for _ in range(gap):
+                        decoder.grab()
+                else:
+                    decoder.seek(frame_number)
+
+        with perf.stage('decode'):
+            ret, frame = decoder.read()
+        if not ret or frame is None:
+            return frame_number, None
+        if frame_cache is not None:
+            frame_cache.put(frame_number, frame, source=app.video_path)
+        return frame_number, frame
+
     @staticmethod
     def seek_to_frame(app, time_seconds):
         """특정 시간의 프레임을 표시."""
@@ -145,61 +344,103 @@ class VideoProcessor:
             if not app.video_path:
                 return
             
-            # OpenCV로 특정 시간의 프레임 읽기
-            cap = cv2.VideoCapture(app.video_path)
-            
             # 프레임 번호 계산 (현재 프레임이 설정되어 있으면 사용)
             if hasattr(app, 'current_frame') and app.current_frame >= 0:
                 frame_number = app.current_frame
             else:
-                fps = cap.get(cv2.CAP_PROP_FPS)
-                if fps > 0:
-                    frame_number = int(time_seconds * fps)
-                else:
-                    frame_number = 0
+                frame_number = int(time_seconds * app.video_fps) if app.video_fps > 0 else 0
             
-            # 프레임 범위 체크
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            if frame_number >= total_frames:
-                frame_number = total_frames - 1
-            if frame_number < 0:
-                frame_number = 0
-            
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-            
-            ret, frame = cap.read()
-            cap.release()
-            
-            if not ret or frame is None:
+            _, frame = VideoProcessor.read_frame(app, frame_number)
+            if frame is None:
                 return
             
-            # Canvas 크기
+            VideoProcessor.render_frame(app, frame)
+            
+        except Exception as e:
+            print(f"프레임 이동 오류: {e}")
+
+    @staticmethod
+    def canvas_size(app):
+        """미리보기 Canvas 크기 (<Configure> 이벤트로 저장한 값, 아직 배치 전이면 기본값)."""
+        size = getattr(app, 'preview_canvas_size', None)
+        if size is not None:
+            canvas_w, canvas_h = size
+        else:
             app.preview_canvas.update_idletasks()
             canvas_w = int(app.preview_canvas.winfo_width())
             canvas_h = int(app.preview_canvas.winfo_height())
-            if canvas_w <= 2 or canvas_h <= 2:
-                canvas_w, canvas_h = 800, 450
-            
-            # 1) 회전(전체가 잘리지 않도록 bounding box 확장)
-            rotated = VideoProcessor.rotate_frame_keep_full(frame, app.rotation_angle)
-            
-            # 2) Canvas에 '전체가 보이도록' 맞추기 (aspect 유지 + letterbox)
-            fitted = VideoProcessor.letterbox_bgr(rotated, canvas_w, canvas_h)
-            
-            # BGR -> RGB
+        if canvas_w <= 2 or canvas_h <= 2:
+            canvas_w, canvas_h = 800, 450
+        return canvas_w, canvas_h
+
+    @staticmethod
+    def render_frame(app, frame, source_size=None):
+        """BGR 프레임을 회전/크롭/letterbox 후 미리보기 Canvas에 표시.
+
+        Args:
+            source_size: frame이 원본보다 축소된 경우 원본 (폭, 높이)
+        """
+        # Canvas 크기
+        canvas_w, canvas_h = VideoProcessor.canvas_size(app)
+        
+        perf = PerfMonitor.of(app)
+        
+        # 1) 회전(전체가 잘리지 않도록 bounding box 확장) + 내보내기와 같은 크롭
+        #    확대 중이면 화면에 보이는 영역만 먼저 잘라낸 뒤 회전/리사이즈
+        rect, scale = VideoProcessor.preview_rect(app, frame.shape[1], frame.shape[0], canvas_w, canvas_h,
+                                                  source_size=source_size)
+        with perf.stage('rotate'):
+            rotated = VideoProcessor.transform_frame(frame, app.rotation_angle, rect)
+        
+        # 2) Canvas에 '전체가 보이도록' 맞추기 (aspect 유지 + letterbox, 확대 중이면 확대 배율)
+        with perf.stage('letterbox'):
+            fitted = VideoProcessor.letterbox_bgr(rotated, canvas_w, canvas_h, scale)
+        
+        # BGR -> RGB
+        with perf.stage('color_convert'):
             frame_rgb = cv2.cvtColor(fitted, cv2.COLOR_BGR2RGB)
-            
-            from PIL import Image, ImageTk
-            import tkinter as tk
+        
+        VideoProcessor.present_rgb(app, frame_rgb)
+
+    @staticmethod
+    def present_rgb(app, frame_rgb):
+        """Canvas 크기에 맞춰진 RGB 프레임을 미리보기 Canvas에 표시 (HUD 포함)."""
+        canvas_h, canvas_w = frame_rgb.shape[:2]
+        perf = PerfMonitor.of(app)
+        
+        from PIL import Image, ImageTk
+        import tkinter as tk
+        with perf.stage('photoimage'):
             image = Image.fromarray(frame_rgb)
             photo = ImageTk.PhotoImage(image=image)
-            
-            # Canvas에 표시 (이미지 참조 유지 필요)
+        
+        # Canvas에 표시 (이미지 참조 유지 필요)
+        with perf.stage('blit'):
             app._preview_image_tk = photo
             app.preview_canvas.delete("all")
             app._preview_canvas_image_id = app.preview_canvas.create_image(
                 canvas_w // 2, canvas_h // 2, image=photo, anchor=tk.CENTER
             )
-            
-        except Exception as e:
-            print(f"프레임 이동 오류: {e}")
+        
+        if getattr(app, 'show_perf_hud', False):
+            VideoProcessor.draw_perf_hud(app)
+
+    @staticmethod
+    def draw_perf_hud(app):
+        """미리보기 Canvas 좌상단에 성능 HUD 오버레이 표시."""
+        app.preview_canvas.delete("perf_hud")
+        lines = PerfMonitor.of(app).hud_lines()
+        if not lines:
+            return
+        text = "\n".join(lines)
+        text_id = app.preview_canvas.create_text(
+            8, 8, text=text, anchor="nw", fill="#00ff66",
+            font=("Courier", 9), tags=("perf_hud",)
+        )
+        # 가독성을 위한 반투명 느낌의 배경 박스
+        x1, y1, x2, y2 = app.preview_canvas.bbox(text_id)
+        bg_id = app.preview_canvas.create_rectangle(
+            x1 - 4, y1 - 4, x2 + 4, y2 + 4, fill="black", outline="#00ff66",
+            stipple="gray50", tags=("perf_hud",)
+        )
+        app.preview_canvas.tag_lower(bg_id, text_id)
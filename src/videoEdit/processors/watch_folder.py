@@ -0,0 +1,364 @@
+"""감시 폴더 무인 처리 모듈."""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, fields
+from typing import Optional
+
+from .media_cache import MediaCache
+
+VIDEO_EXTS = ('.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv')
+
+
+@dataclass
+class FolderPreset:
+    """감시 폴더별 처리 설정 (폴더의 PRESET_FILE에서 읽음).
+
+    Attributes:
+        rotation_angle: 시계방향 회전 각도
+        fps: 출력 FPS (None이면 원본 FPS)
+        auto_range: 앞/뒤 검은·정지 화면 자동 트림 적용
+        output_dir: 출력 디렉터리 (상대 경로면 감시 폴더 기준)
+        suffix: 출력 파일 이름 접미사
+        codec: 비디오 코덱
+        preset: 인코더 preset
+    """
+
+    PRESET_FILE = '.videoedit.json'
+
+    rotation_angle: int = 0
+    fps: Optional[float] = None
+    auto_range: bool = False
+    output_dir: str = 'processed'
+    suffix: str = '_processed'
+    codec: str = 'libx264'
+    preset: str = 'medium'
+
+    @classmethod
+    def load(cls, folder):
+        """folder의 설정 파일 읽기 (없거나 잘못되면 기본값, 모르는 키는 무시)."""
+        try:
+            with open(os.path.join(folder, cls.PRESET_FILE), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+        names = {field.name for field in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+    def output_path(self, folder, video_path):
+        """video_path의 출력 파일 경로."""
+        out_dir = self.output_dir if os.path.isabs(self.output_dir) else os.path.join(folder, self.output_dir)
+        stem = os.path.splitext(os.path.basename(video_path))[0]
+        return os.path.normpath(os.path.join(out_dir, f"{stem}{self.suffix}.mp4"))
+
+
+class JobJournal:
+    """작업 상태를 JSON Lines로 추가 기록하는 저널.
+
+    파일별 마지막 기록만 유효하며, 재시작 시 done/failed는 다시 처리하지 않고
+    queued/running으로 남은 작업은 다시 대기열에 넣는다. 원본이 바뀌면(크기/수정 시각)
+    키가 달라져 새 작업으로 취급된다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._states = {}
+        # 기록된 출력 파일 경로 (감시 폴더 안에 출력해도 원본으로 다시 처리하지 않도록)
+        self._outputs = set()
+        self._needs_newline = False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    self._needs_newline = not line.endswith('\n')
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # 중단으로 잘린 마지막 줄
+                    self._states[record['key']] = record
+                    if record.get('output'):
+                        self._outputs.add(os.path.abspath(record['output']))
+        except OSError:
+            pass
+
+    def state(self, key):
+        record = self._states.get(key)
+        return record['state'] if record else None
+
+    def is_output(self, path):
+        """이전 작업의 출력으로 기록된 파일인지 여부."""
+        return os.path.abspath(path) in self._outputs
+
+    def pending(self):
+        """이전 실행에서 끝나지 않은 작업 경로 목록."""
+        return [r['path'] for r in self._states.values() if r['state'] in ('queued', 'running')]
+
+    def record(self, key, path, state, **extra):
+        """상태 기록 (한 줄 추가 후 fsync)."""
+        record = {'key': key, 'path': path, 'state': state, 'time': time.strftime('%Y-%m-%dT%H:%M:%S')}
+        record.update(extra)
+        with self._lock:
+            self._states[key] = record
+            if record.get('output'):
+                self._outputs.add(os.path.abspath(record['output']))
+            with open(self.path, 'a', encoding='utf-8') as f:
+                if self._needs_newline:
+                    f.write('\n')
+                    self._needs_newline = False
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+
+def process_file(video_path, preset_dict, output_path):
+    """감시 폴더 파일 하나 처리 (프로세스 풀 작업) → (출력 경로, 오류 메시지 또는 None)."""
+    import cv2
+    from .auto_trim import AutoTrimmer
+    from .export_engine import ExportEngine, ExportSpec
+    from .export_telemetry import ExportTelemetry
+
+    preset = FolderPreset(**preset_dict)
+    try:
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            raise OSError(f"비디오 파일을 열 수 없습니다: {video_path}")
+        source_fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        cap.release()
+
+        spec = ExportSpec(fps=preset.fps or source_fps, rotation_angle=preset.rotation_angle,
+                          codec=preset.codec, preset=preset.preset)
+        if preset.auto_range:
+            proposal = AutoTrimmer.analyze(video_path)
+            if 'error' in proposal:
+                raise RuntimeError(proposal['error'])
+            if proposal['start_frame'] > 0 or proposal['end_frame'] < proposal['total_frames']:
+                spec.start_time = proposal['start_time']
+                spec.end_time = proposal['end_time']
+
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        partial_path = output_path[:-4] + '.part.mp4'
+        with ExportTelemetry(video_path, [(output_path, spec)], origin='watch'):
+            ExportEngine.export(video_path, partial_path, spec, logger=None)
+            os.replace(partial_path, output_path)
+        return output_path, None
+    except Exception as e:
+        return output_path, str(e)
+
+
+class WatchFolderDaemon:
+    """폴더를 감시해 새로 들어온 비디오를 폴더별 설정으로 처리하는 데몬.
+
+    watchdog 패키지가 있으면 파일 시스템 이벤트(inotify 등)로, 없으면 주기적 스캔으로
+    후보를 찾는다. 크기/수정 시각이 settle_seconds 동안 바뀌지 않은 파일만 쓰기가 끝난
+    것으로 보고 최대 jobs개의 프로세스 풀에서 처리하며, 상태는 JobJournal에 기록한다.
+    """
+
+    JOURNAL_FILE = '.videoedit_journal.jsonl'
+    # watchdog 사용 시에도 놓친 이벤트를 보완하기 위한 전체 스캔 주기(초)
+    RESCAN_SECONDS = 60.0
+
+    def __init__(self, watch_dir, jobs=None, poll_seconds=2.0, settle_seconds=5.0, journal_path=None,
+                 log=print):
+        """초기화.
+
+        Args:
+            watch_dir: 감시할 디렉터리 (하위 디렉터리 포함)
+            jobs: 동시 처리 프로세스 수
+            poll_seconds: 스캔/안정성 확인 주기(초)
+            settle_seconds: 크기/수정 시각이 이 시간 동안 그대로면 쓰기 완료로 판단
+            journal_path: 작업 저널 경로 (기본: 감시 폴더의 JOURNAL_FILE)
+            log: 진행 메시지 출력 함수
+        """
+        self.watch_dir = os.path.abspath(watch_dir)
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
+        self.poll_seconds = poll_seconds
+        self.settle_seconds = settle_seconds
+        self.journal = JobJournal(journal_path or os.path.join(self.watch_dir, self.JOURNAL_FILE))
+        self.log = log
+        self._stop = threading.Event()
+        self._events = set()
+        self._events_lock = threading.Lock()
+        self._observer = None
+        # 경로 → (크기, 수정 시각, 처음 그 상태를 본 시각)
+        self._candidates = {}
+        # 설정 폴더 → (설정 파일 수정 시각, FolderPreset) (스캔마다 파일별로 JSON을 다시 읽지 않도록)
+        self._presets = {}
+        self._running = {}
+
+    def stop(self):
+        """감시 중단 요청 (진행 중인 작업은 끝날 때까지 기다림)."""
+        self._stop.set()
+
+    def _start_observer(self):
+        """watchdog 관찰자 시작 (설치되지 않았으면 False)."""
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return False
+
+        daemon = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if not event.is_directory:
+                    with daemon._events_lock:
+                        daemon._events.add(getattr(event, 'dest_path', None) or event.src_path)
+
+        self._observer = Observer()
+        self._observer.schedule(_Handler(), self.watch_dir, recursive=True)
+        self._observer.start()
+        return True
+
+    def _preset_folder(self, video_path):
+        """video_path에 적용할 설정 파일이 있는 폴더 (가장 가까운 상위, 없으면 감시 폴더)."""
+        folder = os.path.dirname(os.path.abspath(video_path))
+        while folder.startswith(self.watch_dir):
+            if os.path.exists(os.path.join(folder, FolderPreset.PRESET_FILE)):
+                return folder
+            if folder == self.watch_dir:
+                break
+            folder = os.path.dirname(folder)
+        return self.watch_dir
+
+    def _preset(self, folder):
+        """folder의 설정 (설정 파일이 바뀌었을 때만 다시 읽음)."""
+        try:
+            mtime = os.stat(os.path.join(folder, FolderPreset.PRESET_FILE)).st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = self._presets.get(folder)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, FolderPreset.load(folder))
+            self._presets[folder] = cached
+        return cached[1]
+
+    def _is_source(self, path):
+        """처리 대상 비디오인지 (출력/임시/숨김 파일 제외).
+
+        출력은 저널에 기록된 출력 경로, 전용 출력 디렉터리 안의 파일, 그리고 출력 디렉터리가
+        설정 폴더 자신('.' 등)이면 이름이 출력 접미사로 끝나는 파일로 판단한다.
+        """
+        name = os.path.basename(path)
+        if name.startswith('.') or not name.lower().endswith(VIDEO_EXTS) or '.part.' in name:
+            return False
+        if self.journal.is_output(path):
+            return False
+        folder = self._preset_folder(path)
+        preset = self._preset(folder)
+        out_dir = os.path.dirname(os.path.abspath(preset.output_path(folder, path)))
+        if not os.path.abspath(path).startswith(out_dir + os.sep):
+            return True
+        if out_dir != os.path.abspath(folder):
+            return False
+        stem = os.path.splitext(name)[0]
+        return not (preset.suffix and stem.endswith(preset.suffix))
+
+    def _scan(self):
+        paths = []
+        for root, dirs, files in os.walk(self.watch_dir):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            paths.extend(os.path.join(root, name) for name in files)
+        return paths
+
+    def _update_candidates(self, paths, now):
+        """후보 파일의 크기/수정 시각 변화를 추적하고 쓰기가 끝난 파일 목록 반환."""
+        ready = []
+        for path in paths:
+            if path in self._running or not self._is_source(path):
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                self._candidates.pop(path, None)
+                continue
+            if st.st_size == 0:
+                # 아직 내용이 없는 파일은 다음 스캔/이벤트에서 다시 확인
+                self._candidates.pop(path, None)
+                continue
+            if self.journal.state(MediaCache.source_key(path)) in ('done', 'failed'):
+                self._candidates.pop(path, None)
+                continue
+            previous = self._candidates.get(path)
+            if previous is None or previous[:2] != (st.st_size, st.st_mtime_ns):
+                self._candidates[path] = (st.st_size, st.st_mtime_ns, now)
+            elif now - previous[2] >= self.settle_seconds:
+                ready.append(path)
+        return ready
+
+    def _submit(self, pool, path):
+        key = MediaCache.source_key(path)
+        folder = self._preset_folder(path)
+        preset = self._preset(folder)
+        output_path = preset.output_path(folder, path)
+        self.journal.record(key, path, 'running', output=output_path)
+        self._candidates.pop(path, None)
+        future = pool.submit(process_file, path, asdict(preset), output_path)
+        self._running[path] = (key, future)
+        self.log(f"처리 시작: {path}")
+
+    def _collect(self, block):
+        """끝난 작업을 저널에 기록."""
+        futures = {future: path for path, (_key, future) in self._running.items()}
+        if not futures:
+            return
+        done, _ = wait(futures, timeout=self.poll_seconds if block else 0, return_when=FIRST_COMPLETED)
+        for future in done:
+            path = futures[future]
+            key, _future = self._running.pop(path)
+            output_path, error = future.result()
+            if error:
+                self.journal.record(key, path, 'failed', output=output_path, error=error)
+                self.log(f"[오류] {path}: {error}")
+            else:
+                self.journal.record(key, path, 'done', output=output_path)
+                self.log(f"완료: {path} -> {output_path}")
+
+    def run(self, once=False):
+        """감시 루프 실행.
+
+        Args:
+            once: True면 현재 폴더 내용만 처리하고 종료 (settle_seconds 대기는 동일)
+        """
+        use_events = not once and self._start_observer()
+        self.log(f"감시 시작: {self.watch_dir} ({'파일 시스템 이벤트' if use_events else '주기적 스캔'}, "
+                 f"작업자 {self.jobs}개)")
+        # 이전 실행에서 끝나지 않은 작업은 다시 후보로
+        recovered = [p for p in self.journal.pending() if os.path.exists(p)]
+        if recovered:
+            self.log(f"이전 실행에서 끝나지 않은 작업 {len(recovered)}개를 다시 처리합니다.")
+
+        last_scan = 0.0
+        try:
+            with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+                while not self._stop.is_set():
+                    now = time.monotonic()
+                    if not use_events or now - last_scan >= self.RESCAN_SECONDS:
+                        paths = self._scan()
+                        last_scan = now
+                    else:
+                        with self._events_lock:
+                            paths, self._events = list(self._events), set()
+                    paths = set(paths) | set(self._candidates) | set(recovered)
+                    recovered = []
+
+                    ready = self._update_candidates(sorted(paths), now)
+                    # 대기열은 작업자 수만큼만 채워 메모리/디스크 사용을 제한
+                    for path in ready[:max(0, self.jobs - len(self._running))]:
+                        self._submit(pool, path)
+
+                    if once and not self._candidates and not self._running:
+                        break
+                    if self._running:
+                        self._collect(block=True)
+                    else:
+                        self._stop.wait(self.poll_seconds)
+                while self._running:
+                    self._collect(block=True)
+        finally:
+            if self._observer is not None:
+                self._observer.stop()
+                self._observer.join()
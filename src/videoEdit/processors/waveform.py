@@ -0,0 +1,198 @@
+"""오디오 파형 개요(min/max 피크 피라미드) 계산 모듈."""
+
+import os
+import threading
+
+import numpy as np
+
+from .ffmpeg_utils import FFmpegUtils
+from .media_cache import MediaCache
+
+
+class WaveformPyramid:
+    """다중 해상도 min/max 피크 피라미드.
+
+    level 0은 BASE_BLOCK 샘플마다 하나의 (min, max) 쌍이며, 상위 level은
+    바로 아래 level의 두 쌍을 하나로 합친다. 어떤 줌 레벨이든 필요한
+    픽셀 수에 가까운 level에서 잘라 쓰므로 O(픽셀) 비용으로 그릴 수 있다.
+    """
+
+    SAMPLE_RATE = 16000
+    BASE_BLOCK = 256
+
+    def __init__(self, levels, sample_rate=SAMPLE_RATE, base_block=BASE_BLOCK):
+        """초기화.
+
+        Args:
+            levels: [(mins, maxs), ...] level 0부터 (int16 배열)
+            sample_rate: 분석 샘플레이트
+            base_block: level 0의 버킷 크기(샘플)
+        """
+        self.levels = levels
+        self.sample_rate = sample_rate
+        self.base_block = base_block
+
+    @staticmethod
+    def build(base_mins, base_maxs, sample_rate=SAMPLE_RATE, base_block=BASE_BLOCK):
+        """level 0 피크로부터 상위 level을 쌓아 피라미드 생성."""
+        levels = [(base_mins, base_maxs)]
+        mins, maxs = base_mins, base_maxs
+        while mins.size > 1:
+            if mins.size % 2:
+                mins = np.append(mins, mins[-1])
+                maxs = np.append(maxs, maxs[-1])
+            mins = mins.reshape(-1, 2).min(axis=1)
+            maxs = maxs.reshape(-1, 2).max(axis=1)
+            levels.append((mins, maxs))
+        return WaveformPyramid(levels, sample_rate, base_block)
+
+    @property
+    def duration(self):
+        """피크가 덮는 길이(초)."""
+        return self.levels[0][0].size * self.base_block / self.sample_rate
+
+    def peaks(self, start_time, end_time, pixels):
+        """[start_time, end_time] 구간을 pixels개 열로 줄인 (mins, maxs) (-1.0~1.0).
+
+        pixels보다 적지 않은 버킷을 가진 가장 거친 level을 골라 reduceat으로 합친다.
+        """
+        pixels = max(1, int(pixels))
+        span = max(end_time - start_time, 1e-9)
+        level_index = 0
+        for i in range(len(self.levels)):
+            bucket_seconds = self.base_block * (2 ** i) / self.sample_rate
+            if span / bucket_seconds >= pixels:
+                level_index = i
+            else:
+                break
+        mins, maxs = self.levels[level_index]
+        bucket_seconds = self.base_block * (2 ** level_index) / self.sample_rate
+
+        first = int(start_time / bucket_seconds)
+        last = int(np.ceil(end_time / bucket_seconds))
+        first = min(max(first, 0), mins.size)
+        last = min(max(last, first + 1), mins.size)
+        if first >= mins.size:
+            zeros = np.zeros(pixels, dtype=np.float32)
+            return zeros, zeros
+        mins = mins[first:last]
+        maxs = maxs[first:last]
+
+        # 각 픽셀 열의 시작 버킷 인덱스 (버킷이 픽셀보다 적으면 반복 사용)
+        edges = np.linspace(0, mins.size, pixels, endpoint=False).astype(np.int64)
+        col_mins = np.minimum.reduceat(mins, edges)
+        col_maxs = np.maximum.reduceat(maxs, edges)
+        scale = 1.0 / 32768.0
+        return col_mins.astype(np.float32) * scale, col_maxs.astype(np.float32) * scale
+
+    def save(self, path):
+        """npz 파일로 저장 (level 0만 저장하고 나머지는 로드 시 재구성)."""
+        mins, maxs = self.levels[0]
+        tmp_path = path + '.tmp.npz'
+        np.savez(tmp_path, mins=mins, maxs=maxs,
+                 meta=np.asarray([self.sample_rate, self.base_block], dtype=np.int64))
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def load(path):
+        """npz 파일에서 로드 (없거나 손상되면 None)."""
+        try:
+            with np.load(path) as data:
+                sample_rate, base_block = (int(v) for v in data['meta'])
+                return WaveformPyramid.build(data['mins'], data['maxs'], sample_rate, base_block)
+        except (OSError, KeyError, ValueError):
+            return None
+
+
+class WaveformWorker:
+    """오디오 트랙을 ffmpeg 파이프로 스트리밍하며 피크 피라미드를 만드는 클래스.
+
+    원본 샘플은 CHUNK_BLOCKS 단위로만 메모리에 올리므로 파일 길이와
+    무관하게 일정한 메모리로 동작한다.
+    """
+
+    CACHE_KIND = 'waveforms'
+    # 한 번에 읽을 level 0 버킷 수
+    CHUNK_BLOCKS = 1024
+
+    def __init__(self, video_path, on_done):
+        """초기화.
+
+        Args:
+            video_path: 원본 비디오 경로
+            on_done: 완료 시 WaveformPyramid(오디오가 없으면 None)로 호출 (워커 스레드에서)
+        """
+        self.video_path = video_path
+        self.on_done = on_done
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """백그라운드 계산 시작."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """계산 중단 요청."""
+        self._cancel.set()
+
+    def _cache_path(self):
+        return MediaCache.cache_file(self.CACHE_KIND, self.video_path, '.npz')
+
+    def compute(self):
+        """캐시를 확인하고 없으면 스트리밍 계산 (취소 시 None)."""
+        cache_path = self._cache_path()
+        pyramid = WaveformPyramid.load(cache_path)
+        if pyramid is not None:
+            return pyramid
+
+        block = WaveformPyramid.BASE_BLOCK
+        chunk_bytes = block * self.CHUNK_BLOCKS * 2  # s16le
+        proc = FFmpegUtils.open_pipe([
+            '-i', self.video_path, '-vn', '-map', '0:a:0?',
+            '-ac', '1', '-ar', str(WaveformPyramid.SAMPLE_RATE),
+            '-f', 's16le', '-acodec', 'pcm_s16le', '-',
+        ])
+        mins_parts = []
+        maxs_parts = []
+        remainder = b''
+        try:
+            while not self._cancel.is_set():
+                data = proc.stdout.read(chunk_bytes)
+                if not data:
+                    break
+                data = remainder + data
+                usable = len(data) - len(data) % (block * 2)
+                remainder = data[usable:]
+                if usable == 0:
+                    continue
+                samples = np.frombuffer(data[:usable], dtype='<i2').reshape(-1, block)
+                mins_parts.append(samples.min(axis=1))
+                maxs_parts.append(samples.max(axis=1))
+            if remainder and not self._cancel.is_set():
+                samples = np.frombuffer(remainder[:len(remainder) // 2 * 2], dtype='<i2')
+                if samples.size:
+                    mins_parts.append(samples.min(keepdims=True))
+                    maxs_parts.append(samples.max(keepdims=True))
+        finally:
+            if self._cancel.is_set():
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+
+        if self._cancel.is_set() or not mins_parts:
+            return None
+        pyramid = WaveformPyramid.build(np.concatenate(mins_parts), np.concatenate(maxs_parts))
+        try:
+            pyramid.save(cache_path)
+        except OSError:
+            pass
+        return pyramid
+
+    def _run(self):
+        try:
+            pyramid = self.compute()
+        except OSError:
+            pyramid = None
+        if not self._cancel.is_set():
+            self.on_done(pyramid)
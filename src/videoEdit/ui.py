@@ -5,9 +5,11 @@ from tkinter import ttk
 
 # 직접 실행 시와 패키지로 import 시 모두 지원
 if __name__ == "__main__":
-    from video_processor import VideoProcessor
+    from processors.video_processor import VideoProcessor
+    from processors.source_stager import SourceStager
 else:
-    from .video_processor import VideoProcessor
+    from .processors.video_processor import VideoProcessor
+    from .processors.source_stager import SourceStager
 
 
 class UIManager:
@@ -138,9 +140,7 @@ class UIManager:
                     
                     # 재생 중이면 시작 시간 업데이트
                     if self.app.is_playing:
-                        import time
-                        self.app._playback_start_time = time.time()
-                        self.app._playback_start_frame_time = new_time
+                        self.app.playback_controller.reset_clock(new_time)
                     
                     # 프레임 표시 및 UI 업데이트
                     from .processors.video_processor import VideoProcessor
@@ -148,6 +148,7 @@ class UIManager:
                     if hasattr(self.app, 'time_slider'):
                         self.app.time_slider.set(new_time)
                     self.app.playback_controller._update_time_label()
+                    self.app.playback_controller.request_prefetch(frame_delta)
                     
                     # 이벤트 전파 중지
                     return
@@ -176,6 +177,11 @@ class UIManager:
         ttk.Button(file_frame, text="비디오 파일 선택", command=self.app.select_video).pack(side=tk.LEFT, padx=5)
         self.app.file_label = ttk.Label(file_frame, text="선택된 파일 없음", foreground="gray")
         self.app.file_label.pack(side=tk.LEFT, padx=10)
+        
+        # 느린 저장소(NAS) 원본을 로컬 캐시로 미리 복사해 읽기
+        self.app.staging_var = tk.BooleanVar(value=SourceStager.enabled)
+        ttk.Checkbutton(file_frame, text="로컬 스테이징", variable=self.app.staging_var,
+                        command=self.app.toggle_staging).pack(side=tk.RIGHT, padx=5)
 
         # 힌트 색상 변경 대상으로 등록
         self.app.drag_drop_handler.set_hint_widgets([self.app.file_label])
@@ -190,14 +196,33 @@ class UIManager:
         # 비디오 미리보기 프레임
         preview_frame = ttk.LabelFrame(self.app.scrollable_frame, text="비디오 미리보기", padding="10")
         preview_frame.pack(fill=tk.X, padx=10, pady=5)
-        preview_frame.configure(height=460)
+        preview_frame.configure(height=540)
         preview_frame.pack_propagate(False)
 
         self.app.preview_canvas = tk.Canvas(preview_frame, bg="black", highlightthickness=0)
         self.app.preview_canvas.pack(fill=tk.BOTH, expand=True)
-        self.app.preview_canvas.bind("<Configure>", lambda _e: self.app._schedule_preview_redraw())
+
+        def on_preview_configure(event):
+            # 재생 중 매 프레임 update_idletasks()로 크기를 묻지 않도록 바뀐 크기를 저장
+            self.app.preview_canvas_size = (event.width, event.height)
+            self.app._schedule_preview_redraw()
+
+        self.app.preview_canvas.bind("<Configure>", on_preview_configure)
+        self.app.preview_zoom_controller.bind(self.app.preview_canvas)
         self.app._draw_preview_placeholder()
 
+        # 미리보기 확대 (Ctrl+휠 확대, 드래그 이동, 더블클릭 맞춤)
+        zoom_frame = ttk.Frame(preview_frame)
+        zoom_frame.pack(fill=tk.X, pady=(5, 0))
+        zoom = self.app.preview_zoom_controller
+        ttk.Label(zoom_frame, text="확대:").pack(side=tk.LEFT, padx=5)
+        ttk.Button(zoom_frame, text="맞춤", width=5, command=zoom.fit).pack(side=tk.LEFT, padx=2)
+        ttk.Button(zoom_frame, text="1:1", width=4, command=zoom.one_to_one).pack(side=tk.LEFT, padx=2)
+        ttk.Button(zoom_frame, text="+", width=3, command=zoom.zoom_in).pack(side=tk.LEFT, padx=2)
+        ttk.Button(zoom_frame, text="−", width=3, command=zoom.zoom_out).pack(side=tk.LEFT, padx=2)
+        self.app.zoom_label = ttk.Label(zoom_frame, text="맞춤")
+        self.app.zoom_label.pack(side=tk.LEFT, padx=10)
+
         # 재생 컨트롤 프레임
         playback_frame = ttk.Frame(preview_frame)
         playback_frame.pack(fill=tk.X, pady=(5, 0))
@@ -216,6 +241,28 @@ class UIManager:
         self.app.time_label = ttk.Label(playback_frame, text="00:00:00 / 00:00:00 [0 / 0]")
         self.app.time_label.pack(side=tk.LEFT, padx=10)
         
+        # 성능 HUD 토글 및 리포트 저장
+        self.app.perf_hud_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(playback_frame, text="HUD", variable=self.app.perf_hud_var,
+                        command=self.app.toggle_perf_hud).pack(side=tk.RIGHT, padx=2)
+        ttk.Button(playback_frame, text="리포트", width=6,
+                   command=self.app.save_perf_report).pack(side=tk.RIGHT, padx=2)
+        
+        # 구간 반복 사전 렌더링 버퍼
+        self.app.loop_buffer_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(playback_frame, text="반복 버퍼", variable=self.app.loop_buffer_var,
+                        command=self.app.toggle_loop_buffer).pack(side=tk.RIGHT, padx=2)
+        
+        # 재생 배속 및 역재생
+        self.app.reverse_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(playback_frame, text="역재생", variable=self.app.reverse_var,
+                        command=self.app.toggle_reverse_playback).pack(side=tk.RIGHT, padx=2)
+        self.app.speed_var = tk.StringVar(value="1x")
+        speed_combo = ttk.Combobox(playback_frame, textvariable=self.app.speed_var, width=5, state="readonly",
+                                   values=[f"{speed:g}x" for speed in self.app.playback_controller.SPEEDS])
+        speed_combo.pack(side=tk.RIGHT, padx=2)
+        speed_combo.bind("<<ComboboxSelected>>", lambda _e: self.app.set_playback_speed(self.app.speed_var.get()))
+        
         # 재생 위치 슬라이더
         slider_frame = ttk.Frame(playback_frame)
         slider_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
@@ -250,20 +297,37 @@ class UIManager:
             
             # 재생 중이면 시작 시간 업데이트
             if self.app.is_playing:
-                import time
-                self.app._playback_start_time = time.time()
-                self.app._playback_start_frame_time = new_time
+                self.app.playback_controller.reset_clock(new_time)
             
             # 프레임 표시 및 UI 업데이트
             from .processors.video_processor import VideoProcessor
             VideoProcessor.seek_to_frame(self.app, new_time)
             if hasattr(self.app, 'time_slider'):
                 self.app.time_slider.set(new_time)
-            self.app._update_time_label()
+            self.app.playback_controller._update_time_label()
+            self.app.playback_controller.request_prefetch(frame_delta)
             
             # 이벤트 전파 중지
             return "break"
         
+        # 타임라인 필름스트립 (슬라이더 hover 시 썸네일 미리보기)
+        self.app.filmstrip_canvas = tk.Canvas(preview_frame, height=36, bg="#202020", highlightthickness=0)
+        self.app.filmstrip_canvas.pack(fill=tk.X, pady=(4, 0))
+        filmstrip = self.app.filmstrip_controller
+        self.app.filmstrip_canvas.bind("<Configure>", lambda e: filmstrip.redraw())
+        self.app.filmstrip_canvas.bind("<Button-1>", lambda e: self.app.seek_to_time(
+            filmstrip.time_at(self.app.filmstrip_canvas, e.x)))
+        
+        # 오디오 파형 스트립 (구간 밖은 어둡게 표시)
+        self.app.waveform_canvas = tk.Canvas(preview_frame, height=36, bg="#101010", highlightthickness=0)
+        self.app.waveform_canvas.pack(fill=tk.X, pady=(2, 0))
+        self.app.waveform_canvas.bind("<Configure>", lambda e: self.app.waveform_controller.redraw())
+        self.app.waveform_canvas.bind("<Button-1>", lambda e: self.app.seek_to_time(
+            filmstrip.time_at(self.app.waveform_canvas, e.x)))
+        for widget in (self.app.time_slider, self.app.filmstrip_canvas):
+            widget.bind("<Motion>", lambda e, w=widget: filmstrip.show_hover(w, e), add="+")
+            widget.bind("<Leave>", lambda e: filmstrip.hide_hover(), add="+")
+        
         self.app.time_slider.bind("<Button-1>", lambda e: self.app.pause_playback())
         self.app.time_slider.bind("<B1-Motion>", on_slider_change)
         self.app.time_slider.bind("<ButtonRelease-1>", on_slider_change)
@@ -312,6 +376,25 @@ class UIManager:
         self.app.rotation_label = ttk.Label(rotation_frame, text="회전: 0°")
         self.app.rotation_label.pack(side=tk.LEFT, padx=10)
         
+        # 크롭 / 출력 크기 (미리보기와 내보내기에 같은 계산으로 적용)
+        crop_frame = ttk.Frame(control_frame)
+        crop_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(crop_frame, text="크롭 (x,y,w,h):").pack(side=tk.LEFT, padx=5)
+        self.app.crop_var = tk.StringVar()
+        crop_entry = ttk.Entry(crop_frame, textvariable=self.app.crop_var, width=18)
+        crop_entry.pack(side=tk.LEFT, padx=5)
+        crop_entry.bind("<Return>", lambda e: self.app.export_controller.set_crop(self.app.crop_var.get()))
+        crop_entry.bind("<FocusOut>", lambda e: self.app.export_controller.set_crop(self.app.crop_var.get()))
+        ttk.Button(crop_frame, text="해제", command=lambda: self.app.export_controller.set_crop("")).pack(side=tk.LEFT, padx=5)
+        ttk.Label(crop_frame, text="최대 크기:").pack(side=tk.LEFT, padx=(15, 5))
+        self.app.max_size_var = tk.StringVar()
+        max_size_entry = ttk.Entry(crop_frame, textvariable=self.app.max_size_var, width=11)
+        max_size_entry.pack(side=tk.LEFT, padx=5)
+        max_size_entry.bind("<Return>", lambda e: self.app.export_controller.update_output_size())
+        max_size_entry.bind("<FocusOut>", lambda e: self.app.export_controller.update_output_size())
+        self.app.output_size_label = ttk.Label(crop_frame, text="", foreground="gray")
+        self.app.output_size_label.pack(side=tk.LEFT, padx=10)
+        
         # 구간 설정
         time_range_frame = ttk.LabelFrame(control_frame, text="구간 설정", padding="5")
         time_range_frame.pack(fill=tk.X, pady=5)
@@ -356,6 +439,31 @@ class UIManager:
         
         ttk.Button(range_inner_frame, text="전체 구간", command=reset_to_full_range).pack(side=tk.LEFT, padx=5)
         
+        # 컷 리스트 (여러 구간을 한 번에 이어서 내보내기)
+        cut_frame = ttk.Frame(time_range_frame)
+        cut_frame.pack(fill=tk.X, pady=(5, 0))
+        ttk.Label(cut_frame, text="컷 리스트:").pack(side=tk.LEFT, padx=5)
+        ttk.Button(cut_frame, text="현재 구간 추가",
+                   command=self.app.range_controller.add_cut_range).pack(side=tk.LEFT, padx=5)
+        ttk.Button(cut_frame, text="마지막 삭제",
+                   command=self.app.range_controller.remove_last_cut_range).pack(side=tk.LEFT, padx=5)
+        ttk.Button(cut_frame, text="비우기",
+                   command=self.app.range_controller.clear_cut_list).pack(side=tk.LEFT, padx=5)
+        self.app.cut_list_label = ttk.Label(cut_frame, text="없음 (시작~종료 구간 사용)", foreground="gray")
+        self.app.cut_list_label.pack(side=tk.LEFT, padx=10)
+        
+        # 장면 경계 스냅
+        scene_frame = ttk.Frame(time_range_frame)
+        scene_frame.pack(fill=tk.X, pady=(5, 0))
+        self.app.snap_to_shot_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(scene_frame, text="장면 경계에 스냅", variable=self.app.snap_to_shot_var).pack(side=tk.LEFT, padx=5)
+        ttk.Button(scene_frame, text="구간을 장면 경계에 맞춤",
+                   command=self.app.range_controller.snap_range_to_shots).pack(side=tk.LEFT, padx=5)
+        ttk.Button(scene_frame, text="자동 트림",
+                   command=self.app.range_controller.auto_trim).pack(side=tk.LEFT, padx=5)
+        self.app.scene_status_label = ttk.Label(scene_frame, text="", foreground="gray")
+        self.app.scene_status_label.pack(side=tk.LEFT, padx=10)
+        
         # FPS 설정
         fps_frame = ttk.Frame(control_frame)
         fps_frame.pack(fill=tk.X, pady=5)
@@ -365,6 +473,16 @@ class UIManager:
         self.app.fps_entry.pack(side=tk.LEFT, padx=5)
         ttk.Label(fps_frame, text="(원본 FPS가 기본값)").pack(side=tk.LEFT, padx=5)
         
+        # 인코더 자동 튜닝 (표본 구간 측정으로 preset/스레드 수 선택)
+        encoder_frame = ttk.Frame(control_frame)
+        encoder_frame.pack(fill=tk.X, pady=5)
+        self.app.autotune_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(encoder_frame, text="인코더 자동 튜닝", variable=self.app.autotune_var).pack(side=tk.LEFT, padx=5)
+        ttk.Label(encoder_frame, text="제한 시간(분):").pack(side=tk.LEFT, padx=(15, 5))
+        self.app.deadline_var = tk.StringVar()
+        ttk.Entry(encoder_frame, textvariable=self.app.deadline_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Label(encoder_frame, text="(비우면 실시간 이내 속도 중 가장 작은 파일)", foreground="gray").pack(side=tk.LEFT, padx=5)
+        
         # 출력 경로
         output_frame = ttk.Frame(control_frame)
         output_frame.pack(fill=tk.X, pady=5)
@@ -0,0 +1,49 @@
+"""FPS 감소 시 디코더 단계 프레임 선택(decimation)과 내보내기 프레임 매핑의 일치 테스트."""
+
+import pytest
+
+from videoEdit.processors.decoders import FFmpegPipeDecoder
+from videoEdit.processors.export_engine import ExportEngine
+
+
+def _decoder(step, origin):
+    """파일 없이 decimation 상태만 가진 ffmpeg 백엔드 (_selected만 사용)."""
+    decoder = FFmpegPipeDecoder.__new__(FFmpegPipeDecoder)
+    decoder._proc = None
+    decoder._decimation = None
+    decoder.set_decimation(step, origin)
+    return decoder
+
+
+@pytest.mark.parametrize('fps_in, fps_out', [
+    (60.0, 30.0),
+    (60.0, 24.0),
+    (30.0, 24.0),
+    (50.0, 30.0),
+    (60.0, 25.0),
+    (120.0, 24.0),
+    (59.94, 29.97),
+])
+@pytest.mark.parametrize('origin', [0, 1, 7, 250])
+def test_selected_matches_source_frame_index(fps_in, fps_out, origin):
+    step = ExportEngine.decimation_step(fps_in, fps_out)
+    assert step is not None
+    decoder = _decoder(step, origin)
+
+    outputs = 200
+    expected = {ExportEngine.source_frame_index(k, origin, fps_in, fps_out) for k in range(outputs)}
+    last = max(expected)
+    selected = {frame for frame in range(last + 1) if decoder._selected(frame)}
+    assert selected == expected
+
+
+def test_frames_before_origin_are_not_selected():
+    decoder = _decoder(ExportEngine.decimation_step(60.0, 24.0), 100)
+    assert not any(decoder._selected(frame) for frame in range(100))
+    assert decoder._selected(100)
+
+
+def test_decimation_step_rejects_irregular_ratios():
+    assert ExportEngine.decimation_step(30.0, 30.0) is None
+    assert ExportEngine.decimation_step(24.0, 30.0) is None
+    assert ExportEngine.decimation_step(29.97, 24.0) is None
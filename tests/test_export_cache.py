@@ -0,0 +1,99 @@
+"""ExportCache 키/유효성 확인/정리 테스트."""
+
+import os
+import time
+
+import pytest
+
+from videoEdit.processors.export_cache import ExportCache
+from videoEdit.processors.export_engine import ExportSpec
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'source.mp4'
+    path.write_bytes(b'source' * 100)
+    return str(path)
+
+
+def _output(tmp_path, name, size=100, fill=b'x'):
+    path = tmp_path / name
+    path.write_bytes(fill * size)
+    return str(path)
+
+
+def test_store_then_fetch(tmp_path, source):
+    cache = ExportCache(cache_dir=str(tmp_path / 'cache'))
+    spec = ExportSpec(fps=30.0, start_time=1.0, end_time=2.0)
+    output = _output(tmp_path, 'out.mp4')
+    assert cache.store(source, spec, output)
+
+    target = str(tmp_path / 'again.mp4')
+    assert cache.fetch(source, ExportSpec(fps=30.0004, start_time=1.0, end_time=2.0, threads=8), target)
+    with open(target, 'rb') as f:
+        assert f.read() == b'x' * 100
+
+    assert not cache.fetch(source, ExportSpec(fps=24.0), str(tmp_path / 'other.mp4'))
+    assert not cache.fetch(source, spec, str(tmp_path / 'other.mkv'))
+
+
+def test_modified_source_misses(tmp_path, source):
+    cache = ExportCache(cache_dir=str(tmp_path / 'cache'))
+    spec = ExportSpec(fps=30.0)
+    cache.store(source, spec, _output(tmp_path, 'out.mp4'))
+    with open(source, 'ab') as f:
+        f.write(b'more')
+    assert not cache.fetch(source, spec, str(tmp_path / 'again.mp4'))
+
+
+def test_overwritten_output_invalidates_entry(tmp_path, source):
+    cache = ExportCache(cache_dir=str(tmp_path / 'cache'))
+    spec = ExportSpec(fps=30.0)
+    output = _output(tmp_path, 'out.mp4')
+    cache.store(source, spec, output)
+    # 하드링크된 출력을 제자리에서 덮어쓰면 캐시 파일도 바뀜
+    with open(output, 'r+b') as f:
+        f.write(b'y' * 150)
+
+    assert not cache.fetch(source, spec, str(tmp_path / 'again.mp4'))
+    assert cache._load_index() == {}
+
+
+def test_evicts_least_recently_used(tmp_path, source):
+    cache = ExportCache(max_bytes=250, cache_dir=str(tmp_path / 'cache'))
+    specs = [ExportSpec(fps=fps) for fps in (24.0, 25.0, 30.0)]
+    cache.store(source, specs[0], _output(tmp_path, 'a.mp4'))
+    time.sleep(0.01)
+    cache.store(source, specs[1], _output(tmp_path, 'b.mp4'))
+    time.sleep(0.01)
+    assert cache.fetch(source, specs[0], str(tmp_path / 'a2.mp4'))
+    time.sleep(0.01)
+    cache.store(source, specs[2], _output(tmp_path, 'c.mp4'))
+
+    assert not cache.fetch(source, specs[1], str(tmp_path / 'b2.mp4'))
+    assert cache.fetch(source, specs[0], str(tmp_path / 'a3.mp4'))
+    assert cache.fetch(source, specs[2], str(tmp_path / 'c2.mp4'))
+    assert len(cache._load_index()) == 2
+
+
+def test_skips_outputs_larger_than_limit(tmp_path, source):
+    cache = ExportCache(max_bytes=50, cache_dir=str(tmp_path / 'cache'))
+    assert not cache.store(source, ExportSpec(fps=30.0), _output(tmp_path, 'out.mp4'))
+    assert cache._load_index() == {}
+
+
+def test_copies_only_when_allowed(tmp_path, source, monkeypatch):
+    def no_link(src, dst):
+        raise OSError(18, 'Invalid cross-device link')
+
+    monkeypatch.setattr(os, 'link', no_link)
+    spec = ExportSpec(fps=30.0)
+    output = _output(tmp_path, 'out.mp4')
+
+    cache = ExportCache(cache_dir=str(tmp_path / 'cache'))
+    assert not cache.store(source, spec, output)
+    assert not cache.fetch(source, spec, str(tmp_path / 'again.mp4'))
+
+    cache = ExportCache(cache_dir=str(tmp_path / 'cache'), allow_copy=True)
+    assert cache.store(source, spec, output)
+    assert cache.fetch(source, spec, str(tmp_path / 'again.mp4'))
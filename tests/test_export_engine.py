@@ -0,0 +1,76 @@
+"""ExportEngine 구간/FPS 프레임 매핑과 오디오 구간 길이 테스트."""
+
+import pytest
+
+from videoEdit.processors.export_engine import ExportEngine, ExportSpec, _Rendition
+
+
+def _mapped_frames(rendition):
+    """출력 프레임 순서대로 사용하는 원본 프레임 번호 (인코딩 없이 매핑만 진행)."""
+    frames = []
+    while not rendition.done:
+        source_frame = rendition.next_source_frame()
+        frames.extend([source_frame] * rendition.take(source_frame))
+    return frames
+
+
+def _expected_frames(ranges, fps_in, fps_out):
+    frames = []
+    for (start, end), count in zip(ranges, ExportEngine.range_counts(ranges, fps_in, fps_out)):
+        frames.extend(min(ExportEngine.source_frame_index(k, start, fps_in, fps_out), end - 1)
+                      for k in range(count))
+    return frames
+
+
+@pytest.mark.parametrize('fps_in, fps_out', [(30.0, 30.0), (60.0, 24.0), (24.0, 60.0), (29.97, 25.0)])
+@pytest.mark.parametrize('ranges', [
+    [(0, 90)],
+    [(12, 45), (80, 121), (300, 331)],
+    # 원본 순서와 다른 구간 순서
+    [(200, 260), (10, 40)],
+])
+def test_rendition_maps_output_frames_across_ranges(fps_in, fps_out, ranges):
+    spec = ExportSpec(fps=fps_out)
+    rendition = _Rendition('out.mp4', spec, ranges, fps_in)
+    frames = _mapped_frames(rendition)
+
+    assert len(frames) == sum(rendition.range_counts)
+    assert frames == _expected_frames(ranges, fps_in, fps_out)
+    offset = 0
+    for (start, end), count in zip(ranges, rendition.range_counts):
+        part = frames[offset:offset + count]
+        assert all(start <= f < end for f in part)
+        assert part == sorted(part)
+        offset += count
+
+
+def test_rendition_segment_matches_full_mapping():
+    spec = ExportSpec(fps=24.0)
+    ranges = [(12, 45), (80, 121), (300, 331)]
+    full = _mapped_frames(_Rendition('out.mp4', spec, ranges, 60.0))
+
+    pieces = []
+    for first in range(0, len(full), 7):
+        pieces.extend(_mapped_frames(_Rendition('out.mp4', spec, ranges, 60.0,
+                                                first_output=first, last_output=first + 7)))
+    assert pieces == full
+
+
+@pytest.mark.parametrize('fps_in, fps_out', [(30.0, 30.0), (60.0, 24.0), (24.0, 60.0), (29.97, 25.0)])
+def test_audio_ranges_match_range_counts(fps_in, fps_out):
+    ranges = [(12, 45), (80, 121), (300, 331)]
+    rendition = _Rendition('out.mp4', ExportSpec(fps=fps_out), ranges, fps_in)
+    audio = rendition.audio_ranges()
+
+    assert audio == ExportEngine.audio_ranges(ranges, fps_in, fps_out)
+    assert len(audio) == len(ranges)
+    for (start, _end), (audio_start, audio_length), count in zip(ranges, audio, rendition.range_counts):
+        assert audio_start == pytest.approx(start / fps_in)
+        # 오디오 길이 = 그 구간의 출력 프레임 수 x 출력 프레임 길이
+        assert audio_length * fps_out == pytest.approx(count)
+
+
+def test_output_frame_count_rounds_up_partial_frames():
+    assert ExportEngine.output_frame_count(1.0, 30.0) == 30
+    assert ExportEngine.output_frame_count(1.01, 30.0) == 31
+    assert ExportEngine.output_frame_count(0.0, 30.0) == 1
@@ -0,0 +1,50 @@
+"""KeyframeIndex.parse_framecrc와 키프레임 탐색 테스트."""
+
+from videoEdit.processors.keyframe_index import KeyframeIndex
+
+FRAMECRC = """#software: Lavf61.1.100
+#tb 0: 1/15360
+#media_type 0: video
+#codec_id 0: h264
+#dimensions 0: 640x360
+#sar 0: 1/1
+#stream#, dts,        pts, duration,     size, hash
+0,      -1024,          0,      512,    21000, 0x00000001
+0,       -512,       1536,      512,     3000, 0x00000002, F=0x0
+0,          0,        512,      512,     1000, 0x00000003, F=0x0
+0,        512,       1024,      512,     1100, 0x00000004, F=0x0
+0,       1024,       2048,      512,    20000, 0x00000005
+0,       1536,       3072,      512,     3100, 0x00000006, F=0x0
+0,       2048,       2560,      512,     1200, 0x00000007, F=0x0
+"""
+
+
+def test_parse_framecrc_orders_by_pts():
+    keyframes, total = KeyframeIndex.parse_framecrc(FRAMECRC)
+    # pts 순서: 0(키) 512 1024 1536 2048(키) 2560 3072
+    assert total == 7
+    assert keyframes == [0, 4]
+
+
+def test_parse_framecrc_reads_explicit_key_flag():
+    text = "0, 0, 0, 512, 100, 0x1, F=0x1\n0, 512, 512, 512, 100, 0x2, F=0x0\n0, 1024, 1024, 512, 100, 0x3, F=0x3\n"
+    assert KeyframeIndex.parse_framecrc(text) == ([0, 2], 3)
+
+
+def test_parse_framecrc_skips_comments_and_short_lines():
+    assert KeyframeIndex.parse_framecrc("#tb 0: 1/25\n\n0, 0, 0\n") == ([], 0)
+
+
+def test_at_or_before_and_after():
+    index = KeyframeIndex([0, 30, 60], 75)
+    assert index.at_or_before(0) == 0
+    assert index.at_or_before(29) == 0
+    assert index.at_or_before(30) == 30
+    assert index.at_or_before(74) == 60
+    assert index.after(0) == 30
+    assert index.after(59) == 60
+    assert index.after(60) == 75
+
+
+def test_first_frame_is_always_a_keyframe():
+    assert KeyframeIndex([12, 40], 50).frames == [0, 12, 40]
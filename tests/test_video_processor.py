@@ -0,0 +1,117 @@
+"""VideoProcessor 회전/크롭 변환과 미리보기 확대 영역 테스트."""
+
+import types
+
+import cv2
+import numpy as np
+import pytest
+
+from videoEdit.processors.video_processor import VideoProcessor
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (90, 160, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize('angle', [0, 90, 180, 270, -90, 450])
+@pytest.mark.parametrize('crop', [None, (0, 0, 1, 1), (10, 20, 40, 30), (5, 7, 80, 60)])
+def test_transform_frame_matches_rotate_then_crop(frame, angle, crop):
+    rotated = VideoProcessor.rotate_frame_keep_full(frame, angle % 360)
+    out_w, out_h = VideoProcessor.rotated_size(160, 90, angle)
+    assert rotated.shape[:2] == (out_h, out_w)
+
+    result = VideoProcessor.transform_frame(frame, angle, crop)
+    if crop is None:
+        expected = rotated
+    else:
+        x, y, w, h = crop
+        expected = rotated[y:y + h, x:x + w]
+    assert np.array_equal(result, expected)
+
+
+def test_transform_frame_clamps_crop_to_frame(frame):
+    result = VideoProcessor.transform_frame(frame, 90, (60, 150, 100, 100))
+    # 90도 회전 후 90x160 프레임 안으로 제한
+    assert result.shape[:2] == (10, 30)
+
+
+def test_transform_frame_arbitrary_angle(frame):
+    result = VideoProcessor.transform_frame(frame, 30, (4, 6, 20, 10))
+    rotated = VideoProcessor.rotate_frame_keep_full(frame, 30)
+    assert np.array_equal(result, rotated[6:16, 4:24])
+
+
+def test_preview_view_fit_returns_none():
+    assert VideoProcessor.preview_view(1920, 1080, 640, 360) == (None, None)
+    assert VideoProcessor.preview_view(1920, 1080, 640, 360, zoom=0.5) == (None, None)
+
+
+def test_preview_view_zoom_centers_view():
+    view, scale = VideoProcessor.preview_view(1920, 1080, 640, 360, zoom=2.0)
+    assert scale == pytest.approx(2.0 / 3.0)
+    assert view == (480, 270, 960, 540)
+
+
+def test_preview_view_clamps_to_edges():
+    view, _scale = VideoProcessor.preview_view(1920, 1080, 640, 360, zoom=4.0, center=(0.0, 1.0))
+    assert view == (0, 810, 480, 270)
+    view, _scale = VideoProcessor.preview_view(1920, 1080, 640, 360, zoom=4.0, center=(1.0, 0.0))
+    assert view == (1440, 0, 480, 270)
+
+
+def test_preview_view_one_to_one():
+    view, scale = VideoProcessor.preview_view(1920, 1080, 640, 360, one_to_one=True)
+    assert scale == 1.0
+    assert view == (640, 360, 640, 360)
+    # 캔버스보다 작은 프레임은 전체
+    view, scale = VideoProcessor.preview_view(320, 180, 640, 360, one_to_one=True)
+    assert view == (0, 0, 320, 180)
+
+
+def _render(app, frame, source_size=None):
+    """render_frame이 Canvas에 넘기는 RGB 프레임 (Canvas 없이)."""
+    shown = []
+    original = VideoProcessor.present_rgb
+    VideoProcessor.present_rgb = staticmethod(lambda _app, rgb: shown.append(rgb))
+    try:
+        VideoProcessor.render_frame(app, frame, source_size=source_size)
+    finally:
+        VideoProcessor.present_rgb = staticmethod(original)
+    return shown[0]
+
+
+@pytest.mark.parametrize('angle', [0, 90])
+def test_render_shrunk_frame_applies_crop_in_source_coordinates(angle):
+    # 왼쪽 절반 빨강, 오른쪽 절반 파랑 (BGR)
+    full = np.zeros((360, 640, 3), dtype=np.uint8)
+    full[:, :320] = (0, 0, 255)
+    full[:, 320:] = (255, 0, 0)
+    shrunk = cv2.resize(full, (160, 90), interpolation=cv2.INTER_AREA)
+    rotated_w, rotated_h = VideoProcessor.rotated_size(640, 360, angle)
+    # 회전된 원본 기준으로 파란 쪽만 남기는 크롭
+    crop = (400, 40, 200, 280) if angle == 0 else (40, 400, 280, 200)
+    app = types.SimpleNamespace(rotation_angle=angle, crop_rect=crop, preview_canvas_size=(320, 240))
+
+    expected = _render(app, full)
+    result = _render(app, shrunk, source_size=(640, 360))
+    assert result.shape == expected.shape
+    visible = result.sum(axis=2) > 0
+    # 크롭한 파란 영역만 보이고, 표시 영역 크기도 원본으로 렌더링한 것과 같음
+    assert result[visible][:, 2].min() > 200 and result[visible][:, 0].max() < 30
+    assert abs(int(visible.sum()) - int((expected.sum(axis=2) > 0).sum())) <= 0.05 * visible.size
+
+
+@pytest.mark.parametrize('view', [{'preview_one_to_one': True}, {'preview_zoom': 2.0, 'preview_center': (0.3, 0.6)}])
+def test_render_shrunk_frame_keeps_zoom_and_one_to_one_in_source_pixels(view):
+    # 가로 그라데이션 - 보이는 영역이 원본과 같은지 색으로 확인
+    full = np.zeros((360, 640, 3), dtype=np.uint8)
+    full[:, :, 1] = np.linspace(0, 255, 640, dtype=np.uint8)[None, :]
+    shrunk = cv2.resize(full, (160, 90), interpolation=cv2.INTER_AREA)
+    app = types.SimpleNamespace(rotation_angle=0, crop_rect=None, preview_canvas_size=(320, 240), **view)
+
+    expected = _render(app, full)
+    result = _render(app, shrunk, source_size=(640, 360))
+    assert (result.sum(axis=2) > 0).mean() == pytest.approx((expected.sum(axis=2) > 0).mean(), abs=0.03)
+    assert np.abs(result[:, :, 1].astype(int) - expected[:, :, 1].astype(int)).mean() < 8
@@ -0,0 +1,61 @@
+"""WaveformPyramid 피크 계산 테스트."""
+
+import numpy as np
+import pytest
+
+from videoEdit.processors.waveform import WaveformPyramid
+
+
+def _pyramid(mins, maxs, sample_rate=1000, base_block=10):
+    return WaveformPyramid.build(np.asarray(mins, dtype=np.int16), np.asarray(maxs, dtype=np.int16),
+                                 sample_rate, base_block)
+
+
+def test_build_merges_pairs_per_level():
+    pyramid = _pyramid([-1, -5, -2, -3, -4], [1, 5, 2, 3, 4])
+    sizes = [mins.size for mins, _maxs in pyramid.levels]
+    assert sizes == [5, 3, 2, 1]
+    assert pyramid.levels[1][0].tolist() == [-5, -3, -4]
+    assert pyramid.levels[-1][1].tolist() == [5]
+    # 버킷 5개 x 10샘플 / 1000Hz
+    assert pyramid.duration == pytest.approx(0.05)
+
+
+def test_peaks_at_full_resolution():
+    values = np.arange(1, 9, dtype=np.int16) * 1000
+    pyramid = _pyramid(-values, values)
+    mins, maxs = pyramid.peaks(0.0, 0.08, 8)
+    assert maxs.tolist() == pytest.approx((values / 32768.0).tolist())
+    assert mins.tolist() == pytest.approx((-values / 32768.0).tolist())
+
+
+def test_peaks_keep_extremes_when_reduced():
+    rng = np.random.default_rng(1)
+    maxs = rng.integers(0, 30000, 4096).astype(np.int16)
+    mins = (-maxs).astype(np.int16)
+    pyramid = _pyramid(mins, maxs)
+    duration = pyramid.duration
+
+    col_mins, col_maxs = pyramid.peaks(0.0, duration, 100)
+    assert col_mins.shape == col_maxs.shape == (100,)
+    assert col_maxs.max() == pytest.approx(maxs.max() / 32768.0)
+    assert col_mins.min() == pytest.approx(mins.min() / 32768.0)
+    assert np.all(col_mins <= col_maxs)
+
+
+def test_peaks_of_sub_range():
+    maxs = np.zeros(64, dtype=np.int16)
+    maxs[40] = 20000
+    pyramid = _pyramid(-maxs, maxs)
+    # 40번 버킷은 0.40~0.41초
+    _mins, inside = pyramid.peaks(0.32, 0.48, 16)
+    _mins, outside = pyramid.peaks(0.0, 0.32, 16)
+    assert inside.max() == pytest.approx(20000 / 32768.0)
+    assert outside.max() == 0.0
+
+
+def test_peaks_past_end_are_silent():
+    pyramid = _pyramid([-100] * 8, [100] * 8)
+    mins, maxs = pyramid.peaks(10.0, 11.0, 5)
+    assert mins.tolist() == [0.0] * 5
+    assert maxs.tolist() == [0.0] * 5